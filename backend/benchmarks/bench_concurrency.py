@@ -0,0 +1,65 @@
+"""
+Concurrency benchmark for the async request path
+Starts the stub apiserver and the backend, then drives 200 concurrent
+keep-alive clients at list and log endpoints and reports requests/sec and p99.
+
+    python -m benchmarks.bench_concurrency --latency-ms 50 --concurrency 200
+"""
+
+from benchmarks.loadgen import BackendProcess, run_load
+from benchmarks.stub_apiserver import StubApiServer, StubCluster
+import argparse
+import json
+import os
+import tempfile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Requests/sec and p99 at high concurrency")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Stub apiserver latency per call")
+    parser.add_argument("--pods", type=int, default=100)
+    parser.add_argument("--k8s-workers", type=int, default=64, help="KUBECHAOS_K8S_WORKERS for the backend")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    stub = StubApiServer(StubCluster(pods=args.pods), latency_ms=args.latency_ms)
+    stub.start()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kubeconfig = os.path.join(tmp, "kubeconfig")
+        stub.write_kubeconfig(kubeconfig)
+
+        backend = BackendProcess(kubeconfig, env={"KUBECHAOS_K8S_WORKERS": str(args.k8s_workers)})
+        backend.start()
+        try:
+            pod_name = stub.cluster.pods[0]["metadata"]["name"]
+            endpoints = {
+                "GET /health": "/health",
+                "GET /k8s/pods": "/k8s/pods?namespace=ecommerce",
+                "GET /k8s/pods/{name}/logs": f"/k8s/pods/{pod_name}/logs?namespace=ecommerce&tail_lines=500",
+            }
+
+            results = {
+                "config": vars(args),
+                "endpoints": {}
+            }
+            for label, path in endpoints.items():
+                stats = run_load("127.0.0.1", backend.port, path,
+                                 concurrency=args.concurrency, duration=args.duration)
+                results["endpoints"][label] = stats
+                print(f"{label:<28} {stats['requests_per_second']:>9.1f} req/s   "
+                      f"p50 {stats['p50_ms']:>8.2f} ms   p99 {stats['p99_ms']:>8.2f} ms   "
+                      f"errors {stats['errors']}")
+        finally:
+            backend.stop()
+            stub.stop()
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Endpoint benchmark suite
+Runs the backend against the stub apiserver for each combination of pod and
+experiment counts, measures throughput and latency percentiles for the main
+read and write endpoints, and writes the results as JSON. With --baseline,
+compares against an earlier results file and exits non-zero on regressions.
+
+    python -m benchmarks.bench_endpoints --pods 100,10000,50000 --experiments 0,500 --output results.json
+    python -m benchmarks.bench_endpoints --pods 100,10000,50000 --experiments 0,500 --baseline results.json
+"""
+
+from benchmarks.loadgen import BackendProcess, run_load
+from benchmarks.stub_apiserver import StubApiServer, StubCluster
+from typing import Dict, List, Any
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+
+SCENARIO_ID = "pod-kill-basic"
+
+# label -> (method, path, JSON body)
+ENDPOINTS = {
+    "GET /status": ("GET", "/status", None),
+    "GET /k8s/pods": ("GET", "/k8s/pods?namespace=ecommerce", None),
+    "GET /chaos/experiments": ("GET", "/chaos/experiments?namespace=ecommerce", None),
+    "POST /command": ("POST", "/command", {"command": "kubectl get pods", "namespace": "ecommerce"}),
+    "POST /scenarios/{id}/start": ("POST", f"/scenarios/{SCENARIO_ID}/start?namespace=ecommerce", None),
+}
+
+
+def parse_counts(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v.strip()]
+
+
+def version_info() -> Dict[str, Any]:
+    """Identify what was measured so results from different versions can be told apart"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count()
+    }
+
+
+def run_case(pods: int, experiments: int, endpoints: List[str], args) -> Dict[str, Any]:
+    """Start a stub with the given object counts and a fresh backend, then load each endpoint"""
+    stub = StubApiServer(StubCluster(pods=pods, experiments=experiments, replace_existing=True),
+                         latency_ms=args.latency_ms)
+    stub.start()
+
+    results: Dict[str, Any] = {"pods": pods, "experiments": experiments, "endpoints": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        kubeconfig = os.path.join(tmp, "kubeconfig")
+        stub.write_kubeconfig(kubeconfig)
+
+        backend = BackendProcess(kubeconfig, env={"KUBECHAOS_K8S_WORKERS": str(args.k8s_workers)})
+        backend.start()
+        try:
+            for label in endpoints:
+                method, path, body = ENDPOINTS[label]
+                stats = run_load("127.0.0.1", backend.port, path, method=method, body=body,
+                                 concurrency=args.concurrency, duration=args.duration, warmup=args.warmup)
+                results["endpoints"][label] = stats
+                print(f"pods={pods:<6} experiments={experiments:<4} {label:<28} "
+                      f"{stats['requests_per_second']:>9.1f} req/s   p50 {stats['p50_ms']:>8.2f} ms   "
+                      f"p99 {stats['p99_ms']:>8.2f} ms   errors {stats['errors']}")
+        finally:
+            backend.stop()
+            stub.stop()
+    return results
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Regressions against a baseline results file: throughput down or p99 up by
+    more than threshold (a fraction) for the same pods/experiments/endpoint
+    """
+    previous = {(run["pods"], run["experiments"]): run["endpoints"] for run in baseline.get("runs", [])}
+    regressions = []
+    for run in results["runs"]:
+        base_run = previous.get((run["pods"], run["experiments"]))
+        if not base_run:
+            continue
+        for label, stats in run["endpoints"].items():
+            base = base_run.get(label)
+            if not base:
+                continue
+            case = f"pods={run['pods']} experiments={run['experiments']} {label}"
+            if base["requests_per_second"] and \
+                    stats["requests_per_second"] < base["requests_per_second"] * (1 - threshold):
+                regressions.append(f"{case}: {base['requests_per_second']} -> "
+                                   f"{stats['requests_per_second']} req/s")
+            if base["p99_ms"] and stats["p99_ms"] > base["p99_ms"] * (1 + threshold):
+                regressions.append(f"{case}: p99 {base['p99_ms']} -> {stats['p99_ms']} ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput and latency of the main endpoints by cluster size")
+    parser.add_argument("--pods", type=parse_counts, default=[100, 1000, 10000],
+                        help="Comma-separated pod counts, e.g. 100,10000,50000")
+    parser.add_argument("--experiments", type=parse_counts, default=[0, 100],
+                        help="Comma-separated experiment counts, e.g. 0,100,500")
+    parser.add_argument("--endpoints", default=",".join(ENDPOINTS),
+                        help=f"Comma-separated subset of: {', '.join(ENDPOINTS)}")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds measured per endpoint")
+    parser.add_argument("--warmup", type=float, default=1.0, help="Seconds of unmeasured load per endpoint")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="Stub apiserver latency per call")
+    parser.add_argument("--k8s-workers", type=int, default=64, help="KUBECHAOS_K8S_WORKERS for the backend")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file")
+    parser.add_argument("--baseline", default=None, help="Compare against an earlier JSON results file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Relative change in req/s or p99 that counts as a regression")
+    args = parser.parse_args()
+
+    endpoints = [label.strip() for label in args.endpoints.split(",") if label.strip()]
+    unknown = [label for label in endpoints if label not in ENDPOINTS]
+    if unknown:
+        parser.error(f"unknown endpoints: {', '.join(unknown)}")
+
+    results: Dict[str, Any] = {
+        "version": version_info(),
+        "config": {**vars(args), "endpoints": endpoints},
+        "runs": []
+    }
+    for pods in args.pods:
+        for experiments in args.experiments:
+            results["runs"].append(run_case(pods, experiments, endpoints, args))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        base_commit = baseline.get("version", {}).get("commit")
+        if regressions:
+            print(f"\n{len(regressions)} regressions against {base_commit or args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions against {base_commit or args.baseline} (threshold {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
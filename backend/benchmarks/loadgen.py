@@ -0,0 +1,163 @@
+"""
+Load generation helpers for the backend benchmarks
+Closed-loop clients over keep-alive connections, plus helpers to run the
+backend against the stub apiserver. Standard library only.
+"""
+
+from typing import Dict, List, Optional, Any
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    """Throughput and latency percentiles (milliseconds) for one run"""
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "duration_seconds": round(elapsed, 3),
+        "requests_per_second": round(len(values) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p90_ms": round(percentile(values, 90) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2) if values else 0.0
+    }
+
+
+def run_load(host: str, port: int, path: str, method: str = "GET", body: Optional[Dict[str, Any]] = None,
+             concurrency: int = 200, duration: float = 10.0, warmup: float = 1.0,
+             timeout: float = 30.0) -> Dict[str, Any]:
+    """
+    Run `concurrency` closed-loop clients against one endpoint.
+
+    Each client keeps its own HTTP/1.1 connection open and sends the next
+    request as soon as the previous response has been read.
+    """
+    payload = json.dumps(body).encode() if body is not None else None
+    headers = {"Content-Type": "application/json"} if payload is not None else {}
+    start_barrier = threading.Barrier(concurrency + 1)
+    lock = threading.Lock()
+    latencies: List[float] = []
+    errors = [0]
+    measure_from = [0.0]
+    stop_at = [0.0]
+
+    def client():
+        conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        local_latencies = []
+        local_errors = 0
+        start_barrier.wait()
+        while True:
+            started = time.perf_counter()
+            if started >= stop_at[0]:
+                break
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                ok = response.status < 500
+            except (OSError, http.client.HTTPException):
+                ok = False
+                conn.close()
+                conn = http.client.HTTPConnection(host, port, timeout=timeout)
+            finished = time.perf_counter()
+            if started >= measure_from[0]:
+                if ok:
+                    local_latencies.append(finished - started)
+                else:
+                    local_errors += 1
+        conn.close()
+        with lock:
+            latencies.extend(local_latencies)
+            errors[0] += local_errors
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+
+    now = time.perf_counter()
+    measure_from[0] = now + warmup
+    stop_at[0] = now + warmup + duration
+    start_barrier.wait()
+    for thread in threads:
+        thread.join()
+
+    return summarize(latencies, errors[0], duration)
+
+
+def http_json(host: str, port: int, method: str, path: str, timeout: float = 5.0) -> Optional[Any]:
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request(method, path)
+        response = conn.getresponse()
+        return json.loads(response.read() or b"null")
+    except (OSError, ValueError, http.client.HTTPException):
+        return None
+    finally:
+        conn.close()
+
+
+class BackendProcess:
+    """Runs `uvicorn main:app` in a subprocess against a given kubeconfig"""
+
+    def __init__(self, kubeconfig: str, port: Optional[int] = None, env: Optional[Dict[str, str]] = None,
+                 workers: int = 1):
+        self.port = port or free_port()
+        self.kubeconfig = kubeconfig
+        self.env = env or {}
+        self.workers = workers
+        self.process: Optional[subprocess.Popen] = None
+
+    def start(self, wait_for_state: str = "real", timeout: float = 30.0):
+        env = {
+            **os.environ,
+            "KUBECONFIG": self.kubeconfig,
+            "KUBECHAOS_RECONNECT_INTERVAL": "5",
+            **self.env
+        }
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1",
+             "--port", str(self.port), "--workers", str(self.workers), "--log-level", "warning"],
+            cwd=BACKEND_DIR,
+            env=env
+        )
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            health = http_json("127.0.0.1", self.port, "GET", "/health", timeout=1.0)
+            if health and health.get("cluster_state") == wait_for_state:
+                return
+            if self.process.poll() is not None:
+                raise RuntimeError("backend exited during startup")
+            time.sleep(0.2)
+        self.stop()
+        raise RuntimeError(f"backend did not reach state {wait_for_state!r} within {timeout}s")
+
+    def stop(self):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
@@ -0,0 +1,475 @@
+"""
+Stub Kubernetes / Chaos Mesh apiserver for benchmarks
+Serves just enough of the core, apps and chaos-mesh.org APIs for the backend,
+with configurable latency and object counts. Standard library only.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Any
+from urllib.parse import urlparse, parse_qs
+import argparse
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+CHAOS_PLURALS = [
+    "podchaos", "networkchaos", "stresschaos", "iochaos", "timechaos",
+    "kernelchaos", "dnschaos", "httpchaos", "jvmchaos", "workflows", "workflownodes"
+]
+
+CREATED = "2024-01-01T00:00:00Z"
+
+
+def make_pod(name: str, namespace: str, app: str) -> Dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "labels": {"app": app},
+            "resourceVersion": "1",
+            "creationTimestamp": CREATED
+        },
+        "spec": {
+            "nodeName": "stub-node-0",
+            "containers": [{"name": app, "image": f"kubechaos/{app}:latest"}]
+        },
+        "status": {
+            "phase": "Running",
+            "podIP": "10.244.0.10",
+            "conditions": [{"type": "Ready", "status": "True"}],
+            "containerStatuses": [{
+                "name": app,
+                "image": f"kubechaos/{app}:latest",
+                "imageID": "",
+                "ready": True,
+                "restartCount": 0,
+                "state": {"running": {"startedAt": CREATED}}
+            }]
+        }
+    }
+
+
+def make_service(name: str, namespace: str) -> Dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": {"name": name, "namespace": namespace, "labels": {"app": name}, "resourceVersion": "1"},
+        "spec": {
+            "type": "ClusterIP",
+            "clusterIP": "10.96.0.10",
+            "selector": {"app": name},
+            "ports": [{"port": 80, "targetPort": 8080, "protocol": "TCP"}]
+        }
+    }
+
+
+def make_deployment(name: str, namespace: str, replicas: int) -> Dict[str, Any]:
+    return {
+        "apiVersion": "apps/v1",
+        "kind": "Deployment",
+        "metadata": {"name": name, "namespace": namespace, "labels": {"app": name}, "resourceVersion": "1"},
+        "spec": {
+            "replicas": replicas,
+            "selector": {"matchLabels": {"app": name}},
+            "template": {
+                "metadata": {"labels": {"app": name}},
+                "spec": {"containers": [{"name": name, "image": f"kubechaos/{name}:latest"}]}
+            }
+        },
+        "status": {"replicas": replicas, "readyReplicas": replicas, "availableReplicas": replicas}
+    }
+
+
+def make_experiment(name: str, namespace: str) -> Dict[str, Any]:
+    return {
+        "apiVersion": "chaos-mesh.org/v1alpha1",
+        "kind": "PodChaos",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "labels": {"app": "kubechaos-game"},
+            "creationTimestamp": CREATED
+        },
+        "spec": {"action": "pod-kill", "mode": "one", "selector": {"namespaces": [namespace]}},
+        "status": {"experiment": {"phase": "Running"}}
+    }
+
+
+def _get_path(obj: Dict[str, Any], path: str) -> Any:
+    for key in path.split("."):
+        obj = obj.get(key) if isinstance(obj, dict) else None
+    return obj
+
+
+def matches(obj: Dict[str, Any], label_selector: Optional[str], field_selector: Optional[str]) -> bool:
+    """Equality-based label and field selectors (=, == and !=)"""
+    labels = obj.get("metadata", {}).get("labels") or {}
+    checks = [(labels.get, label_selector), (lambda path: _get_path(obj, path), field_selector)]
+    for lookup, selector in checks:
+        for requirement in (selector or "").split(","):
+            if "!=" in requirement:
+                key, value = requirement.split("!=", 1)
+                if str(lookup(key.strip())) == value.strip():
+                    return False
+            elif "=" in requirement:
+                key, value = requirement.replace("==", "=").split("=", 1)
+                if str(lookup(key.strip())) != value.strip():
+                    return False
+    return True
+
+
+def merge_patch(target: Dict[str, Any], patch: Dict[str, Any]):
+    """Apply a JSON merge patch in place"""
+    for key, value in patch.items():
+        if value is None:
+            target.pop(key, None)
+        elif isinstance(value, dict) and isinstance(target.get(key), dict):
+            merge_patch(target[key], value)
+        else:
+            target[key] = value
+
+
+class StubCluster:
+    """In-memory objects served by the stub apiserver"""
+
+    APPS = ["payment-service", "product-catalog", "api-gateway", "cart-service", "frontend"]
+
+    def __init__(self, namespace: str = "ecommerce", pods: int = 100, experiments: int = 0,
+                 crds: Optional[List[str]] = None, replace_existing: bool = False):
+        self.namespace = namespace
+        # Let a create overwrite an object of the same name, so that repeated
+        # scenario starts measure the create path rather than 409 responses
+        self.replace_existing = replace_existing
+        self.lock = threading.Lock()
+        self.crds = set(crds if crds is not None else CHAOS_PLURALS)
+
+        self.pods = [make_pod(f"{self.APPS[i % len(self.APPS)]}-{i:05d}", namespace, self.APPS[i % len(self.APPS)])
+                     for i in range(pods)]
+        self.services = [make_service(app, namespace) for app in self.APPS]
+        self.deployments = [make_deployment(app, namespace, max(1, pods // len(self.APPS))) for app in self.APPS]
+        self.pods_by_name = {pod["metadata"]["name"]: pod for pod in self.pods}
+
+        # chaos objects keyed by (namespace, plural) -> {name: object}
+        self.chaos: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
+        for i in range(experiments):
+            self.chaos.setdefault((namespace, "podchaos"), {})[f"bench-{i:04d}"] = \
+                make_experiment(f"bench-{i:04d}", namespace)
+
+        # Pre-encode the large, static list responses once
+        self._encoded: Dict[str, bytes] = {
+            "pods": self._encode_list("PodList", self.pods),
+            "services": self._encode_list("ServiceList", self.services),
+            "deployments": self._encode_list("DeploymentList", self.deployments)
+        }
+
+    @staticmethod
+    def _encode_list(kind: str, items: List[Dict[str, Any]]) -> bytes:
+        return json.dumps({
+            "kind": kind,
+            "apiVersion": "v1",
+            "metadata": {"resourceVersion": "1"},
+            "items": items
+        }).encode()
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Routes a small subset of the Kubernetes REST API"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: "StubApiServer"
+
+    ROUTES = [
+        ("GET", re.compile(r"^/version/?$"), "version"),
+        ("GET", re.compile(r"^/api/v1/nodes$"), "nodes"),
+        ("GET", re.compile(r"^/api/v1/namespaces$"), "namespaces"),
+        ("GET", re.compile(r"^/api/v1/namespaces/(?P<ns>[^/]+)/pods$"), "pods"),
+        ("GET", re.compile(r"^/api/v1/namespaces/(?P<ns>[^/]+)/pods/(?P<name>[^/]+)$"), "pod"),
+        ("GET", re.compile(r"^/api/v1/namespaces/(?P<ns>[^/]+)/pods/(?P<name>[^/]+)/log$"), "pod_log"),
+        ("GET", re.compile(r"^/api/v1/namespaces/(?P<ns>[^/]+)/services$"), "services"),
+        ("GET", re.compile(r"^/apis/apps/v1/namespaces/(?P<ns>[^/]+)/deployments$"), "deployments"),
+        ("GET", re.compile(r"^/apis/chaos-mesh.org/v1alpha1/(?P<plural>[^/]+)$"), "chaos_cluster_list"),
+        ("GET", re.compile(r"^/apis/chaos-mesh.org/v1alpha1/namespaces/(?P<ns>[^/]+)/(?P<plural>[^/]+)$"), "chaos_list"),
+        ("POST", re.compile(r"^/apis/chaos-mesh.org/v1alpha1/namespaces/(?P<ns>[^/]+)/(?P<plural>[^/]+)$"), "chaos_create"),
+        ("GET", re.compile(r"^/apis/chaos-mesh.org/v1alpha1/namespaces/(?P<ns>[^/]+)/(?P<plural>[^/]+)/(?P<name>[^/]+)$"), "chaos_get"),
+        ("PATCH", re.compile(r"^/apis/chaos-mesh.org/v1alpha1/namespaces/(?P<ns>[^/]+)/(?P<plural>[^/]+)/(?P<name>[^/]+)$"), "chaos_patch"),
+        ("DELETE", re.compile(r"^/apis/chaos-mesh.org/v1alpha1/namespaces/(?P<ns>[^/]+)/(?P<plural>[^/]+)/(?P<name>[^/]+)$"), "chaos_delete"),
+    ]
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_PATCH(self):
+        self._dispatch("PATCH")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str):
+        url = urlparse(self.path)
+        self.query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        self.body = self.rfile.read(length) if length else b""
+
+        for route_method, pattern, handler in self.ROUTES:
+            match = pattern.match(url.path)
+            if match and route_method == method:
+                if self.server.latency:
+                    time.sleep(self.server.latency)
+                if self.query.get("watch") in ("true", "1"):
+                    return self._watch()
+                return getattr(self, f"handle_{handler}")(**match.groupdict())
+
+        self._status(404, "NotFound", f"{method} {url.path} not found")
+
+    # Responses
+    def _send(self, code: int, body: bytes, content_type: str = "application/json"):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _json(self, obj: Any, code: int = 200):
+        self._send(code, json.dumps(obj).encode())
+
+    def _status(self, code: int, reason: str, message: str):
+        self._json({
+            "kind": "Status", "apiVersion": "v1", "status": "Failure",
+            "reason": reason, "message": message, "code": code
+        }, code)
+
+    def _watch(self):
+        """Hold a watch open with no events until its timeout, then close it"""
+        timeout = min(float(self.query.get("timeoutSeconds", 30)), 30.0)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.flush()
+        time.sleep(timeout)
+        self.close_connection = True
+
+    # Core API
+    def handle_version(self):
+        self._json({
+            "major": "1", "minor": "29", "gitVersion": "v1.29.0-stub", "gitCommit": "stub",
+            "gitTreeState": "clean", "buildDate": CREATED, "goVersion": "go1.21",
+            "compiler": "gc", "platform": "linux/amd64"
+        })
+
+    def handle_nodes(self):
+        self._json({"kind": "NodeList", "apiVersion": "v1", "metadata": {}, "items": [
+            {"metadata": {"name": f"stub-node-{i}"}} for i in range(3)
+        ]})
+
+    def handle_namespaces(self):
+        names = ["default", "kube-system", self.server.cluster.namespace]
+        self._json({"kind": "NamespaceList", "apiVersion": "v1", "metadata": {}, "items": [
+            {"metadata": {"name": name}} for name in names
+        ]})
+
+    def _namespaced_list(self, ns: str, kind: str):
+        cluster = self.server.cluster
+        if ns != cluster.namespace:
+            return self._json({"kind": "List", "apiVersion": "v1", "metadata": {}, "items": []})
+
+        limit = int(self.query.get("limit") or 0)
+        label_selector = self.query.get("labelSelector")
+        field_selector = self.query.get("fieldSelector")
+        if not (limit or label_selector or field_selector):
+            return self._send(200, cluster._encoded[kind])
+
+        items = getattr(cluster, kind)
+        if label_selector or field_selector:
+            items = [item for item in items if matches(item, label_selector, field_selector)]
+        if not limit:
+            return self._json({"kind": "List", "apiVersion": "v1", "metadata": {"resourceVersion": "1"},
+                               "items": items})
+
+        # Continue tokens are plain offsets
+        offset = int(self.query.get("continue") or 0)
+        page = items[offset:offset + limit]
+        remaining = len(items) - offset - len(page)
+        metadata = {"resourceVersion": "1"}
+        if remaining > 0:
+            metadata["continue"] = str(offset + limit)
+            metadata["remainingItemCount"] = remaining
+        self._json({"kind": "List", "apiVersion": "v1", "metadata": metadata, "items": page})
+
+    def handle_pods(self, ns: str):
+        self._namespaced_list(ns, "pods")
+
+    def handle_services(self, ns: str):
+        self._namespaced_list(ns, "services")
+
+    def handle_deployments(self, ns: str):
+        self._namespaced_list(ns, "deployments")
+
+    def handle_pod(self, ns: str, name: str):
+        pod = self.server.cluster.pods_by_name.get(name)
+        if not pod or ns != self.server.cluster.namespace:
+            return self._status(404, "NotFound", f'pods "{name}" not found')
+        self._json(pod)
+
+    def handle_pod_log(self, ns: str, name: str):
+        if name not in self.server.cluster.pods_by_name:
+            return self._status(404, "NotFound", f'pods "{name}" not found')
+        lines = int(self.query.get("tailLines", 100))
+        body = "".join(f"{CREATED} INFO {name} handled request {i}\n" for i in range(lines)).encode()
+        self._send(200, body, "text/plain")
+
+    # Chaos Mesh API
+    def _check_crd(self, plural: str) -> bool:
+        if plural not in self.server.cluster.crds:
+            self._status(404, "NotFound", f"the server could not find the requested resource ({plural})")
+            return False
+        return True
+
+    def handle_chaos_cluster_list(self, plural: str):
+        if not self._check_crd(plural):
+            return
+        cluster = self.server.cluster
+        with cluster.lock:
+            items = [obj for (ns, p), objs in cluster.chaos.items() if p == plural for obj in objs.values()]
+        self._json({"apiVersion": "chaos-mesh.org/v1alpha1", "kind": "List", "metadata": {}, "items": items})
+
+    def handle_chaos_list(self, ns: str, plural: str):
+        if not self._check_crd(plural):
+            return
+        cluster = self.server.cluster
+        with cluster.lock:
+            items = list(cluster.chaos.get((ns, plural), {}).values())
+        self._json({"apiVersion": "chaos-mesh.org/v1alpha1", "kind": "List", "metadata": {}, "items": items})
+
+    def handle_chaos_create(self, ns: str, plural: str):
+        if not self._check_crd(plural):
+            return
+        obj = json.loads(self.body or b"{}")
+        name = obj.get("metadata", {}).get("name")
+        cluster = self.server.cluster
+        with cluster.lock:
+            objs = cluster.chaos.setdefault((ns, plural), {})
+            if name in objs and not cluster.replace_existing:
+                return self._status(409, "AlreadyExists", f'{plural} "{name}" already exists')
+            obj["metadata"].setdefault("creationTimestamp", CREATED)
+            obj["metadata"]["namespace"] = ns
+            obj.setdefault("status", {"experiment": {"phase": "Running"}})
+            objs[name] = obj
+        self._json(obj, 201)
+
+    def handle_chaos_get(self, ns: str, plural: str, name: str):
+        if not self._check_crd(plural):
+            return
+        cluster = self.server.cluster
+        with cluster.lock:
+            obj = cluster.chaos.get((ns, plural), {}).get(name)
+        if not obj:
+            return self._status(404, "NotFound", f'{plural} "{name}" not found')
+        self._json(obj)
+
+    def handle_chaos_patch(self, ns: str, plural: str, name: str):
+        if not self._check_crd(plural):
+            return
+        patch = json.loads(self.body or b"{}")
+        cluster = self.server.cluster
+        with cluster.lock:
+            obj = cluster.chaos.get((ns, plural), {}).get(name)
+            if obj:
+                merge_patch(obj, patch)
+        if not obj:
+            return self._status(404, "NotFound", f'{plural} "{name}" not found')
+        self._json(obj)
+
+    def handle_chaos_delete(self, ns: str, plural: str, name: str):
+        if not self._check_crd(plural):
+            return
+        cluster = self.server.cluster
+        with cluster.lock:
+            obj = cluster.chaos.get((ns, plural), {}).pop(name, None)
+        if not obj:
+            return self._status(404, "NotFound", f'{plural} "{name}" not found')
+        self._json({"kind": "Status", "apiVersion": "v1", "status": "Success"})
+
+
+class StubApiServer(ThreadingHTTPServer):
+    """Threaded stub apiserver; start() serves it from a background thread"""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, cluster: StubCluster, host: str = "127.0.0.1", port: int = 0, latency_ms: float = 0.0):
+        super().__init__((host, port), StubRequestHandler)
+        self.cluster = cluster
+        self.latency = latency_ms / 1000.0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="stub-apiserver", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def write_kubeconfig(self, path: str):
+        """Write a kubeconfig pointing at this stub"""
+        with open(path, "w") as f:
+            f.write(
+                "apiVersion: v1\n"
+                "kind: Config\n"
+                "clusters:\n"
+                f"- name: stub\n  cluster:\n    server: {self.url}\n"
+                "contexts:\n"
+                "- name: stub\n  context:\n    cluster: stub\n    user: stub\n"
+                "current-context: stub\n"
+                "users:\n"
+                "- name: stub\n  user:\n    token: stub\n"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub Kubernetes/Chaos Mesh apiserver")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--namespace", default="ecommerce")
+    parser.add_argument("--pods", type=int, default=100)
+    parser.add_argument("--experiments", type=int, default=0)
+    parser.add_argument("--kubeconfig", default=None, help="Write a kubeconfig for the stub to this path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = StubApiServer(
+        StubCluster(args.namespace, pods=args.pods, experiments=args.experiments),
+        host=args.host, port=args.port, latency_ms=args.latency_ms
+    )
+    if args.kubeconfig:
+        server.write_kubeconfig(os.path.abspath(args.kubeconfig))
+    logger.info(f"Stub apiserver listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -3,15 +3,34 @@ Chaos Mesh Client for KubeChaos Game
 Handles Chaos Mesh CRD operations and experiment management
 """
 
-from kubernetes import client
+from kubernetes import client, watch
 from kubernetes.client.rest import ApiException
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 import logging
+import re
+import threading
+import time
 import yaml
 from datetime import datetime
+from tracing import instrument_class, propagate
 
 logger = logging.getLogger(__name__)
 
+# The libyaml parser when PyYAML was built with it, otherwise the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# RFC 1123 subdomain, the rule for custom object names
+NAME_PATTERN = re.compile(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*$")
+
+
+class ExperimentList(list):
+    """Experiments from list_experiments; incomplete names the kinds that failed or timed out"""
+    
+    def __init__(self, experiments=(), incomplete=()):
+        super().__init__(experiments)
+        self.incomplete: List[str] = list(incomplete)
+
 
 class ChaosMeshClient:
     """Client for interacting with Chaos Mesh CRDs"""
@@ -30,17 +49,49 @@ class ChaosMeshClient:
         "KernelChaos": "kernelchaos",
         "DNSChaos": "dnschaos",
         "HTTPChaos": "httpchaos",
-        "JVMChaos": "jvmchaos"
+        "JVMChaos": "jvmchaos",
+        "Workflow": "workflows"
     }
     
-    def __init__(self, custom_objects_api: client.CustomObjectsApi):
+    # Every experiment the game creates carries this label
+    GAME_LABEL_SELECTOR = "app=kubechaos-game"
+    
+    # Workflows, their per-template nodes, and the label Chaos Mesh puts on both nodes and child chaos
+    WORKFLOW_PLURAL = "workflows"
+    WORKFLOW_NODE_PLURAL = "workflownodes"
+    WORKFLOW_LABEL = "chaos-mesh.org/workflow"
+    PAUSE_ANNOTATION = "experiment.chaos-mesh.org/pause"
+    
+    # Field manager for server-side apply
+    FIELD_MANAGER = "kubechaos"
+    
+    # Metadata the apiserver owns; dropped from applied manifests, e.g. ones saved with kubectl get -o yaml
+    SERVER_METADATA = ("resourceVersion", "uid", "creationTimestamp", "generation", "managedFields", "selfLink")
+    
+    def __init__(self, custom_objects_api: client.CustomObjectsApi, parallel_listing: bool = True,
+                 max_workers: int = 10, list_timeout: float = 5.0, absent_kind_ttl: float = 300.0):
         """
         Initialize Chaos Mesh client
         
         Args:
             custom_objects_api: Kubernetes CustomObjectsApi instance
+            parallel_listing: List all chaos kinds concurrently instead of one after another
+            max_workers: Size of each thread pool, the one for listings and the one for deletes and applies
+            list_timeout: Seconds to wait for each kind before reporting it incomplete
+            absent_kind_ttl: Seconds a kind whose CRD was not found is skipped before being tried again
         """
         self.api = custom_objects_api
+        self.parallel_listing = parallel_listing
+        self.max_workers = max_workers
+        self.list_timeout = list_timeout
+        self.absent_kind_ttl = absent_kind_ttl
+        
+        # Kinds whose CRD is not installed -> when that was found; skipped until absent_kind_ttl passes
+        self._absent_kinds: Dict[str, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Listings get their own pool, so queueing behind deletes and applies does not eat their deadline
+        self._list_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         logger.info("Chaos Mesh client initialized")
     
     def is_chaos_mesh_installed(self) -> bool:
@@ -63,7 +114,8 @@ class ChaosMeshClient:
             return False
     
     # Experiment Creation
-    def create_pod_chaos(self, name: str, namespace: str, config: Dict[str, Any]) -> Optional[Dict]:
+    def create_pod_chaos(self, name: str, namespace: str, config: Dict[str, Any],
+                         labels: Optional[Dict[str, str]] = None) -> Optional[Dict]:
         """
         Create a PodChaos experiment
         
@@ -71,6 +123,7 @@ class ChaosMeshClient:
             name: Experiment name
             namespace: Namespace to create experiment in
             config: Chaos configuration including action, selector, etc.
+            labels: Extra labels for the experiment, e.g. the scenario it belongs to
         
         Returns:
             Created experiment object or None on failure
@@ -97,7 +150,8 @@ class ChaosMeshClient:
                 "name": name,
                 "namespace": namespace,
                 "labels": {
-                    "app": "kubechaos-game"
+                    "app": "kubechaos-game",
+                    **(labels or {})
                 }
             },
             "spec": spec
@@ -105,7 +159,8 @@ class ChaosMeshClient:
         
         return self._create_chaos_experiment("podchaos", namespace, body)
     
-    def create_network_chaos(self, name: str, namespace: str, config: Dict[str, Any]) -> Optional[Dict]:
+    def create_network_chaos(self, name: str, namespace: str, config: Dict[str, Any],
+                             labels: Optional[Dict[str, str]] = None) -> Optional[Dict]:
         """Create a NetworkChaos experiment"""
         body = {
             "apiVersion": f"{self.CHAOS_MESH_GROUP}/{self.CHAOS_MESH_VERSION}",
@@ -114,7 +169,8 @@ class ChaosMeshClient:
                 "name": name,
                 "namespace": namespace,
                 "labels": {
-                    "app": "kubechaos-game"
+                    "app": "kubechaos-game",
+                    **(labels or {})
                 }
             },
             "spec": {
@@ -139,7 +195,8 @@ class ChaosMeshClient:
         
         return self._create_chaos_experiment("networkchaos", namespace, body)
     
-    def create_stress_chaos(self, name: str, namespace: str, config: Dict[str, Any]) -> Optional[Dict]:
+    def create_stress_chaos(self, name: str, namespace: str, config: Dict[str, Any],
+                            labels: Optional[Dict[str, str]] = None) -> Optional[Dict]:
         """Create a StressChaos experiment"""
         body = {
             "apiVersion": f"{self.CHAOS_MESH_GROUP}/{self.CHAOS_MESH_VERSION}",
@@ -148,7 +205,8 @@ class ChaosMeshClient:
                 "name": name,
                 "namespace": namespace,
                 "labels": {
-                    "app": "kubechaos-game"
+                    "app": "kubechaos-game",
+                    **(labels or {})
                 }
             },
             "spec": {
@@ -178,7 +236,8 @@ class ChaosMeshClient:
         
         return self._create_chaos_experiment("stresschaos", namespace, body)
     
-    def create_io_chaos(self, name: str, namespace: str, config: Dict[str, Any]) -> Optional[Dict]:
+    def create_io_chaos(self, name: str, namespace: str, config: Dict[str, Any],
+                        labels: Optional[Dict[str, str]] = None) -> Optional[Dict]:
         """Create an IOChaos experiment"""
         body = {
             "apiVersion": f"{self.CHAOS_MESH_GROUP}/{self.CHAOS_MESH_VERSION}",
@@ -187,7 +246,8 @@ class ChaosMeshClient:
                 "name": name,
                 "namespace": namespace,
                 "labels": {
-                    "app": "kubechaos-game"
+                    "app": "kubechaos-game",
+                    **(labels or {})
                 }
             },
             "spec": {
@@ -206,6 +266,75 @@ class ChaosMeshClient:
         
         return self._create_chaos_experiment("iochaos", namespace, body)
     
+    def create_workflow(self, name: str, namespace: str, config: Dict[str, Any],
+                        labels: Optional[Dict[str, str]] = None) -> Optional[Dict]:
+        """
+        Create a Workflow running several chaos templates serially or in parallel
+        
+        Args:
+            name: Workflow name
+            namespace: Namespace to create the workflow in
+            config: Scenario workflow config: templates, entry, duration and
+                optionally "mode" ("Serial" or "Parallel") for the entry template
+            labels: Extra labels for the workflow
+        """
+        body = {
+            "apiVersion": f"{self.CHAOS_MESH_GROUP}/{self.CHAOS_MESH_VERSION}",
+            "kind": "Workflow",
+            "metadata": {
+                "name": name,
+                "namespace": namespace,
+                "labels": {
+                    "app": "kubechaos-game",
+                    **(labels or {})
+                }
+            },
+            "spec": {
+                "entry": config.get("entry", "entry"),
+                "templates": self._workflow_templates(config)
+            }
+        }
+        
+        return self._create_chaos_experiment(self.WORKFLOW_PLURAL, namespace, body)
+    
+    def _workflow_templates(self, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Translate scenario templates to Workflow templates
+        
+        Scenario templates use "type" and a lowercase key for the chaos spec
+        ({"type": "PodChaos", "podchaos": {...}}); the CRD wants templateType and
+        a camelCase key ({"templateType": "PodChaos", "podChaos": {...}}). An
+        entry template running all the others is added unless config defines it.
+        """
+        entry = config.get("entry", "entry")
+        templates = []
+        for template in config.get("templates", []):
+            template_type = template.get("templateType") or template.get("type")
+            translated = {"name": template["name"], "templateType": template_type}
+            for key in ("deadline", "children", "task", "conditionalBranches"):
+                if key in template:
+                    translated[key] = template[key]
+            
+            if template_type in self.CHAOS_TYPES and template_type != "Workflow":
+                spec_key = self._workflow_spec_key(template_type)
+                translated[spec_key] = template.get(spec_key) or template.get(template_type.lower(), {})
+            templates.append(translated)
+        
+        if not any(t["name"] == entry for t in templates):
+            templates.insert(0, {
+                "name": entry,
+                "templateType": config.get("mode", "Serial"),
+                "deadline": config.get("duration", "300s"),
+                "children": [t["name"] for t in templates]
+            })
+        return templates
+    
+    @staticmethod
+    def _workflow_spec_key(chaos_type: str) -> str:
+        """Embedded chaos key in a Workflow template: PodChaos -> podChaos, IOChaos -> ioChaos"""
+        prefix = chaos_type[:-len("Chaos")]
+        return prefix.lower() + "Chaos" if prefix.isupper() else prefix[0].lower() + prefix[1:] + "Chaos"
+    
     def _create_chaos_experiment(self, plural: str, namespace: str, body: Dict) -> Optional[Dict]:
         """Generic method to create any chaos experiment"""
         try:
@@ -223,49 +352,116 @@ class ChaosMeshClient:
             return None
     
     # Experiment Management
-    def list_experiments(self, namespace: str = "default", chaos_type: Optional[str] = None) -> List[Dict]:
+    def list_experiments(self, namespace: str = "default", chaos_type: Optional[str] = None,
+                         parallel: Optional[bool] = None) -> ExperimentList:
         """
         List chaos experiments
         
         Args:
             namespace: Namespace to list experiments from
             chaos_type: Specific chaos type to list (e.g., "PodChaos"), or None for all
+            parallel: Override the client's parallel_listing setting
         
         Returns:
-            List of experiment objects
+            List of experiment objects; its incomplete attribute names the
+            kinds that could not be listed, which are missing from it
         """
-        experiments = []
+        types_to_list = [chaos_type] if chaos_type else self._present_kinds(self.CHAOS_TYPES)
+        types_to_list = [ctype for ctype in types_to_list if ctype in self.CHAOS_TYPES]
         
-        types_to_list = [chaos_type] if chaos_type else self.CHAOS_TYPES.keys()
+        if parallel is None:
+            parallel = self.parallel_listing
         
-        for ctype in types_to_list:
-            plural = self.CHAOS_TYPES.get(ctype)
-            if not plural:
-                continue
+        if not parallel or len(types_to_list) < 2:
+            results = {ctype: self._list_kind(ctype, namespace) for ctype in types_to_list}
+        else:
+            executor = self._get_list_executor()
+            futures = {executor.submit(propagate(self._list_kind), ctype, namespace): ctype
+                       for ctype in types_to_list}
+            # All kinds run concurrently, so one shared deadline is a per-kind timeout
+            done, not_done = wait(futures, timeout=self.list_timeout)
             
-            try:
-                result = self.api.list_namespaced_custom_object(
-                    group=self.CHAOS_MESH_GROUP,
-                    version=self.CHAOS_MESH_VERSION,
-                    namespace=namespace,
-                    plural=plural
-                )
-                
-                for item in result.get("items", []):
-                    experiments.append({
-                        "name": item["metadata"]["name"],
-                        "namespace": item["metadata"]["namespace"],
-                        "type": item["kind"],
-                        "status": self._extract_status(item),
-                        "created": item["metadata"].get("creationTimestamp"),
-                        "spec": item.get("spec", {})
-                    })
-                    
-            except ApiException as e:
-                logger.error(f"Failed to list {plural}: {e}")
+            for future in not_done:
+                future.cancel()
+                logger.warning(f"Listing {futures[future]} timed out after {self.list_timeout}s")
+            results = {futures[future]: future.result() for future in done}
         
+        # Merge in CHAOS_TYPES order so the response is stable
+        experiments = ExperimentList()
+        for ctype in types_to_list:
+            if results.get(ctype) is None:
+                experiments.incomplete.append(ctype)
+            else:
+                experiments.extend(results[ctype])
         return experiments
     
+    def _list_kind(self, chaos_type: str, namespace: str) -> Optional[List[Dict]]:
+        """List experiments of a single chaos kind; None if the listing failed"""
+        plural = self.CHAOS_TYPES[chaos_type]
+        
+        try:
+            result = self.api.list_namespaced_custom_object(
+                group=self.CHAOS_MESH_GROUP,
+                version=self.CHAOS_MESH_VERSION,
+                namespace=namespace,
+                plural=plural,
+                # A listing abandoned by list_experiments' deadline should not hold its thread much longer
+                _request_timeout=self.list_timeout
+            )
+            return [self._experiment_to_dict(item) for item in result.get("items", [])]
+            
+        except ApiException as e:
+            if e.status == 404:
+                logger.warning(f"{chaos_type} CRD not installed - skipping it for {self.absent_kind_ttl:g}s")
+                self._absent_kinds[chaos_type] = time.monotonic()
+                return []
+            logger.error(f"Failed to list {plural}: {e}")
+            return None
+        except Exception as e:
+            # Connection errors and _request_timeout expiring
+            logger.error(f"Failed to list {plural}: {e}")
+            return None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used for concurrent deletes and applies"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="chaos"
+                )
+            return self._executor
+    
+    def _get_list_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used for concurrent listing"""
+        with self._executor_lock:
+            if self._list_executor is None:
+                self._list_executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="chaos-list"
+                )
+            return self._list_executor
+    
+    def close(self):
+        """Shut down the thread pools; calls already running finish, later ones fail"""
+        with self._executor_lock:
+            executors = [self._executor, self._list_executor]
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+    
+    def _present_kinds(self, kinds) -> List[str]:
+        """kinds without those whose CRD was found missing less than absent_kind_ttl ago"""
+        now = time.monotonic()
+        for kind, found_at in list(self._absent_kinds.items()):
+            if now - found_at >= self.absent_kind_ttl:
+                self._absent_kinds.pop(kind, None)
+        return [kind for kind in kinds if kind not in self._absent_kinds]
+    
+    def reset_absent_kinds(self):
+        """Forget which CRDs were found missing, e.g. after installing Chaos Mesh"""
+        self._absent_kinds.clear()
+    
     def get_experiment(self, name: str, namespace: str, chaos_type: str) -> Optional[Dict]:
         """Get details of a specific chaos experiment"""
         plural = self.CHAOS_TYPES.get(chaos_type)
@@ -282,14 +478,7 @@ class ChaosMeshClient:
                 name=name
             )
             
-            return {
-                "name": result["metadata"]["name"],
-                "namespace": result["metadata"]["namespace"],
-                "type": result["kind"],
-                "status": self._extract_status(result),
-                "spec": result.get("spec", {}),
-                "created": result["metadata"].get("creationTimestamp")
-            }
+            return self._experiment_to_dict(result)
             
         except ApiException as e:
             logger.error(f"Failed to get {chaos_type} {name}: {e}")
@@ -321,6 +510,8 @@ class ChaosMeshClient:
         plural = self.CHAOS_TYPES.get(chaos_type)
         if not plural:
             return False
+        if chaos_type == "Workflow":
+            return self._set_workflow_paused(name, namespace, True)
         
         try:
             # Add annotation to pause
@@ -351,6 +542,8 @@ class ChaosMeshClient:
         plural = self.CHAOS_TYPES.get(chaos_type)
         if not plural:
             return False
+        if chaos_type == "Workflow":
+            return self._set_workflow_paused(name, namespace, False)
         
         try:
             # Remove pause annotation
@@ -376,9 +569,286 @@ class ChaosMeshClient:
             logger.error(f"Failed to resume {chaos_type} {name}: {e}")
             return False
     
+    # Workflows
+    def get_workflow_status(self, name: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """
+        Aggregate a workflow's status across its templates
+        
+        Reads the workflow and lists its nodes with one label-selected call,
+        however many templates the workflow has.
+        """
+        try:
+            workflow = self.api.get_namespaced_custom_object(
+                group=self.CHAOS_MESH_GROUP,
+                version=self.CHAOS_MESH_VERSION,
+                namespace=namespace,
+                plural=self.WORKFLOW_PLURAL,
+                name=name
+            )
+            nodes = self.api.list_namespaced_custom_object(
+                group=self.CHAOS_MESH_GROUP,
+                version=self.CHAOS_MESH_VERSION,
+                namespace=namespace,
+                plural=self.WORKFLOW_NODE_PLURAL,
+                label_selector=f"{self.WORKFLOW_LABEL}={name}"
+            ).get("items", [])
+        except ApiException as e:
+            logger.error(f"Failed to get workflow {name}: {e}")
+            return None
+        
+        return self._workflow_status(workflow, [
+            {
+                "name": node["spec"].get("templateName"),
+                "type": node["spec"].get("type"),
+                "phase": self._node_phase(node.get("status", {}).get("conditions", []))
+            }
+            for node in nodes
+        ])
+    
+    def _workflow_status(self, workflow: Dict, nodes: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the aggregated status from a workflow object and its nodes' phases"""
+        status = workflow.get("status", {})
+        templates = {t["name"]: t for t in workflow.get("spec", {}).get("templates", [])}
+        entry = workflow.get("spec", {}).get("entry")
+        reached = {node["name"] for node in nodes}
+        
+        # Templates the workflow has not reached yet have no node
+        nodes = nodes + [
+            {"name": t_name, "type": t.get("templateType"), "phase": "Pending"}
+            for t_name, t in templates.items() if t_name not in reached and t_name != entry
+        ]
+        chaos_nodes = [node for node in nodes if node["name"] != entry]
+        
+        return {
+            "name": workflow["metadata"]["name"],
+            "namespace": workflow["metadata"]["namespace"],
+            "type": "Workflow",
+            "status": self._workflow_phase(workflow, chaos_nodes),
+            "entry": entry,
+            "startTime": status.get("startTime"),
+            "endTime": status.get("endTime"),
+            "nodes": chaos_nodes,
+            "running": sum(1 for node in chaos_nodes if node["phase"] == "Running"),
+            "finished": sum(1 for node in chaos_nodes if node["phase"] == "Finished")
+        }
+    
+    def _workflow_phase(self, workflow: Dict, nodes: Optional[List[Dict[str, Any]]] = None) -> str:
+        """Finished, Paused, Running or Pending; nodes refine the phase when known"""
+        conditions = {c.get("type"): c.get("status") for c in workflow.get("status", {}).get("conditions", [])}
+        if conditions.get("Accomplished") == "True":
+            return "Finished"
+        if workflow["metadata"].get("annotations", {}).get(self.PAUSE_ANNOTATION) == "true":
+            return "Paused"
+        if nodes is not None and not any(node["phase"] != "Pending" for node in nodes):
+            return "Pending"
+        return "Running"
+    
+    @staticmethod
+    def _node_phase(conditions: List[Dict[str, Any]]) -> str:
+        """Phase of one workflow node from its conditions"""
+        active = {c.get("type") for c in conditions if c.get("status") == "True"}
+        if active & {"Accomplished", "DeadlineExceed"}:
+            return "Finished"
+        if active & {"ChaosInjected", "DeadlineNotExceed"}:
+            return "Running"
+        return "Pending"
+    
+    def _set_workflow_paused(self, name: str, namespace: str, paused: bool) -> bool:
+        """
+        Pause or resume a workflow
+        
+        Workflows have no pause of their own, so the annotation is set on the
+        workflow, which reports it as Paused and marks it for
+        enforce_workflow_pause, and then on the chaos objects the workflow has
+        created so far. Steps a paused workflow starts later, e.g. the next
+        step of a Serial template, are paused by enforce_workflow_pause. The
+        workflow's deadlines keep running while it is paused.
+        """
+        patch = {"metadata": {"annotations": {self.PAUSE_ANNOTATION: "true" if paused else None}}}
+        action = "pause" if paused else "resume"
+        
+        try:
+            # The marker goes on first, so a step created meanwhile is caught by enforce_workflow_pause
+            workflow = self.api.patch_namespaced_custom_object(
+                group=self.CHAOS_MESH_GROUP,
+                version=self.CHAOS_MESH_VERSION,
+                namespace=namespace,
+                plural=self.WORKFLOW_PLURAL,
+                name=name,
+                body=patch
+            )
+            self._set_workflow_children_paused(workflow, paused)
+            logger.info(f"{action.capitalize()}d workflow: {name}")
+            return True
+        except ApiException as e:
+            logger.error(f"Failed to {action} workflow {name}: {e}")
+            return False
+    
+    def enforce_workflow_pause(self, name: str, namespace: str) -> bool:
+        """
+        Pause the chaos objects a paused workflow created since it was paused
+        
+        Returns False once the workflow is gone or no longer paused, so the
+        caller knows to stop checking it.
+        """
+        try:
+            workflow = self.api.get_namespaced_custom_object(
+                group=self.CHAOS_MESH_GROUP,
+                version=self.CHAOS_MESH_VERSION,
+                namespace=namespace,
+                plural=self.WORKFLOW_PLURAL,
+                name=name
+            )
+        except ApiException as e:
+            if e.status == 404:
+                return False
+            raise
+        if workflow.get("metadata", {}).get("annotations", {}).get(self.PAUSE_ANNOTATION) != "true":
+            return False
+        
+        paused = self._set_workflow_children_paused(workflow, True)
+        if paused:
+            logger.info(f"Paused {len(paused)} new steps of paused workflow {name}: {', '.join(paused)}")
+        return True
+    
+    def _set_workflow_children_paused(self, workflow: Dict[str, Any], paused: bool) -> List[str]:
+        """Annotate the workflow's chaos objects (one list per chaos kind it uses); returns the names changed"""
+        name = workflow["metadata"]["name"]
+        namespace = workflow["metadata"]["namespace"]
+        patch = {"metadata": {"annotations": {self.PAUSE_ANNOTATION: "true" if paused else None}}}
+        kinds = {t.get("templateType") for t in workflow.get("spec", {}).get("templates", [])}
+        
+        changed = []
+        for kind in kinds & set(self.CHAOS_TYPES) - {"Workflow"}:
+            children = self.api.list_namespaced_custom_object(
+                group=self.CHAOS_MESH_GROUP,
+                version=self.CHAOS_MESH_VERSION,
+                namespace=namespace,
+                plural=self.CHAOS_TYPES[kind],
+                label_selector=f"{self.WORKFLOW_LABEL}={name}"
+            ).get("items", [])
+            for child in children:
+                annotations = child.get("metadata", {}).get("annotations") or {}
+                if (annotations.get(self.PAUSE_ANNOTATION) == "true") == paused:
+                    continue
+                self.api.patch_namespaced_custom_object(
+                    group=self.CHAOS_MESH_GROUP,
+                    version=self.CHAOS_MESH_VERSION,
+                    namespace=namespace,
+                    plural=self.CHAOS_TYPES[kind],
+                    name=child["metadata"]["name"],
+                    body=patch
+                )
+                changed.append(child["metadata"]["name"])
+        return changed
+    
+    # Bulk Teardown
+    def delete_experiments_by_label(self, namespace: str, label_selector: str = GAME_LABEL_SELECTOR,
+                                    chaos_types: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Delete every experiment matching label_selector, one collection delete per kind
+        
+        Kinds are deleted concurrently; a progress entry
+        {"type", "deleted": [names], "error"} is yielded as each kind completes.
+        """
+        kinds = self._present_kinds(chaos_types or self.CHAOS_TYPES)
+        executor = self._get_executor()
+        delete_kind = propagate(self._delete_kind)
+        futures = [executor.submit(delete_kind, kind, namespace, label_selector) for kind in kinds]
+        for future in as_completed(futures):
+            yield future.result()
+    
+    def _delete_kind(self, chaos_type: str, namespace: str, label_selector: str) -> Dict[str, Any]:
+        """Collection-delete one kind; a missing CRD counts as nothing to delete"""
+        try:
+            result = self.api.delete_collection_namespaced_custom_object(
+                group=self.CHAOS_MESH_GROUP,
+                version=self.CHAOS_MESH_VERSION,
+                namespace=namespace,
+                plural=self.CHAOS_TYPES[chaos_type],
+                label_selector=label_selector
+            )
+            names = [item["metadata"]["name"] for item in (result or {}).get("items", [])]
+            if names:
+                logger.info(f"Deleted {len(names)} {chaos_type} experiments in {namespace}")
+            return {"type": chaos_type, "deleted": names, "error": None}
+        except ApiException as e:
+            if e.status == 404:
+                self._absent_kinds[chaos_type] = time.monotonic()
+                return {"type": chaos_type, "deleted": [], "error": None}
+            logger.error(f"Failed to delete {chaos_type} experiments: {e}")
+            return {"type": chaos_type, "deleted": [], "error": e.reason}
+    
+    def wait_for_deletion(self, namespace: str, chaos_type: str, label_selector: str = GAME_LABEL_SELECTOR,
+                          timeout: float = 120.0) -> List[str]:
+        """
+        Block until no experiment of chaos_type matches label_selector,
+        i.e. Chaos Mesh has recovered the targets and removed its finalizers
+        
+        Returns the names still present when the timeout expired.
+        """
+        plural = self.CHAOS_TYPES[chaos_type]
+        deadline = time.monotonic() + timeout
+        remaining = set()
+        
+        while time.monotonic() < deadline:
+            listing = self.api.list_namespaced_custom_object(
+                group=self.CHAOS_MESH_GROUP,
+                version=self.CHAOS_MESH_VERSION,
+                namespace=namespace,
+                plural=plural,
+                label_selector=label_selector
+            )
+            remaining = {item["metadata"]["name"] for item in listing.get("items", [])}
+            if not remaining:
+                return []
+            
+            # Watch from the listing until the last one is gone; relist if the watch ends early
+            w = watch.Watch()
+            try:
+                for event in w.stream(
+                    self.api.list_namespaced_custom_object,
+                    group=self.CHAOS_MESH_GROUP,
+                    version=self.CHAOS_MESH_VERSION,
+                    namespace=namespace,
+                    plural=plural,
+                    label_selector=label_selector,
+                    resource_version=listing.get("metadata", {}).get("resourceVersion"),
+                    timeout_seconds=max(1, int(deadline - time.monotonic()))
+                ):
+                    if event["type"] == "ERROR":
+                        break
+                    if event["type"] == "DELETED":
+                        remaining.discard(event["object"]["metadata"]["name"])
+                        if not remaining:
+                            return []
+            except ApiException as e:
+                # 410 Gone: the listing's resourceVersion is too old, relist
+                if e.status != 410:
+                    raise
+            finally:
+                w.stop()
+        
+        return sorted(remaining)
+    
     # Helper Methods
+    def _experiment_to_dict(self, item: Dict) -> Dict:
+        """Convert a chaos CRD object to the API representation"""
+        return {
+            "name": item["metadata"]["name"],
+            "namespace": item["metadata"]["namespace"],
+            "type": item["kind"],
+            "status": self._extract_status(item),
+            "created": item["metadata"].get("creationTimestamp"),
+            "labels": item["metadata"].get("labels", {}),
+            "spec": item.get("spec", {})
+        }
+    
     def _extract_status(self, experiment: Dict) -> str:
         """Extract status from experiment object"""
+        if experiment.get("kind") == "Workflow":
+            return self._workflow_phase(experiment)
+        
         status = experiment.get("status", {})
         
         # Check for common status conditions
@@ -411,7 +881,146 @@ class ChaosMeshClient:
             logger.error(f"Failed to create experiment from YAML: {e}")
             return None
     
+    # Bulk Apply
+    def parse_manifests(self, yaml_content: str, namespace: str) -> Tuple[List[Dict], List[str]]:
+        """
+        Parse a multi-document YAML stream and validate every document
+        
+        Returns the manifests, moved to namespace and labelled as game
+        experiments (app=kubechaos-game, replacing any app label of their
+        own), and the validation errors. Nothing should be applied
+        unless the errors are empty.
+        """
+        try:
+            documents = list(yaml.load_all(yaml_content, Loader=YAML_LOADER))
+        except yaml.YAMLError as e:
+            return [], [f"Invalid YAML: {e}"]
+        
+        expected_api_version = f"{self.CHAOS_MESH_GROUP}/{self.CHAOS_MESH_VERSION}"
+        manifests, errors, seen = [], [], set()
+        for index, doc in enumerate(documents):
+            # Empty documents, e.g. a leading or trailing ---
+            if doc is None:
+                continue
+            where = f"document {index}"
+            if not isinstance(doc, dict):
+                errors.append(f"{where}: expected a mapping")
+                continue
+            
+            # Anything can come out of YAML; kind and name must be strings before
+            # they are used as dict keys or in the set of seen objects
+            kind = doc.get("kind")
+            metadata = doc.get("metadata") if isinstance(doc.get("metadata"), dict) else {}
+            name = metadata.get("name")
+            # An empty "labels:" key parses as None
+            labels = metadata.get("labels") or {}
+            if isinstance(kind, str) and isinstance(name, str):
+                where = f"document {index} ({kind}/{name})"
+            
+            doc_errors = []
+            if doc.get("apiVersion") != expected_api_version:
+                doc_errors.append(f"{where}: apiVersion must be {expected_api_version}")
+            if not isinstance(kind, str) or kind not in self.CHAOS_TYPES:
+                doc_errors.append(f"{where}: unsupported kind {kind!r}")
+            if not isinstance(name, str) or len(name) > 253 or not NAME_PATTERN.match(name):
+                doc_errors.append(f"{where}: metadata.name must be a lowercase RFC 1123 name")
+            if not isinstance(labels, dict) or not all(
+                    isinstance(k, str) and isinstance(v, str) for k, v in labels.items()):
+                doc_errors.append(f"{where}: metadata.labels must map strings to strings")
+            if not isinstance(doc.get("spec"), dict):
+                doc_errors.append(f"{where}: spec must be a mapping")
+            if not doc_errors:
+                if (kind, name) in seen:
+                    doc_errors.append(f"{where}: defined more than once")
+                seen.add((kind, name))
+            errors.extend(doc_errors)
+            if doc_errors:
+                continue
+            
+            manifests.append({
+                "apiVersion": expected_api_version,
+                "kind": kind,
+                "metadata": {
+                    **{k: v for k, v in metadata.items() if k not in self.SERVER_METADATA},
+                    "namespace": namespace,
+                    # The game label comes last: stop finds experiments by it
+                    "labels": {
+                        **labels,
+                        "app": "kubechaos-game"
+                    }
+                },
+                "spec": doc["spec"]
+            })
+        
+        if not manifests and not errors:
+            errors.append("No manifests found")
+        return manifests, errors
+    
+    def apply_manifests(self, yaml_content: str, namespace: str, dry_run: bool = False) -> Dict[str, Any]:
+        """
+        Create or update every chaos object in a multi-document YAML stream
+        
+        All documents are validated before anything is sent. They are then
+        server-side applied concurrently, one PATCH per object, so applying an
+        unchanged file again changes nothing. With dry_run the apiserver
+        validates and defaults the objects without persisting them.
+        
+        Returns:
+            {"applied": [per-object results], "errors": [validation errors],
+             "succeeded", "failed", "success"}
+        """
+        manifests, errors = self.parse_manifests(yaml_content, namespace)
+        if errors:
+            return {"applied": [], "errors": errors, "succeeded": 0, "failed": 0, "success": False}
+        
+        apply = propagate(self._apply_manifest)
+        futures = [self._get_executor().submit(apply, manifest, dry_run) for manifest in manifests]
+        results = [future.result() for future in futures]
+        failed = sum(1 for result in results if result["error"])
+        logger.info(f"Applied {len(results) - failed}/{len(results)} chaos manifests in {namespace}"
+                    f"{' (dry run)' if dry_run else ''}")
+        return {
+            "applied": results,
+            "errors": [],
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "success": failed == 0
+        }
+    
+    def _apply_manifest(self, manifest: Dict, dry_run: bool = False) -> Dict[str, Any]:
+        """Server-side apply one object; conflicting fields owned by other managers are taken over"""
+        kind = manifest["kind"]
+        metadata = manifest["metadata"]
+        result = {"kind": kind, "name": metadata["name"], "resource_version": None, "generation": None, "error": None}
+        try:
+            applied = self.api.patch_namespaced_custom_object(
+                group=self.CHAOS_MESH_GROUP,
+                version=self.CHAOS_MESH_VERSION,
+                namespace=metadata["namespace"],
+                plural=self.CHAOS_TYPES[kind],
+                name=metadata["name"],
+                body=manifest,
+                field_manager=self.FIELD_MANAGER,
+                force=True,
+                _content_type="application/apply-patch+yaml",
+                **({"dry_run": "All"} if dry_run else {})
+            )
+            result["resource_version"] = applied.get("metadata", {}).get("resourceVersion")
+            result["generation"] = applied.get("metadata", {}).get("generation")
+        except ApiException as e:
+            # Apply creates missing objects, so a 404 means the CRD or the namespace is missing
+            result["error"] = e.reason
+            logger.error(f"Failed to apply {kind} {metadata['name']}: {e}")
+        except Exception as e:
+            result["error"] = str(e)
+            logger.error(f"Failed to apply {kind} {metadata['name']}: {e}")
+        return result
+    
     def get_experiment_events(self, name: str, namespace: str) -> List[Dict]:
         """Get events related to a chaos experiment"""
         # This would require watching events - simplified for now
         return []
+
+
+# Per-item converters are called once per object and would only add noise
+instrument_class(ChaosMeshClient, exclude=("_experiment_to_dict", "_extract_status", "_workflow_spec_key", "_node_phase"))
@@ -8,15 +8,37 @@ import typer
 import requests
 import sys
 import os
-from rich.console import Console
+import json
+import shlex
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from requests.adapters import HTTPAdapter
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich import print as rprint
-from typing import Optional
+from typing import List, Optional
+
+try:
+    import readline
+except ImportError:  # Windows: the shell works without tab completion
+    readline = None
+
+try:
+    from websockets.sync.client import connect as ws_connect
+    from websockets.exceptions import WebSocketException
+except ImportError:  # websockets before 11 has no sync client: status --watch polls instead
+    ws_connect = None
+    WebSocketException = OSError
 
 # Configuration
 API_URL = os.getenv("KUBECHAOS_API_URL", "http://localhost:8000")
+REQUEST_TIMEOUT = float(os.getenv("KUBECHAOS_CLI_TIMEOUT", "30"))
+CACHE_DIR = os.getenv("KUBECHAOS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "kubechaos"))
 
 app = typer.Typer(
     name="kubechaos",
@@ -25,34 +47,103 @@ app = typer.Typer(
 )
 console = Console()
 
+_adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+_local = threading.local()
+_unreachable_reported = threading.Event()
+
+def get_session() -> requests.Session:
+    """
+    The calling thread's session. requests.Session is not thread-safe, so
+    every thread gets its own, but they all share one adapter and with it
+    one keep-alive connection pool for every call this invocation makes
+    """
+    session = getattr(_local, "session", None)
+    if session is None:
+        session = _local.session = requests.Session()
+        session.mount("http://", _adapter)
+        session.mount("https://", _adapter)
+    return session
+
 def check_api():
     """Check if API is reachable"""
     try:
-        response = requests.get(f"{API_URL}/health", timeout=2)
+        response = get_session().get(f"{API_URL}/health", timeout=2)
         return response.status_code == 200
     except requests.exceptions.RequestException:
         return False
 
+def api(method: str, path: str, **kwargs) -> requests.Response:
+    """
+    Call the API on the shared session. There is no health check up front:
+    only when a call fails is /health asked whether the backend is there at all
+    """
+    kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+    try:
+        return get_session().request(method, f"{API_URL}{path}", **kwargs)
+    except requests.exceptions.RequestException as e:
+        request_failed(e)
+
+def request_failed(error: requests.exceptions.RequestException):
+    if isinstance(error, requests.exceptions.ConnectionError) or not check_api():
+        # Parallel calls fail together; report once
+        if not _unreachable_reported.is_set():
+            _unreachable_reported.set()
+            rprint(f"[bold red]Error:[/bold red] Cannot connect to KubeChaos API at {API_URL}. Is the backend running?")
+        sys.exit(1)
+    raise error
+
+def fetch_all(*calls):
+    """Run independent calls (e.g. partial(api, "GET", path)) at the same time; results in call order"""
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(call) for call in calls]
+    return [f.result() for f in futures]
+
+def load_scenarios() -> List[dict]:
+    """
+    The scenario catalog, kept in CACHE_DIR between runs. The copy is
+    revalidated with If-None-Match, so an unchanged catalog costs a 304
+    """
+    path = os.path.join(CACHE_DIR, "scenarios.json")
+    cached = None
+    try:
+        with open(path) as f:
+            cached = json.load(f)
+        if cached.get("api_url") != API_URL:
+            cached = None
+    except (OSError, ValueError):
+        pass
+    
+    headers = {"If-None-Match": cached["etag"]} if cached else {}
+    response = api("GET", "/scenarios", headers=headers)
+    if response.status_code == 304 and cached:
+        return cached["scenarios"]
+    response.raise_for_status()
+    
+    scenarios = response.json()
+    etag = response.headers.get("ETag")
+    if etag:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(f"{path}.tmp", "w") as f:
+                json.dump({"api_url": API_URL, "etag": etag, "scenarios": scenarios}, f)
+            os.replace(f"{path}.tmp", path)
+        except OSError:
+            pass
+    return scenarios
+
 @app.command()
 def list(
     difficulty: Optional[str] = typer.Option(None, help="Filter by difficulty (beginner, intermediate, advanced, expert)"),
 ):
     """List available chaos scenarios"""
-    if not check_api():
-        rprint(f"[bold red]Error:[/bold red] Cannot connect to KubeChaos API at {API_URL}. Is the backend running?")
-        sys.exit(1)
-
     try:
-        if difficulty:
-            response = requests.get(f"{API_URL}/scenarios/difficulty/{difficulty}")
-        else:
-            response = requests.get(f"{API_URL}/scenarios")
-        
-        if response.status_code != 200:
-            rprint(f"[bold red]Error:[/bold red] Failed to fetch scenarios: {response.text}")
+        try:
+            scenarios = load_scenarios()
+        except requests.exceptions.HTTPError as e:
+            rprint(f"[bold red]Error:[/bold red] Failed to fetch scenarios: {e.response.text}")
             return
-
-        scenarios = response.json()
+        if difficulty:
+            scenarios = [s for s in scenarios if s["difficulty"] == difficulty]
         
         table = Table(title="KubeChaos Scenarios")
         table.add_column("ID", style="cyan", no_wrap=True)
@@ -79,22 +170,15 @@ def list(
 @app.command()
 def start(scenario_id: str):
     """Start a specific game scenario"""
-    if not check_api():
-        rprint(f"[bold red]Error:[/bold red] Cannot connect to KubeChaos API at {API_URL}. Is the backend running?")
-        sys.exit(1)
-
     try:
-        # First get scenario details
-        s_response = requests.get(f"{API_URL}/scenarios/{scenario_id}")
-        if s_response.status_code != 200:
+        # The start creates an experiment, so it is only sent for a scenario that exists;
+        # the catalog lookup is usually a 304 from the local cache
+        scenario = next((s for s in load_scenarios() if s["id"] == scenario_id), None)
+        if scenario is None:
             rprint(f"[bold red]Error:[/bold red] Scenario not found: {scenario_id}")
             return
         
-        scenario = s_response.json()
-        
-        # Start the scenario
-        response = requests.post(f"{API_URL}/scenarios/{scenario_id}/start")
-        
+        response = api("POST", f"/scenarios/{scenario_id}/start")
         if response.status_code == 200:
             rprint(Panel.fit(
                 f"[bold green]Scenario Started: {scenario['name']}[/bold green]\n\n"
@@ -119,80 +203,153 @@ def start(scenario_id: str):
     except Exception as e:
         rprint(f"[bold red]Error:[/bold red] {str(e)}")
 
+def render_status(state: dict, experiments: List[dict]) -> Group:
+    """Status panel, experiments and score as one renderable, printed once or redrawn by --watch"""
+    status_color = "green" if not experiments else "red"
+    status_text = "Normal" if not experiments else "CHAOS ACTIVE"
+    
+    grid = Table.grid(expand=True)
+    grid.add_column()
+    grid.add_column(justify="right")
+    grid.add_row(f"[bold]System Status:[/bold] [{status_color}]{status_text}[/{status_color}]", f"[dim]{state['currentTime']}[/dim]")
+    
+    lines = [Panel(grid, title="KubeChaos Status", border_style=status_color)]
+    if experiments:
+        lines.append("\n[bold red]Active Chaos Experiments:[/bold red]")
+        for exp in experiments:
+            lines.append(f"  • [bold]{exp['name']}[/bold] ({exp['type']})")
+    else:
+        lines.append("\n[green]No active chaos experiments. Cluster is stable.[/green]")
+        
+    lines.append(f"\n[bold]Score:[/bold] {state['score']['totalScore']}")
+    lines.append(f"[bold]Commands Used:[/bold] {state['score']['commandsUsed']}")
+    return Group(*lines)
+
+class ExperimentEvents:
+    """
+    Experiment change notifications from the backend's /ws event stream, so a
+    watch only refetches the experiment list when it changed. Without the
+    stream (websockets missing, or the connection refused or lost) every
+    wait reports a change and the caller falls back to polling
+    """
+    
+    def __init__(self, namespace: str = "ecommerce"):
+        self._ws = None
+        if ws_connect is None:
+            return
+        url = "ws" + API_URL[len("http"):] if API_URL.startswith("http") else API_URL
+        try:
+            self._ws = ws_connect(f"{url}/ws?namespace={namespace}", open_timeout=REQUEST_TIMEOUT)
+        except (OSError, WebSocketException):
+            pass
+    
+    def wait(self, timeout: float) -> bool:
+        """Wait up to timeout seconds; True as soon as the experiments may have changed"""
+        if self._ws is None:
+            time.sleep(timeout)
+            return True
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                message = json.loads(self._ws.recv(timeout=max(0.0, deadline - time.monotonic())))
+                # "dropped" means events were lost, so anything may have changed
+                if message.get("type") in ("experiment", "dropped"):
+                    return True
+        except TimeoutError:
+            return False
+        except (OSError, ValueError, WebSocketException):
+            self.close()
+            return True
+    
+    def close(self):
+        if self._ws is not None:
+            self._ws.close()
+            self._ws = None
+
+def watch_status(interval: float):
+    """
+    Redraw the status in place until Ctrl+C. /status is a conditional GET every
+    interval, so an unchanged game costs a 304 with no body. Experiments change
+    outside the game state (Chaos Mesh, kubectl), so they are refetched when
+    the event stream reports a change rather than on every tick
+    """
+    etag = None
+    state = None
+    experiments = None
+    events = ExperimentEvents()
+    experiments_changed = True
+    try:
+        with Live(console=console, auto_refresh=False, screen=False) as live:
+            while True:
+                headers = {"If-None-Match": etag} if etag else {}
+                response = api("GET", "/status?history=0", headers=headers)
+                changed = False
+                if response.status_code == 200:
+                    state = response.json()
+                    etag = response.headers.get("ETag")
+                    changed = True
+                
+                if experiments_changed:
+                    current = api("GET", "/chaos/experiments").json().get("experiments", [])
+                    if current != experiments:
+                        experiments = current
+                        changed = True
+                
+                if changed and state is not None:
+                    live.update(render_status(state, experiments), refresh=True)
+                experiments_changed = events.wait(interval)
+    finally:
+        events.close()
+
 @app.command()
-def status():
+def status(
+    watch: bool = typer.Option(False, "--watch", "-w", help="Keep redrawing the status as it changes"),
+    interval: float = typer.Option(2.0, "--interval", help="Seconds between checks with --watch")
+):
     """Show current game status"""
-    if not check_api():
-        rprint(f"[bold red]Error:[/bold red] Cannot connect to KubeChaos API at {API_URL}. Is the backend running?")
-        sys.exit(1)
-
     try:
-        # Get game state
-        response = requests.get(f"{API_URL}/status")
-        state = response.json()
+        if watch:
+            watch_status(interval)
+            return
         
-        # Get active experiments
-        exp_response = requests.get(f"{API_URL}/chaos/experiments")
+        # Game state and active experiments are fetched at the same time
+        response, exp_response = fetch_all(partial(api, "GET", "/status?history=0"),
+                                           partial(api, "GET", "/chaos/experiments"))
+        state = response.json()
         experiments = exp_response.json().get("experiments", [])
         
-        status_color = "green" if not experiments else "red"
-        status_text = "Normal" if not experiments else "CHAOS ACTIVE"
-        
-        grid = Table.grid(expand=True)
-        grid.add_column()
-        grid.add_column(justify="right")
-        grid.add_row(f"[bold]System Status:[/bold] [{status_color}]{status_text}[/{status_color}]", f"[dim]{state['currentTime']}[/dim]")
-        
-        console.print(Panel(grid, title="KubeChaos Status", border_style=status_color))
-        
-        if experiments:
-            rprint("\n[bold red]Active Chaos Experiments:[/bold red]")
-            for exp in experiments:
-                rprint(f"  • [bold]{exp['name']}[/bold] ({exp['type']})")
-        else:
-            rprint("\n[green]No active chaos experiments. Cluster is stable.[/green]")
-            
-        rprint(f"\n[bold]Score:[/bold] {state['score']['totalScore']}")
-        rprint(f"[bold]Commands Used:[/bold] {state['score']['commandsUsed']}")
+        console.print(render_status(state, experiments))
 
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         rprint(f"[bold red]Error:[/bold red] {str(e)}")
 
 @app.command()
 def hint():
     """Get a hint for the current scenario"""
-    # Note: In a real implementation, we'd need to track the current active scenario in the backend state.
-    # For now, we'll list hints for all active experiments or just generic advice if no scenario tracking.
-    
-    # This is a simplified implementation assuming the user knows which scenario they are running
-    # or we fetch the active scenario from the backend (which might need a backend update to track 'current_scenario')
-    
-    # For this MVP, we'll just show generic help or ask user to specify scenario if we can't detect it.
-    # However, let's try to be smart and look at active experiments.
-    
-    if not check_api():
-        rprint(f"[bold red]Error:[/bold red] Cannot connect to KubeChaos API at {API_URL}. Is the backend running?")
-        sys.exit(1)
-        
     try:
-        exp_response = requests.get(f"{API_URL}/chaos/experiments")
+        # The whole catalog is loaded alongside the experiments, so matching
+        # them up needs no further round trips
+        exp_response, catalog = fetch_all(partial(api, "GET", "/chaos/experiments"), load_scenarios)
         experiments = exp_response.json().get("experiments", [])
         
         if not experiments:
             rprint("[yellow]No active chaos experiments found. Start a scenario first![/yellow]")
             return
+        
+        scenarios = {s["id"]: s for s in catalog}
             
-        # Try to match experiment name to scenario
-        # Experiment names are formatted as "game-{scenario_id}"
+        # Match experiments to scenarios by their kubechaos.io/scenario label;
+        # older experiments are only named "game-{scenario_id}"
         for exp in experiments:
             name = exp['name']
-            if name.startswith("game-"):
+            scenario_id = exp.get('labels', {}).get('kubechaos.io/scenario')
+            if not scenario_id and name.startswith("game-"):
                 scenario_id = name.replace("game-", "")
-                
-                # Fetch scenario hints
-                s_response = requests.get(f"{API_URL}/scenarios/{scenario_id}")
-                if s_response.status_code == 200:
-                    scenario = s_response.json()
+            if scenario_id:
+                scenario = scenarios.get(scenario_id)
+                if scenario:
                     hints = scenario.get("hints", [])
                     
                     if hints:
@@ -211,35 +368,256 @@ def hint():
         rprint(f"[bold red]Error:[/bold red] {str(e)}")
 
 @app.command()
-def stop():
+def stop(
+    wait: bool = typer.Option(False, "--wait", help="Wait until Chaos Mesh has fully removed the experiments"),
+    namespace: str = typer.Option("ecommerce", "--namespace", "-n", help="Namespace to clean up")
+):
     """Stop all chaos experiments"""
-    if not check_api():
-        rprint(f"[bold red]Error:[/bold red] Cannot connect to KubeChaos API at {API_URL}. Is the backend running?")
-        sys.exit(1)
+    try:
+        # One server-side teardown: a collection delete per chaos kind, progress streamed back
+        response = api(
+            "DELETE", "/chaos/experiments",
+            params={"namespace": namespace, "wait": str(wait).lower()},
+            stream=True,
+            timeout=None
+        )
+        response.raise_for_status()
+
+        for line in response.iter_lines():
+            if not line:
+                continue
+            progress = json.loads(line)
+            event = progress.get("event")
 
+            if event == "deleted":
+                if progress.get("error"):
+                    rprint(f"[red]Failed to delete {progress['type']} experiments: {progress['error']}[/red]")
+                for name in progress.get("deleted", []):
+                    rprint(f"[green]Stopped experiment: {name}[/green]")
+            elif event == "finalized":
+                if progress.get("remaining"):
+                    rprint(f"[yellow]{progress['type']}: still finalizing {', '.join(progress['remaining'])}[/yellow]")
+                else:
+                    rprint(f"[green]{progress['type']}: all experiments removed[/green]")
+            elif event == "error":
+                rprint(f"[bold red]Error:[/bold red] {progress.get('error')}")
+            elif event == "done":
+                if not progress.get("deleted"):
+                    rprint("[green]No active experiments to stop.[/green]")
+                elif progress.get("remaining"):
+                    rprint("\n[bold yellow]Experiments deleted, but some are still being finalized.[/bold yellow]")
+                else:
+                    rprint("\n[bold green]All chaos experiments stopped. Cluster should recover shortly.[/bold green]")
+
+    except Exception as e:
+        rprint(f"[bold red]Error:[/bold red] {str(e)}")
+
+@app.command()
+def apply(
+    file: str,
+    namespace: str = typer.Option("ecommerce", "--namespace", "-n", help="Namespace to apply the experiments in"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Validate on the server without changing anything")
+):
+    """Create or update the chaos experiments in a (multi-document) YAML file"""
     try:
-        # We need to list experiments and delete them
-        exp_response = requests.get(f"{API_URL}/chaos/experiments")
-        experiments = exp_response.json().get("experiments", [])
+        with open(file, "rb") as f:
+            content = f.read()
         
-        if not experiments:
-            rprint("[green]No active experiments to stop.[/green]")
+        response = api(
+            "POST", "/chaos/apply",
+            params={"namespace": namespace, "dry_run": str(dry_run).lower()},
+            data=content,
+            headers={"Content-Type": "application/yaml"}
+        )
+        if response.status_code == 422:
+            rprint("[bold red]Invalid manifests, nothing was applied:[/bold red]")
+            for error in response.json().get("detail", []):
+                rprint(f"  • {error}")
             return
-            
-        for exp in experiments:
-            # Delete experiment
-            # We need to know the type
-            kind = exp['type']
-            name = exp['name']
-            namespace = exp['namespace']
-            
-            requests.delete(f"{API_URL}/chaos/experiments/{name}?namespace={namespace}&chaos_type={kind}")
-            rprint(f"[green]Stopped experiment: {name}[/green]")
-            
-        rprint("\n[bold green]All chaos experiments stopped. Cluster should recover shortly.[/bold green]")
-
+        response.raise_for_status()
+        
+        result = response.json()
+        for item in result["applied"]:
+            if item["error"]:
+                rprint(f"[red]{item['kind']}/{item['name']}: {item['error']}[/red]")
+            else:
+                rprint(f"[green]{item['kind']}/{item['name']} applied{' (dry run)' if dry_run else ''}[/green]")
+        rprint(f"\n[bold]{result['succeeded']} applied, {result['failed']} failed[/bold]")
+    
+    except OSError as e:
+        rprint(f"[bold red]Error:[/bold red] Cannot read {file}: {e}")
     except Exception as e:
         rprint(f"[bold red]Error:[/bold red] {str(e)}")
 
+# Interactive shell
+SHELL_HELP = """[bold]Commands:[/bold]
+  list [DIFFICULTY]        List scenarios (from the local catalog cache)
+  start SCENARIO_ID        Start a scenario
+  status                   Show current game status
+  hint                     Hints for the running scenario
+  stop [--wait]            Stop chaos experiments in the current namespace
+  ns [NAMESPACE]           Show or switch the namespace for kubectl commands
+  kubectl ...              Run a kubectl command (the kubectl prefix is optional)
+  help                     This help; 'kubectl help' lists the kubectl subset
+  exit                     Leave the shell (Ctrl+D works too)"""
+
+SHELL_COMMANDS = ["list", "start", "status", "hint", "stop", "ns", "kubectl", "help", "exit"]
+KUBECTL_VERBS = ["get", "describe", "logs", "top", "rollout"]
+KUBECTL_KINDS = ["pods", "services", "deployments", "nodes"]
+KUBECTL_FLAGS = ["-n", "--namespace", "-A", "--all-namespaces", "-l", "--selector",
+                 "--field-selector", "-o", "--output", "-c", "--container", "--tail"]
+DIFFICULTIES = ["beginner", "intermediate", "advanced", "expert"]
+
+class ShellCompleter:
+    """
+    readline completion for shell commands, kubectl verbs and flags, and pod,
+    deployment and scenario names. Names come from a cache refreshed in the
+    background after each command, so pressing Tab never waits on the API
+    """
+    
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.names = {"pods": [], "deployments": [], "scenarios": []}
+        self._refresh_lock = threading.Lock()
+    
+    def refresh(self):
+        """Refetch names in a background thread; skipped while a refresh is running"""
+        if self._refresh_lock.acquire(blocking=False):
+            threading.Thread(target=self._refresh, daemon=True).start()
+    
+    def _refresh(self):
+        try:
+            namespace = self.namespace
+            params = {"namespace": namespace}
+            # A thread of its own, so this is not the session the shell's commands use
+            session = get_session()
+            pods = session.get(f"{API_URL}/k8s/pods", params=params, timeout=REQUEST_TIMEOUT).json()
+            deployments = session.get(f"{API_URL}/k8s/deployments", params=params, timeout=REQUEST_TIMEOUT).json()
+            self.names["pods"] = [p["name"] for p in pods.get("pods", [])]
+            self.names["deployments"] = [d["name"] for d in deployments.get("deployments", [])]
+        except (requests.exceptions.RequestException, ValueError, AttributeError):
+            pass
+        finally:
+            self._refresh_lock.release()
+    
+    def candidates(self, words: List[str]) -> List[str]:
+        """Completions for the last word, given the words before it"""
+        if len(words) == 1:
+            return SHELL_COMMANDS + KUBECTL_VERBS
+        first, current = words[0], words[-1]
+        if first == "start":
+            return self.names["scenarios"]
+        if first == "list":
+            return DIFFICULTIES
+        if first == "stop":
+            return ["--wait"]
+        
+        args = words[1:] if first == "kubectl" else words
+        if current.startswith("-"):
+            return KUBECTL_FLAGS
+        if len(args) == 1:
+            return KUBECTL_VERBS
+        verb = args[0]
+        if verb == "logs":
+            return self.names["pods"]
+        if verb == "rollout":
+            return ["status", "restart"] if len(args) == 2 else [f"deployment/{n}" for n in self.names["deployments"]]
+        if verb in ("get", "describe", "top"):
+            if len(args) == 2:
+                return KUBECTL_KINDS + [f"pod/{n}" for n in self.names["pods"]] + \
+                    [f"deployment/{n}" for n in self.names["deployments"]]
+            kind = args[1].rstrip("s")
+            if kind in ("pod", "po"):
+                return self.names["pods"]
+            if kind in ("deployment", "deploy"):
+                return self.names["deployments"]
+        return []
+    
+    def complete(self, text: str, state: int) -> Optional[str]:
+        line = readline.get_line_buffer()[:readline.get_endidx()]
+        words = line.split()
+        if not words or line.endswith(" "):
+            words.append("")
+        matches = [c for c in self.candidates(words) if c.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+def run_shell_command(line: str, completer: ShellCompleter):
+    words = shlex.split(line)
+    command, args = words[0], words[1:]
+    
+    if command == "help":
+        rprint(SHELL_HELP)
+    elif command == "list":
+        list(difficulty=args[0] if args else None)
+    elif command == "start":
+        if not args:
+            rprint("[yellow]Usage: start SCENARIO_ID[/yellow]")
+            return
+        start(args[0])
+    elif command == "status":
+        status(watch=False, interval=2.0)
+    elif command == "hint":
+        hint()
+    elif command == "stop":
+        stop(wait="--wait" in args, namespace=completer.namespace)
+    elif command == "ns":
+        if args:
+            completer.namespace = args[0]
+        rprint(f"Namespace: [cyan]{completer.namespace}[/cyan]")
+    else:
+        # kubectl commands run on the backend, like the web terminal's
+        if command != "kubectl":
+            line = f"kubectl {line}"
+        if line.split() == ["kubectl", "help"]:
+            line = "help"
+        result = api("POST", "/command", json={"command": line, "namespace": completer.namespace}).json()
+        if result.get("success"):
+            console.print(result.get("output", ""), markup=False, highlight=False)
+        else:
+            rprint(f"[red]{result.get('error') or result.get('output', 'Unknown error')}[/red]")
+
+@app.command()
+def shell(
+    namespace: str = typer.Option("ecommerce", "--namespace", "-n", help="Namespace for kubectl commands")
+):
+    """Interactive shell: one process and connection pool for a whole scenario"""
+    completer = ShellCompleter(namespace)
+    try:
+        completer.names["scenarios"] = [s["id"] for s in load_scenarios()]
+    except requests.exceptions.RequestException as e:
+        rprint(f"[bold red]Error:[/bold red] Failed to fetch scenarios: {e}")
+    completer.refresh()
+    
+    if readline is not None:
+        readline.set_completer(completer.complete)
+        readline.set_completer_delims(" \t")
+        readline.parse_and_bind("tab: complete")
+    
+    rprint("[bold]KubeChaos shell[/bold] - type [cyan]help[/cyan] for commands, Tab to complete")
+    while True:
+        try:
+            line = input(f"kubechaos ({completer.namespace})> ").strip()
+        except EOFError:
+            print()
+            break
+        except KeyboardInterrupt:
+            print()
+            continue
+        if not line:
+            continue
+        if line in ("exit", "quit"):
+            break
+        
+        try:
+            run_shell_command(line, completer)
+        except SystemExit:
+            # The API went away; stay in the shell so the next command can retry
+            _unreachable_reported.clear()
+        except KeyboardInterrupt:
+            print()
+        except Exception as e:
+            rprint(f"[bold red]Error:[/bold red] {str(e)}")
+        completer.refresh()
+
 if __name__ == "__main__":
     app()
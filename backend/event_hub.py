@@ -0,0 +1,135 @@
+"""
+Event Hub for KubeChaos
+Fans game events out to WebSocket subscribers from a single upstream
+"""
+
+from typing import Callable, Dict, Optional, Any
+from datetime import datetime
+import asyncio
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class Subscriber:
+    """A connected client with a bounded event queue"""
+
+    def __init__(self, namespace: str, queue_size: int, session: Optional[str] = None):
+        self.namespace = namespace
+        self.session = session
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.reported_dropped = 0
+
+    def take_drop_notice(self) -> Optional[Dict[str, Any]]:
+        """Return a notice for events dropped since the last one, if any"""
+        if self.dropped == self.reported_dropped:
+            return None
+        count = self.dropped - self.reported_dropped
+        self.reported_dropped = self.dropped
+        return {
+            "type": "dropped",
+            "namespace": self.namespace,
+            "timestamp": datetime.now().isoformat(),
+            "data": {"count": count, "total": self.dropped}
+        }
+
+
+class EventHub:
+    """
+    Thread-safe publish, asyncio-side delivery.
+
+    Publishers (watch threads, request handlers) call publish() from any
+    thread. Each subscriber has a bounded queue; when a slow consumer's queue
+    is full the oldest event is dropped and the client is told how many it
+    missed so it can resync from /status.
+
+    on_first_subscriber / on_last_unsubscribe let the owner start and stop
+    the upstream for a namespace, so upstream cost does not depend on the
+    number of connected clients.
+
+    Session-scoped events (a player's terminal output and score) only go
+    to subscribers of that session.
+    """
+
+    def __init__(self, queue_size: int = 256):
+        self.queue_size = queue_size
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._subscribers: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self.on_first_subscriber: Optional[Callable[[str], None]] = None
+        self.on_last_unsubscribe: Optional[Callable[[str], None]] = None
+        self.published_total = 0
+        self.dropped_total = 0
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        """Set the event loop that owns the subscriber queues"""
+        self._loop = loop
+
+    def subscribe(self, namespace: str, session: Optional[str] = None) -> Subscriber:
+        """Register a subscriber; must be called on the bound loop"""
+        subscriber = Subscriber(namespace, self.queue_size, session)
+        with self._lock:
+            subscribers = self._subscribers.setdefault(namespace, set())
+            first = not subscribers
+            subscribers.add(subscriber)
+        if first and self.on_first_subscriber:
+            self.on_first_subscriber(namespace)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        with self._lock:
+            subscribers = self._subscribers.get(subscriber.namespace, set())
+            subscribers.discard(subscriber)
+            last = not subscribers
+            if last:
+                self._subscribers.pop(subscriber.namespace, None)
+        if last and self.on_last_unsubscribe:
+            self.on_last_unsubscribe(subscriber.namespace)
+
+    def subscriber_count(self, namespace: Optional[str] = None) -> int:
+        with self._lock:
+            if namespace is not None:
+                return len(self._subscribers.get(namespace, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+    def publish(self, event_type: str, data: Dict[str, Any], namespace: Optional[str] = None,
+                session: Optional[str] = None):
+        """
+        Queue an event for subscribers of namespace, or for everyone if None.
+        With a session, only that session's subscribers receive it.
+
+        Safe to call from any thread; a no-op while nobody is connected.
+        """
+        if self._loop is None or not self._subscribers:
+            return
+
+        event = {
+            "type": event_type,
+            "namespace": namespace,
+            "timestamp": datetime.now().isoformat(),
+            "data": data
+        }
+        self.published_total += 1
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, event, namespace, session)
+        except RuntimeError:
+            # Loop closed during shutdown
+            pass
+
+    def _deliver(self, event: Dict[str, Any], namespace: Optional[str], session: Optional[str]):
+        with self._lock:
+            if namespace is None:
+                targets = [s for subs in self._subscribers.values() for s in subs]
+            else:
+                targets = list(self._subscribers.get(namespace, ()))
+        if session is not None:
+            targets = [s for s in targets if s.session == session]
+
+        for subscriber in targets:
+            if subscriber.queue.full():
+                subscriber.queue.get_nowait()
+                subscriber.dropped += 1
+                self.dropped_total += 1
+            subscriber.queue.put_nowait(event)
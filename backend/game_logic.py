@@ -5,147 +5,681 @@ Integrates with Kubernetes and Chaos Mesh for real chaos engineering
 
 from models import *
 from k8s_client import KubernetesClient
-from chaos_mesh_client import ChaosMeshClient
+from chaos_mesh_client import ChaosMeshClient, ExperimentList
+from sessions import SessionStore, GameSession, UnknownSession
+from metrics import REGISTRY
+from tracing import instrument_class, propagate, tracer
+from event_hub import EventHub
+from kubectl import HELP as KUBECTL_HELP
+from simulated_cluster import SimulatedCluster, SimulatedKubernetesClient, SimulatedChaosMeshClient
+from scenario_packs import ScenarioPackLoader
 from game_scenarios import *
 from kubernetes import client
-from typing import Dict, List, Optional, Any
+from kubernetes.client.rest import ApiException
+from typing import Callable, Dict, Iterator, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
 import os
+import secrets
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Serve pod/service/deployment lists from watch-backed informer caches
+USE_INFORMER_CACHE = os.getenv("KUBECHAOS_INFORMER_CACHE", "false").lower() in ("1", "true", "yes")
+
+# Informers are only started for these namespaces (comma-separated, unset for any), at most
+# MAX_INFORMERS of them, and stopped after INFORMER_IDLE_TIMEOUT seconds without reads
+INFORMER_NAMESPACES = [ns.strip() for ns in os.getenv("KUBECHAOS_INFORMER_NAMESPACES", "").split(",")
+                       if ns.strip()] or None
+MAX_INFORMERS = int(os.getenv("KUBECHAOS_MAX_INFORMERS", "30"))
+INFORMER_IDLE_TIMEOUT = float(os.getenv("KUBECHAOS_INFORMER_IDLE_TIMEOUT", "600"))
+
+# Namespaces the game plays in (comma-separated, plus INFORMER_NAMESPACES); /ws only streams these
+GAME_NAMESPACES = {ns.strip() for ns in os.getenv("KUBECHAOS_GAME_NAMESPACES", "ecommerce").split(",")
+                   if ns.strip()} | set(INFORMER_NAMESPACES or [])
+
+# Seconds between cluster health checks / reconnect attempts
+RECONNECT_INTERVAL = float(os.getenv("KUBECHAOS_RECONNECT_INTERVAL", "30"))
+
+# Worker threads (and pooled apiserver connections) for blocking Kubernetes calls
+KUBERNETES_WORKERS = int(os.getenv("KUBECHAOS_K8S_WORKERS", "64"))
+
+# Concurrent streaming log requests (each holds a thread while it follows a pod)
+MAX_LOG_STREAMS = int(os.getenv("KUBECHAOS_MAX_LOG_STREAMS", "32"))
+
+# Per-session terminal history ring buffer limits, and how many entries /status includes
+HISTORY_MAX_ENTRIES = int(os.getenv("KUBECHAOS_HISTORY_MAX_ENTRIES", "1000"))
+HISTORY_MAX_BYTES = int(os.getenv("KUBECHAOS_HISTORY_MAX_BYTES", str(1024 * 1024)))
+STATUS_HISTORY_ENTRIES = int(os.getenv("KUBECHAOS_STATUS_HISTORY_ENTRIES", "50"))
+
+# WebSocket event stream: experiment status poll interval and per-client queue size
+EVENT_POLL_INTERVAL = float(os.getenv("KUBECHAOS_EVENT_POLL_INTERVAL", "2"))
+EVENT_QUEUE_SIZE = int(os.getenv("KUBECHAOS_EVENT_QUEUE_SIZE", "256"))
+
+# Seconds between checks that pause the steps a paused workflow has started since
+WORKFLOW_PAUSE_INTERVAL = float(os.getenv("KUBECHAOS_WORKFLOW_PAUSE_INTERVAL", "2"))
+
+# Seconds a cluster status snapshot is served before it is refreshed
+CLUSTER_STATUS_TTL = float(os.getenv("KUBECHAOS_CLUSTER_STATUS_TTL", "10"))
+
+# Simulated cluster used when no real cluster is available: RNG seed and clock speed
+SIMULATION_SEED = int(os.getenv("KUBECHAOS_SIM_SEED", "0"))
+SIMULATION_SPEED = float(os.getenv("KUBECHAOS_SIM_SPEED", "1"))
+
+# Concurrent experiment creates/deletes for batch scenario launches
+BATCH_WORKERS = int(os.getenv("KUBECHAOS_BATCH_WORKERS", "16"))
+
+# Largest YAML body /chaos/apply accepts
+MAX_APPLY_BYTES = int(os.getenv("KUBECHAOS_MAX_APPLY_BYTES", str(1024 * 1024)))
+
+# Labels that tie game experiments to their scenario and launch batch
+SCENARIO_LABEL = "kubechaos.io/scenario"
+BATCH_LABEL = "kubechaos.io/batch"
+
+# Player sessions: seconds idle before a session is dropped, and the memory all sessions may use
+SESSION_IDLE_TIMEOUT = float(os.getenv("KUBECHAOS_SESSION_IDLE_TIMEOUT", "3600"))
+SESSION_MEMORY_BUDGET = int(os.getenv("KUBECHAOS_SESSION_MEMORY_BUDGET", str(64 * 1024 * 1024)))
+
+# Scenario packs: directory of YAML scenario files (unset for built-ins only), seconds
+# between checks for changed files (0 to load once) and where validation results are cached
+SCENARIO_DIR = os.getenv("KUBECHAOS_SCENARIO_DIR") or None
+SCENARIO_RELOAD_INTERVAL = float(os.getenv("KUBECHAOS_SCENARIO_RELOAD_INTERVAL", "5"))
+SCENARIO_CACHE_FILE = os.getenv("KUBECHAOS_SCENARIO_CACHE_FILE") or None
+
+# Request tracing: trace a sampled share of all requests, whether single requests may
+# ask for a trace, output format (collapsed or otel), the file traces are appended to,
+# and its size before it is rotated (0 for no limit) keeping TRACE_FILE_BACKUPS old files
+TRACE_ALL = os.getenv("KUBECHAOS_TRACE", "false").lower() in ("1", "true", "yes")
+TRACE_SAMPLE_RATE = float(os.getenv("KUBECHAOS_TRACE_SAMPLE_RATE", "1"))
+TRACE_ON_REQUEST = os.getenv("KUBECHAOS_TRACE_ON_REQUEST", "false").lower() in ("1", "true", "yes")
+TRACE_FORMAT = os.getenv("KUBECHAOS_TRACE_FORMAT", "collapsed")
+TRACE_FILE = os.getenv("KUBECHAOS_TRACE_FILE") or None
+TRACE_FILE_MAX_BYTES = int(os.getenv("KUBECHAOS_TRACE_FILE_MAX_BYTES", str(50 * 1024 * 1024)))
+TRACE_FILE_BACKUPS = int(os.getenv("KUBECHAOS_TRACE_FILE_BACKUPS", "3"))
+tracer.configure(TRACE_ALL, TRACE_SAMPLE_RATE, TRACE_FORMAT, TRACE_FILE, allow_requested=TRACE_ON_REQUEST,
+                 max_bytes=TRACE_FILE_MAX_BYTES, backups=TRACE_FILE_BACKUPS)
+
+
+class ClusterStatusCache:
+    """
+    TTL-bounded snapshot of the cluster status.
+    
+    Reads never wait on the apiserver once a snapshot exists: a stale snapshot
+    is returned as-is while one background refresh replaces it. Concurrent
+    refreshes are collapsed into a single fetch.
+    """
+    
+    def __init__(self, fetch: Callable[[], Dict[str, Any]], ttl: float = CLUSTER_STATUS_TTL):
+        self._fetch = fetch
+        self.ttl = ttl
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._fetched_at = 0.0
+        self._refreshing = False
+        # What the last refresh fetched; unlike _snapshot, invalidate() does not clear it
+        self._last_refresh: Dict[str, Any] = {}
+        self._condition = threading.Condition()
+        self._wake = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, block: bool = True) -> Dict[str, Any]:
+        """
+        Return the cached snapshot, refreshing it in the background when stale
+        
+        With no snapshot (first read, or after invalidate()) the read fetches
+        one, unless block is False: then a refresh is started and a
+        disconnected placeholder marked "refreshing" is returned instead.
+        """
+        snapshot, fetched_at = self._snapshot, self._fetched_at
+        
+        if snapshot is None:
+            self.misses += 1
+            if not block:
+                self.refresh_async()
+                return {"connected": False, "chaos_mesh_installed": False, "refreshing": True, "age_seconds": None}
+            snapshot = self.refresh()
+            fetched_at = self._fetched_at
+        else:
+            self.hits += 1
+            if time.monotonic() - fetched_at >= self.ttl:
+                self.refresh_async()
+        
+        return {**snapshot, "age_seconds": round(time.monotonic() - fetched_at, 3)}
+    
+    def refresh(self) -> Dict[str, Any]:
+        """Fetch a new snapshot, or wait for the refresh already in flight"""
+        with self._condition:
+            if self._refreshing:
+                # The refresh waited on, even if invalidate() has already dropped it again
+                self._condition.wait_for(lambda: not self._refreshing)
+                return self._last_refresh
+            self._refreshing = True
+        
+        try:
+            snapshot = self._fetch()
+        except Exception as e:
+            logger.error(f"Failed to refresh cluster status: {e}")
+            snapshot = {"connected": False, "chaos_mesh_installed": False, "error": str(e)}
+        
+        with self._condition:
+            self._snapshot = self._last_refresh = snapshot
+            self._fetched_at = time.monotonic()
+            self._refreshing = False
+            self._condition.notify_all()
+        return snapshot
+    
+    def refresh_async(self):
+        """Wake the background refresher unless a refresh is already running"""
+        if self._refreshing:
+            return
+        with self._condition:
+            # One long-lived thread, so stale reads do not each start a thread
+            if self._refresher is None:
+                self._refresher = threading.Thread(target=self._refresh_loop, name="cluster-status-refresh",
+                                                   daemon=True)
+                self._refresher.start()
+        self._wake.set()
+    
+    def _refresh_loop(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            self.refresh()
+    
+    def invalidate(self):
+        """Drop the snapshot so the next read fetches a fresh one"""
+        with self._condition:
+            self._snapshot = None
+
 
 class GameManager:
     """Main game logic manager"""
     
     def __init__(self):
-        self.game_state = self._initialize_state()
+        # Game state, score and history are per session; cluster clients and caches are shared
+        self.sessions = SessionStore(
+            idle_timeout=SESSION_IDLE_TIMEOUT,
+            memory_budget=SESSION_MEMORY_BUDGET,
+            history_max_entries=HISTORY_MAX_ENTRIES,
+            history_max_bytes=HISTORY_MAX_BYTES
+        )
+        
+        # Push events; the upstream for a namespace runs only while someone listens
+        self.event_hub = EventHub(EVENT_QUEUE_SIZE)
+        self.event_hub.on_first_subscriber = self._start_event_source
+        self.event_hub.on_last_unsubscribe = self._stop_event_source
+        self._event_sources: Dict[str, threading.Event] = {}
         self.k8s_client: Optional[KubernetesClient] = None
         self.chaos_client: Optional[ChaosMeshClient] = None
-        self.simulation_mode = True  # Start in simulation mode
+        self.simulation_mode = True  # Serve simulated data until connected
+        
+        # In-memory cluster that backs every operation while in simulation mode
+        self.sim_cluster = SimulatedCluster(seed=SIMULATION_SEED, speed=SIMULATION_SPEED)
+        self.sim_k8s_client = SimulatedKubernetesClient(self.sim_cluster)
+        self.sim_chaos_client = SimulatedChaosMeshClient(self.sim_cluster)
+        
+        # Cluster discovery runs in the background, see start_background_tasks
+        self.connection_state = ConnectionState.connecting
+        self.cluster_status_cache = ClusterStatusCache(self._fetch_cluster_status)
+        self._stop_event = threading.Event()
+        self._connection_thread: Optional[threading.Thread] = None
+        
+        # Scenario packs are loaded before the first request; changes are picked up in the background
+        self.scenario_packs: Optional[ScenarioPackLoader] = None
+        self._scenario_pack_thread: Optional[threading.Thread] = None
+        if SCENARIO_DIR:
+            self.scenario_packs = ScenarioPackLoader(SCENARIO_DIR, registry, SCENARIO_CACHE_FILE)
+            self.scenario_packs.scan()
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_executor_lock = threading.Lock()
+        
+        # Paused workflows as (namespace, name); their new steps are paused while any are listed
+        self._paused_workflows: set = set()
+        self._paused_workflows_lock = threading.Lock()
+        self._workflow_pause_thread: Optional[threading.Thread] = None
+        
+        # Active experiments per namespace and type as of the last listing, for /metrics
+        self._active_experiments: Dict[str, Dict[str, int]] = {}
+        self._register_metrics()
+    
+    def _register_metrics(self):
+        """Expose shared state as scrape-time gauges; nothing is computed on the request path"""
+        REGISTRY.gauge_func(
+            "kubechaos_cluster_status_cache_hit_ratio", "Share of cluster status reads served from the cache", (),
+            lambda: {(): self.cluster_status_cache.hits / max(1, self.cluster_status_cache.hits + self.cluster_status_cache.misses)}
+        )
+        REGISTRY.gauge_func(
+            "kubechaos_informer_staleness_seconds", "Seconds since each informer last heard from the apiserver",
+            ("kind", "namespace"),
+            lambda: {(m["kind"], m["namespace"]): m["staleness_seconds"] or 0
+                     for m in self.get_cache_metrics()["informers"]}
+        )
+        REGISTRY.gauge_func(
+            "kubechaos_active_experiments", "Running or paused experiments per type as of the last listing",
+            ("namespace", "type"),
+            lambda: {(ns, chaos_type): count
+                     for ns, counts in list(self._active_experiments.items()) for chaos_type, count in counts.items()}
+        )
+        REGISTRY.gauge_func(
+            "kubechaos_sessions", "Player sessions held in memory", (),
+            lambda: {(): self.sessions.stats()["sessions"]}
+        )
+        REGISTRY.gauge_func(
+            "kubechaos_websocket_subscribers", "Connected /ws clients", (),
+            lambda: {(): self.event_hub.subscriber_count()}
+        )
+        REGISTRY.gauge_func(
+            "kubechaos_connection_state", "1 for the current cluster connection state", ("state",),
+            lambda: {(state.value,): int(state == self.connection_state) for state in ConnectionState}
+        )
+    
+    def start_background_tasks(self):
+        """Connect to the cluster in the background and keep checking it, and watch scenario packs"""
+        if self._connection_thread and self._connection_thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._connection_thread = threading.Thread(
+            target=self._connection_loop,
+            name="cluster-connection",
+            daemon=True
+        )
+        self._connection_thread.start()
         
-        # Try to connect to Kubernetes cluster
+        if self.scenario_packs and SCENARIO_RELOAD_INTERVAL > 0 and not (
+                self._scenario_pack_thread and self._scenario_pack_thread.is_alive()):
+            self._scenario_pack_thread = threading.Thread(
+                target=self.scenario_packs.watch,
+                args=(SCENARIO_RELOAD_INTERVAL, self._stop_event),
+                name="scenario-packs",
+                daemon=True
+            )
+            self._scenario_pack_thread.start()
+    
+    def stop_background_tasks(self):
+        """Stop the connection loop and close the cluster clients"""
+        self._stop_event.set()
+        self._close_clients(self.k8s_client, self.chaos_client)
+    
+    def _connection_loop(self):
+        """
+        Drive the connection state machine:
+        connecting -> real/simulation, real -> degraded when the cluster stops
+        answering, and simulation/degraded -> real on a successful reconnect.
+        """
         self._initialize_clients()
+        
+        while not self._stop_event.wait(RECONNECT_INTERVAL):
+            if self.connection_state == ConnectionState.real:
+                # The status refresh doubles as the connectivity check
+                if not self.cluster_status_cache.refresh().get("connected"):
+                    logger.warning("Lost connection to Kubernetes - degraded mode")
+                    self._set_connection_state(ConnectionState.degraded)
+            else:
+                self._initialize_clients()
+    
+    def _set_connection_state(self, state: ConnectionState):
+        """Update the connection state and the simulation flag that follows it"""
+        if state != self.connection_state:
+            logger.info(f"Cluster connection state: {self.connection_state.value} -> {state.value}")
+            self.cluster_status_cache.invalidate()
+        self.connection_state = state
+        self.simulation_mode = state != ConnectionState.real
+        
+        # Prime the cache so the first probe after connecting is served from memory
+        if state == ConnectionState.real:
+            self.cluster_status_cache.refresh()
     
     def _initialize_clients(self):
         """Initialize Kubernetes and Chaos Mesh clients"""
+        # A failed reconnect keeps a degraded manager degraded
+        failed_state = ConnectionState.degraded if self.connection_state == ConnectionState.degraded \
+            else ConnectionState.simulation
+        
+        k8s_client = chaos_client = None
         try:
             # Try to connect to Kubernetes
-            self.k8s_client = KubernetesClient()
+            k8s_client = KubernetesClient(
+                use_informers=USE_INFORMER_CACHE,
+                connection_pool_maxsize=KUBERNETES_WORKERS,
+                informer_namespaces=INFORMER_NAMESPACES,
+                max_informers=MAX_INFORMERS,
+                informer_idle_timeout=INFORMER_IDLE_TIMEOUT
+            )
             
-            if self.k8s_client.is_connected():
+            if k8s_client.is_connected():
                 logger.info("Connected to Kubernetes cluster")
-                self.simulation_mode = False
                 
                 # Initialize Chaos Mesh client
-                self.chaos_client = ChaosMeshClient(self.k8s_client.custom_objects)
+                chaos_client = ChaosMeshClient(k8s_client.custom_objects)
                 
-                if self.chaos_client.is_chaos_mesh_installed():
+                if chaos_client.is_chaos_mesh_installed():
                     logger.info("Chaos Mesh detected - real mode enabled")
+                    state = ConnectionState.real
                 else:
                     logger.warning("Chaos Mesh not installed - simulation mode")
-                    self.simulation_mode = True
+                    state = failed_state
+                
+                # Requests pick up the new clients before the old ones' pools are closed
+                old_k8s, old_chaos = self.k8s_client, self.chaos_client
+                self.k8s_client = k8s_client
+                self.chaos_client = chaos_client
+                self._set_connection_state(state)
+                self._close_clients(old_k8s, old_chaos)
             else:
                 logger.warning("Not connected to Kubernetes - simulation mode")
-                self.simulation_mode = True
+                self._set_connection_state(failed_state)
+                self._close_clients(k8s_client, None)
                 
         except Exception as e:
             logger.error(f"Failed to initialize clients: {e}")
             logger.info("Running in simulation mode")
-            self.simulation_mode = True
-    
-    def _initialize_state(self) -> GameState:
-        """Initialize game state"""
-        return GameState(
-            isGameRunning=False,
-            gameStartTime=None,
-            currentTime=datetime.now(),
-            pods=[],
-            services=[],
-            deployments=[],
-            chaosEvents=[],
-            activeEvents=[],
-            terminalHistory=[],
-            currentCommand="",
-            score=GameScore(
-                totalScore=0,
-                mttr=0.0,
-                commandsUsed=0,
-                incidentsResolved=0,
-                proactiveChecks=0
-            )
-        )
+            self._set_connection_state(failed_state)
+            if k8s_client is not self.k8s_client:
+                self._close_clients(k8s_client, chaos_client)
+    
+    @staticmethod
+    def _close_clients(k8s_client: Optional[KubernetesClient], chaos_client: Optional[ChaosMeshClient]):
+        """Release the thread pools, connection pool and informers of replaced or unused clients"""
+        for cluster_client in (chaos_client, k8s_client):
+            if cluster_client is None:
+                continue
+            try:
+                cluster_client.close()
+            except Exception as e:
+                logger.debug(f"Error closing {type(cluster_client).__name__}: {e}")
+    
+    def _k8s(self) -> KubernetesClient:
+        """Kubernetes client for the current mode: the real cluster or the simulation"""
+        if self.simulation_mode or not self.k8s_client:
+            return self.sim_k8s_client
+        return self.k8s_client
+    
+    def _chaos(self) -> ChaosMeshClient:
+        """Chaos Mesh client for the current mode: the real cluster or the simulation"""
+        if self.simulation_mode or not self.chaos_client:
+            return self.sim_chaos_client
+        return self.chaos_client
+    
+    # Sessions
+    def create_session(self) -> str:
+        """Start a new player session and return its token"""
+        return self.sessions.create().token
+    
+    def end_session(self, session_token: str) -> bool:
+        """Drop a player session"""
+        return self.sessions.remove(session_token)
+    
+    def session_exists(self, session_token: Optional[str]) -> bool:
+        """True if session_token names a live session (no token means the default one); marks it used"""
+        try:
+            self.sessions.get(session_token)
+            return True
+        except UnknownSession:
+            return False
+    
+    def get_session_stats(self) -> Dict[str, Any]:
+        """Session count and memory use"""
+        return self.sessions.stats()
+    
+    def get_state(self, history_entries: int = STATUS_HISTORY_ENTRIES,
+                  session_token: Optional[str] = None) -> GameState:
+        """Get a session's game state with only the last history_entries terminal lines"""
+        return self.sessions.get(session_token).get_state(history_entries)
     
-    def get_state(self) -> GameState:
-        """Get current game state"""
-        self.game_state.currentTime = datetime.now()
-        return self.game_state
+    def state_revision(self, session_token: Optional[str] = None) -> str:
+        """Current state revision token ("<epoch>.<revision>") of a session"""
+        return self.sessions.get(session_token).revision_token
     
-    def get_cluster_status(self) -> Dict[str, Any]:
-        """Get Kubernetes cluster status"""
+    def state_etag(self, history_entries: int = STATUS_HISTORY_ENTRIES,
+                   session_token: Optional[str] = None) -> str:
+        """Weak ETag for a session's /status"""
+        return self.sessions.get(session_token).etag(history_entries)
+    
+    def get_state_delta(self, since: str, history_entries: int = STATUS_HISTORY_ENTRIES,
+                        session_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Return only the GameState fields changed after the revision token `since`;
+        every field, with full set, when since is from another epoch
+        """
+        session = self.sessions.get(session_token)
+        revision, changed, full = session.changed_fields(since)
+        
+        state = session.get_state(history_entries)
+        return {
+            "revision": revision,
+            "since": since,
+            "full": full,
+            "currentTime": state.currentTime,
+            "changes": {field: getattr(state, field) for field in changed}
+        }
+    
+    def get_history(self, after_seq: int = 0, limit: int = 100,
+                    session_token: Optional[str] = None) -> Dict[str, Any]:
+        """Page through a session's terminal history by sequence number"""
+        return self.sessions.get(session_token).history.page(after_seq, limit)
+    
+    def _record_command(self, session: GameSession, command: str, output: str):
+        """Add a command and its output to the session's terminal history"""
+        session.history.append(f"$ {command}")
+        seq = session.history.append(output)
+        session.touch("terminalHistory", "historySummary", "score")
+        
+        self.event_hub.publish("terminal", {"seq": seq, "command": command, "output": output},
+                               session=session.token)
+        self.event_hub.publish("score", dict(session.game_state.score), session=session.token)
+    
+    def get_cluster_status(self, block: bool = True) -> Dict[str, Any]:
+        """Get Kubernetes cluster status from the TTL-bounded cache; see ClusterStatusCache.get for block"""
         if not self.k8s_client or self.simulation_mode:
             return {
                 "connected": False,
                 "chaos_mesh_installed": False,
-                "mode": "simulation"
+                "mode": "simulation",
+                "state": self.connection_state.value
             }
         
+        return {
+            **self.cluster_status_cache.get(block),
+            "mode": "real",
+            "state": self.connection_state.value
+        }
+    
+    def _fetch_cluster_status(self) -> Dict[str, Any]:
+        """Query the apiserver for cluster status"""
+        if not self.k8s_client:
+            return {"connected": False, "chaos_mesh_installed": False}
+        
         try:
             cluster_info = self.k8s_client.get_cluster_info()
             chaos_mesh_installed = self.chaos_client.is_chaos_mesh_installed() if self.chaos_client else False
             
             return {
                 **cluster_info,
-                "chaos_mesh_installed": chaos_mesh_installed,
-                "mode": "real" if not self.simulation_mode else "simulation"
+                "chaos_mesh_installed": chaos_mesh_installed
             }
         except Exception as e:
             logger.error(f"Failed to get cluster status: {e}")
             return {
                 "connected": False,
                 "chaos_mesh_installed": False,
-                "error": str(e),
-                "mode": "simulation"
+                "error": str(e)
             }
     
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """Get informer cache metrics"""
+        if not self.k8s_client:
+            return {"enabled": False, "informers": []}
+        
+        return {
+            "enabled": self.k8s_client.use_informers,
+            "informers": self.k8s_client.informer_metrics()
+        }
+    
+    # Event Stream
+    def _start_event_source(self, namespace: str):
+        """Start the shared upstream for namespace when its first client connects"""
+        stop = threading.Event()
+        self._event_sources[namespace] = stop
+        threading.Thread(
+            target=self._event_source_loop,
+            args=(namespace, stop),
+            name=f"events-{namespace}",
+            daemon=True
+        ).start()
+    
+    def _stop_event_source(self, namespace: str):
+        """Stop the upstream for namespace when its last client disconnects"""
+        stop = self._event_sources.pop(namespace, None)
+        if stop:
+            stop.set()
+    
+    def _event_source_loop(self, namespace: str, stop: threading.Event):
+        """
+        One upstream per namespace, however many clients are connected:
+        pod phase changes come from the pods informer's watch, experiment
+        status changes from one shared listing every EVENT_POLL_INTERVAL.
+        """
+        def on_pod_event(event_type: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]):
+            self._publish_pod_event(namespace, event_type, old, new)
+        
+        watched_client = None
+        watching = False
+        known_pods: Optional[Dict[str, Dict[str, Any]]] = None
+        known: Dict[tuple, str] = {}
+        
+        try:
+            while True:
+                # (Re)attach the pod watch whenever the cluster client changes
+                k8s_client = self._k8s()
+                if k8s_client is not watched_client:
+                    if watched_client:
+                        watched_client.remove_pod_listener(namespace, on_pod_event)
+                    watching = k8s_client.add_pod_listener(namespace, on_pod_event)
+                    if not watching:
+                        logger.info(f"No pod informer allowed for {namespace}; polling its pods instead")
+                    watched_client = k8s_client
+                    known_pods = None
+                if not watching:
+                    known_pods = self._poll_pod_events(namespace, k8s_client, known_pods)
+                
+                experiments = self.list_chaos_experiments(namespace)
+                current = {(e["type"], e["name"]): e["status"] for e in experiments}
+                # Kinds that could not be listed this time keep their last known statuses
+                current.update({key: status for key, status in known.items()
+                                if key[0] in experiments.incomplete})
+                for (chaos_type, name), status in current.items():
+                    if known.get((chaos_type, name)) != status:
+                        self.event_hub.publish("experiment", {
+                            "name": name,
+                            "type": chaos_type,
+                            "status": status,
+                            "previous": known.get((chaos_type, name))
+                        }, namespace)
+                for (chaos_type, name), status in known.items():
+                    if (chaos_type, name) not in current:
+                        self.event_hub.publish("experiment", {
+                            "name": name,
+                            "type": chaos_type,
+                            "status": "Deleted",
+                            "previous": status
+                        }, namespace)
+                known = current
+                
+                if stop.wait(EVENT_POLL_INTERVAL):
+                    break
+        except Exception as e:
+            logger.error(f"Event source for {namespace} failed: {e}")
+        finally:
+            if watched_client:
+                watched_client.remove_pod_listener(namespace, on_pod_event)
+    
+    def _poll_pod_events(self, namespace: str, k8s_client: KubernetesClient,
+                         known: Optional[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """Publish the pod changes since the known listing, for namespaces without a pod informer"""
+        pods = {pod["name"]: pod for pod in k8s_client.list_pods(namespace)}
+        if known is not None:
+            for name, pod in pods.items():
+                self._publish_pod_event(namespace, "MODIFIED" if name in known else "ADDED", known.get(name), pod)
+            for name, pod in known.items():
+                if name not in pods:
+                    self._publish_pod_event(namespace, "DELETED", pod, None)
+        return pods
+    
+    def is_game_namespace(self, namespace: str) -> bool:
+        """Whether namespace is one the game plays in (GAME_NAMESPACES)"""
+        return namespace in GAME_NAMESPACES
+    
+    def _publish_pod_event(self, namespace: str, event_type: str,
+                           old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]):
+        """Publish pod additions, deletions and phase/readiness transitions"""
+        if event_type == "DELETED":
+            self.event_hub.publish("pod", {
+                "name": old["name"],
+                "event": "deleted",
+                "phase": None,
+                "previous_phase": old["status"]
+            }, namespace)
+            return
+        
+        if old and old["status"] == new["status"] and old["ready"] == new["ready"]:
+            return
+        
+        self.event_hub.publish("pod", {
+            "name": new["name"],
+            "event": "added" if old is None else "changed",
+            "phase": new["status"],
+            "previous_phase": old["status"] if old else None,
+            "ready": f"{new['ready']}/{new['total_containers']}"
+        }, namespace)
+    
     # Game Control
-    def start_game(self):
+    def start_game(self, session_token: Optional[str] = None):
         """Start the game"""
-        self.game_state.isGameRunning = True
-        self.game_state.gameStartTime = datetime.now()
+        session = self.sessions.get(session_token)
+        session.game_state.isGameRunning = True
+        session.game_state.gameStartTime = datetime.now()
+        session.touch("isGameRunning", "gameStartTime")
         logger.info("Game started")
     
-    def stop_game(self):
+    def stop_game(self, session_token: Optional[str] = None):
         """Stop the game"""
-        self.game_state.isGameRunning = False
+        session = self.sessions.get(session_token)
+        session.game_state.isGameRunning = False
+        session.touch("isGameRunning")
         logger.info("Game stopped")
     
-    def reset_game(self):
+    def reset_game(self, session_token: Optional[str] = None):
         """Reset game state"""
-        self.game_state = self._initialize_state()
+        self.sessions.get(session_token).reset()
         logger.info("Game reset")
     
     # Command Execution
-    def execute_command(self, command: str, namespace: str = "default") -> Dict[str, Any]:
+    def execute_command(self, command: str, namespace: str = "default",
+                        session_token: Optional[str] = None) -> Dict[str, Any]:
         """Execute a kubectl command"""
-        self.game_state.score.commandsUsed += 1
+        session = self.sessions.get(session_token)
+        session.game_state.score.commandsUsed += 1
+        session.touch("score")
         
-        if self.simulation_mode or not self.k8s_client:
-            # Simulation mode - return mock data
-            return self._execute_simulated_command(command)
+        if command.strip() == "help":
+            output = KUBECTL_HELP
+            self._record_command(session, command, output)
+            return {"output": output, "success": True}
         
         try:
-            # Real mode - execute against actual cluster
-            result = self.k8s_client.execute_kubectl_command(command, namespace)
+            # Runs against the real cluster, or the simulated one in simulation mode
+            result = self._k8s().execute_kubectl_command(command, namespace)
             
             # Add to terminal history
             if result.get("success"):
-                self.game_state.terminalHistory.append(f"$ {command}")
-                self.game_state.terminalHistory.append(result.get("output", ""))
+                self._record_command(session, command, result.get("output", ""))
             else:
-                self.game_state.terminalHistory.append(f"$ {command}")
-                self.game_state.terminalHistory.append(f"Error: {result.get('error', 'Unknown error')}")
+                self._record_command(session, command, f"Error: {result.get('error', 'Unknown error')}")
             
             return result
             
@@ -153,27 +687,29 @@ class GameManager:
             logger.error(f"Command execution failed: {e}")
             return {"error": str(e), "success": False}
     
-    def _execute_simulated_command(self, command: str) -> Dict[str, Any]:
-        """Execute command in simulation mode"""
-        # Simple simulation for backward compatibility
-        output = f"Simulated output for: {command}"
-        
-        if "get pods" in command:
-            output = "NAME                          READY   STATUS    RESTARTS   AGE\npayment-service-abc123        1/1     Running   0          1d"
-        elif "get services" in command:
-            output = "NAME              TYPE        CLUSTER-IP      PORT(S)\npayment-service   ClusterIP   10.96.0.1       80/TCP"
-        elif "help" in command:
-            output = "Available commands:\n  kubectl get pods\n  kubectl get services\n  kubectl get deployments\n  kubectl logs <pod-name>\n  kubectl describe pod <pod-name>"
-        
-        self.game_state.terminalHistory.append(f"$ {command}")
-        self.game_state.terminalHistory.append(output)
-        
-        return {"output": output, "success": True}
-    
     # Scenario Management
     def list_scenarios(self) -> List[Dict[str, Any]]:
         """List all available scenarios"""
-        return [s.to_dict() for s in ALL_SCENARIOS]
+        return [s.to_dict() for s in registry.all()]
+    
+    def scenarios_json(self, difficulty: Optional[str] = None) -> tuple:
+        """Pre-encoded /scenarios body and its ETag, for all scenarios or one difficulty"""
+        if difficulty is None:
+            return registry.listing()
+        try:
+            return registry.listing(Difficulty(difficulty))
+        except ValueError:
+            return b"[]", '"empty"'
+    
+    def scenario_packs_status(self) -> Dict[str, Any]:
+        """Loaded pack files and the validation errors of rejected ones"""
+        if not self.scenario_packs:
+            return {"directory": None, "files": 0, "scenarios": 0, "errors": {}}
+        return self.scenario_packs.status()
+    
+    def scenario_json(self, scenario_id: str) -> Optional[bytes]:
+        """Pre-encoded scenario, or None if it does not exist"""
+        return registry.scenario_json(scenario_id)
     
     def get_scenario(self, scenario_id: str) -> Optional[Dict[str, Any]]:
         """Get scenario by ID"""
@@ -189,16 +725,15 @@ class GameManager:
         except ValueError:
             return []
     
-    def start_scenario(self, scenario_id: str, namespace: str = "ecommerce") -> Optional[Dict[str, Any]]:
+    def start_scenario(self, scenario_id: str, namespace: str = "ecommerce",
+                       session_token: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Start a game scenario"""
         scenario = get_scenario_by_id(scenario_id)
         if not scenario:
             logger.error(f"Scenario not found: {scenario_id}")
             return None
         
-        if self.simulation_mode or not self.chaos_client:
-            logger.warning("Cannot start real scenario in simulation mode")
-            return {"error": "Simulation mode - real scenarios not available"}
+        chaos_client = self._chaos()
         
         try:
             # Create chaos experiment based on scenario config
@@ -207,33 +742,15 @@ class GameManager:
             
             experiment_name = f"game-{scenario_id}"
             
-            if chaos_type == "PodChaos":
-                result = self.chaos_client.create_pod_chaos(
-                    name=experiment_name,
-                    namespace=namespace,
-                    config=chaos_config
-                )
-            elif chaos_type == "NetworkChaos":
-                result = self.chaos_client.create_network_chaos(
-                    name=experiment_name,
-                    namespace=namespace,
-                    config=chaos_config
-                )
-            elif chaos_type == "StressChaos":
-                result = self.chaos_client.create_stress_chaos(
-                    name=experiment_name,
-                    namespace=namespace,
-                    config=chaos_config
-                )
-            elif chaos_type == "IOChaos":
-                result = self.chaos_client.create_io_chaos(
-                    name=experiment_name,
-                    namespace=namespace,
-                    config=chaos_config
-                )
-            else:
-                logger.error(f"Unsupported chaos type: {chaos_type}")
-                return None
+            result = self._create_experiment(
+                chaos_client, chaos_type, experiment_name, namespace, chaos_config,
+                labels={SCENARIO_LABEL: scenario_id}
+            )
+            
+            if result:
+                session = self.sessions.get(session_token)
+                session.game_state.activeScenario = scenario_id
+                session.touch("activeScenario")
             
             logger.info(f"Started scenario {scenario_id}")
             return result
@@ -242,145 +759,384 @@ class GameManager:
             logger.error(f"Failed to start scenario: {e}")
             return None
     
-    # Chaos Experiment Management
-    def list_chaos_experiments(self, namespace: str = "ecommerce") -> List[Dict[str, Any]]:
-        """List all chaos experiments"""
-        if self.simulation_mode or not self.chaos_client:
-            return []
+    def start_scenario_batch(self, scenario_id: str, targets: List[Dict[str, Any]], rollback: bool = False,
+                             session_token: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Start a scenario in many namespaces at once
         
+        Args:
+            scenario_id: Scenario to launch
+            targets: [{"namespace": ..., "selector": {...}}]; selector optionally
+                overrides the scenario's Chaos Mesh selector for that target
+            rollback: Delete the experiments that were created if any target fails
+        
+        Returns:
+            Per-target results with success/failure counts, or None if the scenario does not exist
+        """
+        scenario = get_scenario_by_id(scenario_id)
+        if not scenario:
+            logger.error(f"Scenario not found: {scenario_id}")
+            return None
+        
+        chaos_client = self._chaos()
+        chaos_config = scenario.chaos_config
+        chaos_type = chaos_config.get("type")
+        
+        # Experiments of one batch share a random id, so names never collide across batches
+        batch_id = secrets.token_hex(3)
+        labels = {SCENARIO_LABEL: scenario_id, BATCH_LABEL: batch_id}
+        
+        def launch(index: int, target: Dict[str, Any]) -> Dict[str, Any]:
+            namespace = target.get("namespace") or "ecommerce"
+            name = f"game-{scenario_id}-{batch_id}-{index}"
+            config = self._retarget_config(chaos_config, namespace, target.get("selector"))
+            item = {"index": index, "namespace": namespace, "name": name, "type": chaos_type,
+                    "success": False, "error": None}
+            try:
+                result = self._create_experiment(chaos_client, chaos_type, name, namespace,
+                                                 config, labels=labels)
+                item["success"] = bool(result) and "error" not in result
+                if not item["success"]:
+                    item["error"] = (result or {}).get("error", "Failed to create experiment")
+            except Exception as e:
+                item["error"] = str(e)
+            return item
+        
+        executor = self._get_batch_executor()
+        results = list(executor.map(propagate(launch), range(len(targets)), targets))
+        failed = sum(1 for item in results if not item["success"])
+        
+        rolled_back = False
+        if failed and rollback:
+            created = [item for item in results if item["success"]]
+            
+            def undo(item: Dict[str, Any]) -> bool:
+                try:
+                    return chaos_client.delete_experiment(item["name"], item["namespace"], chaos_type)
+                except Exception as e:
+                    logger.error(f"Failed to roll back {item['name']}: {e}")
+                    return False
+            
+            for item, deleted in zip(created, executor.map(propagate(undo), created)):
+                item["rolled_back"] = deleted
+            rolled_back = all(item["rolled_back"] for item in created)
+        
+        if failed < len(results) and not (failed and rollback):
+            session = self.sessions.get(session_token)
+            session.game_state.activeScenario = scenario_id
+            session.touch("activeScenario")
+        
+        logger.info(f"Started scenario {scenario_id} batch {batch_id}: "
+                    f"{len(results) - failed}/{len(results)} experiments created")
+        return {
+            "scenario_id": scenario_id,
+            "batch_id": batch_id,
+            "total": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "rolled_back": rolled_back,
+            "results": results
+        }
+    
+    def _create_experiment(self, chaos_client: ChaosMeshClient, chaos_type: str, name: str, namespace: str,
+                           config: Dict[str, Any], labels: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+        """Create an experiment of chaos_type; None if the type is unsupported or creation failed"""
+        creators = {
+            "PodChaos": chaos_client.create_pod_chaos,
+            "NetworkChaos": chaos_client.create_network_chaos,
+            "StressChaos": chaos_client.create_stress_chaos,
+            "IOChaos": chaos_client.create_io_chaos,
+            "Workflow": chaos_client.create_workflow
+        }
+        creator = creators.get(chaos_type)
+        if not creator:
+            logger.error(f"Unsupported chaos type: {chaos_type}")
+            return None
+        return creator(name, namespace, config, labels=labels)
+    
+    @staticmethod
+    def _retarget_config(config: Dict[str, Any], namespace: str,
+                         selector: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Point a scenario's selectors (every template's, for workflows) at namespace"""
+        def retarget(spec: Dict[str, Any]) -> Dict[str, Any]:
+            return {**spec, "selector": {**spec.get("selector", {}), "namespaces": [namespace], **(selector or {})}}
+        
+        if config.get("type") != "Workflow":
+            return retarget(config)
+        
+        templates = []
+        for template in config.get("templates", []):
+            key = (template.get("type") or "").lower()
+            templates.append({**template, key: retarget(template[key])} if key in template else template)
+        return {**config, "templates": templates}
+    
+    def _get_batch_executor(self) -> ThreadPoolExecutor:
+        """Bounded pool for batch creates and deletes, separate from the request executor"""
+        with self._batch_executor_lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix="batch")
+            return self._batch_executor
+    
+    # Chaos Experiment Management
+    def list_chaos_experiments(self, namespace: str = "ecommerce") -> ExperimentList:
+        """List all chaos experiments; incomplete names the kinds left out"""
         try:
-            return self.chaos_client.list_experiments(namespace)
+            experiments = self._chaos().list_experiments(namespace)
+            
+            # Kinds that could not be listed keep their last counts
+            previous = self._active_experiments.get(namespace, {})
+            counts = {kind: count for kind, count in previous.items() if kind in experiments.incomplete}
+            for experiment in experiments:
+                if experiment["status"] not in ("Finished", "Failed"):
+                    counts[experiment["type"]] = counts.get(experiment["type"], 0) + 1
+            # Listings of client-named namespaces are served but not exported, so the gauge stays bounded
+            if self.is_game_namespace(namespace):
+                self._active_experiments[namespace] = counts
+            return experiments
         except Exception as e:
             logger.error(f"Failed to list experiments: {e}")
-            return []
+            return ExperimentList(incomplete=ChaosMeshClient.CHAOS_TYPES)
+    
+    def teardown_experiments(self, namespace: str = "ecommerce", wait: bool = False,
+                             timeout: float = 120.0) -> Iterator[Dict[str, Any]]:
+        """
+        Delete every game experiment in namespace, yielding progress as it goes
+        
+        Deletes by the game label with one collection delete per kind, all kinds
+        in parallel. With wait, also waits for Chaos Mesh to finish recovering
+        each kind and remove the experiments' finalizers.
+        """
+        chaos_client = self._chaos()
+        deleted: Dict[str, List[str]] = {}
+        errors = 0
+        
+        for progress in chaos_client.delete_experiments_by_label(namespace):
+            deleted[progress["type"]] = progress["deleted"]
+            errors += progress["error"] is not None
+            yield {"event": "deleted", **progress}
+        
+        remaining: List[str] = []
+        if wait:
+            deadline = time.monotonic() + timeout
+            for chaos_type, names in deleted.items():
+                if not names:
+                    continue
+                try:
+                    left = chaos_client.wait_for_deletion(namespace, chaos_type,
+                                                          timeout=max(0.0, deadline - time.monotonic()))
+                except Exception as e:
+                    logger.error(f"Failed to wait for {chaos_type} deletion: {e}")
+                    left = names
+                remaining.extend(left)
+                yield {"event": "finalized", "type": chaos_type, "remaining": left}
+        
+        yield {
+            "event": "done",
+            "deleted": sum(len(names) for names in deleted.values()),
+            "errors": errors,
+            "remaining": remaining
+        }
     
     def get_chaos_experiment(self, name: str, namespace: str, chaos_type: str) -> Optional[Dict[str, Any]]:
         """Get specific chaos experiment"""
-        if self.simulation_mode or not self.chaos_client:
-            return None
-        
         try:
-            return self.chaos_client.get_experiment(name, namespace, chaos_type)
+            return self._chaos().get_experiment(name, namespace, chaos_type)
         except Exception as e:
             logger.error(f"Failed to get experiment: {e}")
             return None
     
+    def get_workflow_status(self, name: str, namespace: str) -> Optional[Dict[str, Any]]:
+        """Get a workflow's status aggregated across its templates"""
+        try:
+            return self._chaos().get_workflow_status(name, namespace)
+        except Exception as e:
+            logger.error(f"Failed to get workflow status: {e}")
+            return None
+    
     def create_custom_chaos(self, chaos_type: str, name: str, namespace: str, config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Create custom chaos experiment"""
-        if self.simulation_mode or not self.chaos_client:
-            return {"error": "Simulation mode - real chaos not available"}
+        chaos_client = self._chaos()
         
         try:
             if chaos_type == "PodChaos":
-                return self.chaos_client.create_pod_chaos(name, namespace, config)
+                return chaos_client.create_pod_chaos(name, namespace, config)
             elif chaos_type == "NetworkChaos":
-                return self.chaos_client.create_network_chaos(name, namespace, config)
+                return chaos_client.create_network_chaos(name, namespace, config)
             elif chaos_type == "StressChaos":
-                return self.chaos_client.create_stress_chaos(name, namespace, config)
+                return chaos_client.create_stress_chaos(name, namespace, config)
             elif chaos_type == "IOChaos":
-                return self.chaos_client.create_io_chaos(name, namespace, config)
+                return chaos_client.create_io_chaos(name, namespace, config)
+            elif chaos_type == "Workflow":
+                return chaos_client.create_workflow(name, namespace, config)
             else:
                 return {"error": f"Unsupported chaos type: {chaos_type}"}
         except Exception as e:
             logger.error(f"Failed to create custom chaos: {e}")
             return None
     
+    def apply_chaos_manifests(self, yaml_content: str, namespace: str, dry_run: bool = False) -> Dict[str, Any]:
+        """Validate a multi-document YAML file of chaos manifests, then server-side apply all of them"""
+        return self._chaos().apply_manifests(yaml_content, namespace, dry_run)
+    
     def pause_chaos_experiment(self, name: str, namespace: str, chaos_type: str) -> bool:
-        """Pause chaos experiment"""
-        if self.simulation_mode or not self.chaos_client:
-            return False
-        
+        """Pause chaos experiment; a paused workflow's later steps are paused as they start"""
         try:
-            return self.chaos_client.pause_experiment(name, namespace, chaos_type)
+            paused = self._chaos().pause_experiment(name, namespace, chaos_type)
         except Exception as e:
             logger.error(f"Failed to pause experiment: {e}")
             return False
+        if paused and chaos_type == "Workflow":
+            self._watch_paused_workflow(namespace, name)
+        return paused
     
     def resume_chaos_experiment(self, name: str, namespace: str, chaos_type: str) -> bool:
         """Resume chaos experiment"""
-        if self.simulation_mode or not self.chaos_client:
-            return False
-        
+        if chaos_type == "Workflow":
+            with self._paused_workflows_lock:
+                self._paused_workflows.discard((namespace, name))
         try:
-            return self.chaos_client.resume_experiment(name, namespace, chaos_type)
+            return self._chaos().resume_experiment(name, namespace, chaos_type)
         except Exception as e:
             logger.error(f"Failed to resume experiment: {e}")
             return False
     
+    def _watch_paused_workflow(self, namespace: str, name: str):
+        with self._paused_workflows_lock:
+            self._paused_workflows.add((namespace, name))
+            if self._workflow_pause_thread is None:
+                self._workflow_pause_thread = threading.Thread(
+                    target=self._workflow_pause_loop,
+                    name="workflow-pause",
+                    daemon=True
+                )
+                self._workflow_pause_thread.start()
+    
+    def _workflow_pause_loop(self):
+        """Pause the steps paused workflows start; exits once no workflow is paused"""
+        while not self._stop_event.wait(WORKFLOW_PAUSE_INTERVAL):
+            with self._paused_workflows_lock:
+                workflows = list(self._paused_workflows)
+                if not workflows:
+                    self._workflow_pause_thread = None
+                    return
+            for namespace, name in workflows:
+                try:
+                    still_paused = self._chaos().enforce_workflow_pause(name, namespace)
+                except Exception as e:
+                    logger.error(f"Failed to pause new steps of workflow {name}: {e}")
+                    continue
+                if not still_paused:
+                    with self._paused_workflows_lock:
+                        self._paused_workflows.discard((namespace, name))
+        with self._paused_workflows_lock:
+            self._workflow_pause_thread = None
+    
     def delete_chaos_experiment(self, name: str, namespace: str, chaos_type: str) -> bool:
         """Delete chaos experiment"""
-        if self.simulation_mode or not self.chaos_client:
-            return False
-        
         try:
-            return self.chaos_client.delete_experiment(name, namespace, chaos_type)
+            return self._chaos().delete_experiment(name, namespace, chaos_type)
         except Exception as e:
             logger.error(f"Failed to delete experiment: {e}")
             return False
     
     # Kubernetes Resource Operations
-    def list_pods(self, namespace: str = "default") -> List[Dict[str, Any]]:
-        """List pods"""
-        if self.simulation_mode or not self.k8s_client:
-            return []
-        
+    def list_pods(self, namespace: str = "default", label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None, resource_version: Optional[str] = None,
+                  resource_version_match: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List pods; selectors are applied by the apiserver"""
         try:
-            return self.k8s_client.list_pods(namespace)
+            return self._k8s().list_pods(namespace, label_selector=label_selector, field_selector=field_selector,
+                                         resource_version=resource_version,
+                                         resource_version_match=resource_version_match)
+        except ApiException:
+            # Invalid selectors or an expired resourceVersion are reported to the caller
+            raise
         except Exception as e:
             logger.error(f"Failed to list pods: {e}")
             return []
     
     def get_pod(self, name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
         """Get pod details"""
-        if self.simulation_mode or not self.k8s_client:
-            return None
-        
         try:
-            return self.k8s_client.get_pod(name, namespace)
+            return self._k8s().get_pod(name, namespace)
         except Exception as e:
             logger.error(f"Failed to get pod: {e}")
             return None
     
     def get_pod_logs(self, name: str, namespace: str = "default", tail_lines: int = 100) -> str:
         """Get pod logs"""
-        if self.simulation_mode or not self.k8s_client:
-            return "Simulation mode - no real logs available"
-        
         try:
-            return self.k8s_client.get_pod_logs(name, namespace, tail_lines=tail_lines)
+            return self._k8s().get_pod_logs(name, namespace, tail_lines=tail_lines)
         except Exception as e:
             logger.error(f"Failed to get pod logs: {e}")
             return f"Error: {str(e)}"
     
-    def list_services(self, namespace: str = "default") -> List[Dict[str, Any]]:
-        """List services"""
-        if self.simulation_mode or not self.k8s_client:
-            return []
-        
+    def stream_pod_logs(self, name: str, namespace: str = "default", container: Optional[str] = None,
+                        follow: bool = False, since_seconds: Optional[int] = None,
+                        limit_bytes: Optional[int] = None, tail_lines: Optional[int] = None):
+        """Open a streaming log iterator; raises ApiException if the pod cannot be read"""
+        return self._k8s().stream_pod_logs(
+            name, namespace,
+            container=container,
+            follow=follow,
+            since_seconds=since_seconds,
+            limit_bytes=limit_bytes,
+            tail_lines=tail_lines
+        )
+    
+    def list_services(self, namespace: str = "default", label_selector: Optional[str] = None,
+                      field_selector: Optional[str] = None, resource_version: Optional[str] = None,
+                      resource_version_match: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List services; selectors are applied by the apiserver"""
         try:
-            return self.k8s_client.list_services(namespace)
+            return self._k8s().list_services(namespace, label_selector=label_selector, field_selector=field_selector,
+                                             resource_version=resource_version,
+                                             resource_version_match=resource_version_match)
+        except ApiException:
+            # Invalid selectors or an expired resourceVersion are reported to the caller
+            raise
         except Exception as e:
             logger.error(f"Failed to list services: {e}")
             return []
     
-    def list_deployments(self, namespace: str = "default") -> List[Dict[str, Any]]:
-        """List deployments"""
-        if self.simulation_mode or not self.k8s_client:
-            return []
-        
+    def list_deployments(self, namespace: str = "default", label_selector: Optional[str] = None,
+                         field_selector: Optional[str] = None, resource_version: Optional[str] = None,
+                         resource_version_match: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List deployments; selectors are applied by the apiserver"""
         try:
-            return self.k8s_client.list_deployments(namespace)
+            return self._k8s().list_deployments(namespace, label_selector=label_selector, field_selector=field_selector,
+                                                resource_version=resource_version,
+                                                resource_version_match=resource_version_match)
+        except ApiException:
+            # Invalid selectors or an expired resourceVersion are reported to the caller
+            raise
         except Exception as e:
             logger.error(f"Failed to list deployments: {e}")
             return []
     
-    def list_namespaces(self) -> List[str]:
-        """List namespaces"""
-        if self.simulation_mode or not self.k8s_client:
-            return ["default", "kube-system"]
+    def list_resource_page(self, kind: str, namespace: Optional[str] = None, limit: int = 100,
+                           continue_token: Optional[str] = None, **filters) -> Dict[str, Any]:
+        """
+        List one page of pods/services/deployments/namespaces; raises ApiException on apiserver errors
         
+        filters: label_selector, field_selector, resource_version, resource_version_match
+        """
+        return self._k8s().list_page(kind, namespace, limit=limit, continue_token=continue_token, **filters)
+    
+    def iter_resource_pages(self, kind: str, namespace: Optional[str] = None, page_size: int = 500, **filters):
+        """Yield converted pages of a resource kind; filters as for list_resource_page"""
+        yield from self._k8s().iter_pages(kind, namespace, page_size=page_size, **filters)
+    
+    def list_namespaces(self, label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                        resource_version: Optional[str] = None,
+                        resource_version_match: Optional[str] = None) -> List[str]:
+        """List namespaces"""
         try:
-            return self.k8s_client.list_namespaces()
+            return self._k8s().list_namespaces(label_selector=label_selector, field_selector=field_selector,
+                                               resource_version=resource_version,
+                                               resource_version_match=resource_version_match)
+        except ApiException:
+            raise
         except Exception as e:
             logger.error(f"Failed to list namespaces: {e}")
             return []
@@ -397,5 +1153,7 @@ class GameManager:
         pass
 
 
+instrument_class(GameManager)
+
 # Global game manager instance
 game_manager = GameManager()
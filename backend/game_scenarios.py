@@ -3,8 +3,11 @@ Game Scenarios for KubeChaos
 Pre-defined chaos engineering scenarios with objectives and scoring
 """
 
-from typing import Dict, List, Any
+from typing import Dict, Iterable, List, Optional, Any
 from enum import Enum
+import hashlib
+import json
+import threading
 
 
 class Difficulty(str, Enum):
@@ -25,6 +28,9 @@ class ScenarioCategory(str, Enum):
 class GameScenario:
     """Represents a game scenario with chaos experiments"""
     
+    __slots__ = ("id", "name", "description", "difficulty", "category", "learning_objectives",
+                 "chaos_config", "success_criteria", "hints", "time_limit_seconds", "max_score")
+    
     def __init__(
         self,
         id: str,
@@ -440,6 +446,96 @@ SCENARIO_CASCADE_FAILURE = GameScenario(
 )
 
 
+def encode_json(value: Any) -> bytes:
+    """JSON bytes exactly as FastAPI's JSONResponse would render value"""
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+class ScenarioRegistry:
+    """
+    Scenarios indexed by id, difficulty and category.
+    
+    Each scenario is encoded to JSON once when registered; listings are the
+    concatenation of those bytes, built on first use and kept until the set
+    of scenarios changes. Registering a scenario whose id exists replaces it.
+    """
+    
+    def __init__(self, scenarios: Iterable[GameScenario] = ()):
+        self._lock = threading.Lock()
+        self._by_id: Dict[str, GameScenario] = {}
+        self._json: Dict[str, bytes] = {}
+        self._by_difficulty: Dict[Difficulty, List[GameScenario]] = {}
+        self._by_category: Dict[ScenarioCategory, List[GameScenario]] = {}
+        # (difficulty or None) -> (listing bytes, ETag)
+        self._listings: Dict[Optional[Difficulty], tuple] = {}
+        self.register(*scenarios)
+    
+    def register(self, *scenarios: GameScenario):
+        self.update(add=scenarios)
+    
+    def unregister(self, *scenario_ids: str):
+        self.update(remove=scenario_ids)
+    
+    def update(self, add: Iterable[GameScenario] = (), remove: Iterable[str] = ()):
+        """
+        Remove, then add, scenarios as one change with a single reindex.
+        New indexes are built aside and swapped in, so readers never see a
+        half-applied update
+        """
+        encoded = [(scenario, encode_json(scenario.to_dict())) for scenario in add]
+        with self._lock:
+            by_id = dict(self._by_id)
+            json_bodies = dict(self._json)
+            for scenario_id in remove:
+                by_id.pop(scenario_id, None)
+                json_bodies.pop(scenario_id, None)
+            for scenario, body in encoded:
+                by_id[scenario.id] = scenario
+                json_bodies[scenario.id] = body
+            
+            by_difficulty: Dict[Difficulty, List[GameScenario]] = {}
+            by_category: Dict[ScenarioCategory, List[GameScenario]] = {}
+            for scenario in by_id.values():
+                by_difficulty.setdefault(scenario.difficulty, []).append(scenario)
+                by_category.setdefault(scenario.category, []).append(scenario)
+            
+            self._by_id, self._json = by_id, json_bodies
+            self._by_difficulty, self._by_category = by_difficulty, by_category
+            self._listings = {}
+    
+    def __len__(self) -> int:
+        return len(self._by_id)
+    
+    def __contains__(self, scenario_id: str) -> bool:
+        return scenario_id in self._by_id
+    
+    def get(self, scenario_id: str) -> Optional[GameScenario]:
+        return self._by_id.get(scenario_id)
+    
+    def all(self) -> List[GameScenario]:
+        return list(self._by_id.values())
+    
+    def by_difficulty(self, difficulty: Difficulty) -> List[GameScenario]:
+        return list(self._by_difficulty.get(difficulty, ()))
+    
+    def by_category(self, category: ScenarioCategory) -> List[GameScenario]:
+        return list(self._by_category.get(category, ()))
+    
+    def scenario_json(self, scenario_id: str) -> Optional[bytes]:
+        return self._json.get(scenario_id)
+    
+    def listing(self, difficulty: Optional[Difficulty] = None) -> tuple:
+        """(JSON array bytes, strong ETag) for all scenarios or one difficulty"""
+        listing = self._listings.get(difficulty)
+        if listing is None:
+            with self._lock:
+                scenarios = self._by_id.values() if difficulty is None else self._by_difficulty.get(difficulty, ())
+                body = b"[" + b",".join(self._json[s.id] for s in scenarios) + b"]"
+                listing = (body, f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+                self._listings[difficulty] = listing
+        return listing
+
+
 # Scenario Registry
 ALL_SCENARIOS = [
     SCENARIO_POD_KILL_BASIC,
@@ -452,23 +548,22 @@ ALL_SCENARIOS = [
     SCENARIO_CASCADE_FAILURE
 ]
 
+registry = ScenarioRegistry(ALL_SCENARIOS)
+
 
 def get_scenario_by_id(scenario_id: str) -> GameScenario:
     """Get scenario by ID"""
-    for scenario in ALL_SCENARIOS:
-        if scenario.id == scenario_id:
-            return scenario
-    return None
+    return registry.get(scenario_id)
 
 
 def get_scenarios_by_difficulty(difficulty: Difficulty) -> List[GameScenario]:
     """Get all scenarios of a specific difficulty"""
-    return [s for s in ALL_SCENARIOS if s.difficulty == difficulty]
+    return registry.by_difficulty(difficulty)
 
 
 def get_scenarios_by_category(category: ScenarioCategory) -> List[GameScenario]:
     """Get all scenarios in a category"""
-    return [s for s in ALL_SCENARIOS if s.category == category]
+    return registry.by_category(category)
 
 
 def get_beginner_scenarios() -> List[GameScenario]:
@@ -3,24 +3,324 @@ Kubernetes Client for KubeChaos Game
 Handles connection to Kubernetes cluster and resource operations
 """
 
-from kubernetes import client, config
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
-from typing import Dict, List, Optional, Any
+from kubernetes.utils import parse_quantity
+from metrics import instrument_api_client, LIST_CACHE_REQUESTS
+from tracing import instrument_class
+from typing import Callable, Dict, Iterator, List, Optional, Any
+from datetime import datetime, timezone
+import copy
+import kubectl
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 
+class ResourceInformer:
+    """
+    Keeps an in-memory copy of one resource kind in one namespace.
+
+    The informer lists the resource once, then follows a watch stream from the
+    returned resourceVersion. When the watch times out it resumes from the last
+    seen resourceVersion; when the apiserver answers 410 Gone it lists again.
+    """
+
+    def __init__(self, kind: str, namespace: str, list_func: Callable,
+                 converter: Callable[[Any], Dict[str, Any]],
+                 watch_timeout_seconds: int = 300, retry_seconds: float = 5.0):
+        self.kind = kind
+        self.namespace = namespace
+        self.list_func = list_func
+        self.converter = converter
+        self.watch_timeout_seconds = watch_timeout_seconds
+        self.retry_seconds = retry_seconds
+
+        self._store: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[watch.Watch] = None
+        self._resource_version: Optional[str] = None
+        self._listeners: List[Callable] = []
+
+        # Last list() or get(), so idle informers can be stopped
+        self.last_read = time.monotonic()
+
+        # Metrics
+        self.last_sync: Optional[float] = None
+        self.last_event: Optional[float] = None
+        self.last_watch_start: Optional[float] = None
+        self.last_event_lag: float = 0.0
+        self.max_event_lag: float = 0.0
+        self.events_total = 0
+        self.relists_total = 0
+        self.errors_total = 0
+
+    def start(self):
+        """Start the list/watch loop in a background thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"informer-{self.kind}-{self.namespace}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the watch loop"""
+        self._stopped.set()
+        if self._watch:
+            self._watch.stop()
+
+    def has_synced(self) -> bool:
+        """True once the initial list has been stored"""
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout: Optional[float] = None) -> bool:
+        """Block until the initial list has been stored"""
+        return self._synced.wait(timeout)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Return copies of all cached objects, ordered by name"""
+        self.last_read = time.monotonic()
+        with self._lock:
+            items = sorted(self._store.items())
+        # Callers get their own copies, so changing a result cannot corrupt the store
+        return [copy.deepcopy(obj) for _, obj in items]
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached object by name"""
+        self.last_read = time.monotonic()
+        with self._lock:
+            obj = self._store.get(name)
+        return copy.deepcopy(obj) if obj is not None else None
+
+    def has_listeners(self) -> bool:
+        return bool(self._listeners)
+
+    def add_listener(self, listener: Callable[[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]], None]):
+        """Call listener(event_type, old, new) for every change to the store"""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, event_type: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]):
+        for listener in list(self._listeners):
+            try:
+                listener(event_type, old, new)
+            except Exception as e:
+                logger.error(f"{self.kind} informer listener failed: {e}")
+
+    def metrics(self) -> Dict[str, Any]:
+        """Staleness and event-lag metrics for this informer"""
+        now = time.monotonic()
+        last_seen = max((t for t in (self.last_sync, self.last_event, self.last_watch_start) if t is not None),
+                        default=None)
+        with self._lock:
+            objects = len(self._store)
+        return {
+            "kind": self.kind,
+            "namespace": self.namespace,
+            "synced": self.has_synced(),
+            "objects": objects,
+            "resource_version": self._resource_version,
+            "staleness_seconds": round(now - last_seen, 3) if last_seen is not None else None,
+            "last_event_lag_seconds": round(self.last_event_lag, 3),
+            "max_event_lag_seconds": round(self.max_event_lag, 3),
+            "events_total": self.events_total,
+            "relists_total": self.relists_total,
+            "errors_total": self.errors_total
+        }
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                if self._resource_version is None:
+                    self._relist()
+                self._watch_once()
+            except ApiException as e:
+                if e.status == 410:
+                    logger.info(f"{self.kind} watch in {self.namespace} expired, relisting")
+                    self._resource_version = None
+                    continue
+                self.errors_total += 1
+                logger.error(f"{self.kind} informer error in {self.namespace}: {e}")
+                self._stopped.wait(self.retry_seconds)
+            except Exception as e:
+                self.errors_total += 1
+                logger.error(f"{self.kind} informer error in {self.namespace}: {e}")
+                self._stopped.wait(self.retry_seconds)
+
+    def _relist(self):
+        result = self.list_func(namespace=self.namespace)
+        store = {item.metadata.name: self.converter(item) for item in result.items}
+        with self._lock:
+            old_store = self._store
+            self._store = store
+            self._resource_version = result.metadata.resource_version
+        self.last_sync = time.monotonic()
+        self.relists_total += 1
+        self._synced.set()
+
+        # Changes missed while the watch was down surface as ordinary events
+        if self._listeners:
+            for name, obj in store.items():
+                old = old_store.get(name)
+                if old != obj:
+                    self._notify("MODIFIED" if old else "ADDED", old, obj)
+            for name, old in old_store.items():
+                if name not in store:
+                    self._notify("DELETED", old, None)
+
+    def _watch_once(self):
+        self._watch = watch.Watch()
+        self.last_watch_start = time.monotonic()
+        for event in self._watch.stream(
+            self.list_func,
+            namespace=self.namespace,
+            resource_version=self._resource_version,
+            timeout_seconds=self.watch_timeout_seconds,
+            allow_watch_bookmarks=True
+        ):
+            if self._stopped.is_set():
+                break
+
+            event_type = event["type"]
+            obj = event["object"]
+
+            if event_type == "ERROR":
+                code = obj.get("code") if isinstance(obj, dict) else None
+                if code == 410:
+                    self._resource_version = None
+                    break
+                raise ApiException(status=code, reason=str(obj))
+
+            if event_type == "BOOKMARK":
+                self._resource_version = obj.metadata.resource_version
+                self.last_event = time.monotonic()
+                continue
+
+            with self._lock:
+                if event_type == "DELETED":
+                    old = self._store.pop(obj.metadata.name, None)
+                    new = None
+                else:
+                    old = self._store.get(obj.metadata.name)
+                    new = self._store[obj.metadata.name] = self.converter(obj)
+                self._resource_version = obj.metadata.resource_version
+
+            self.last_event = time.monotonic()
+            self.events_total += 1
+            self._record_lag(obj)
+            if self._listeners:
+                self._notify(event_type, old, new)
+
+        self._watch.stop()
+
+    def _record_lag(self, obj):
+        """Measure the delay between the apiserver write and our receipt of the event"""
+        written = obj.metadata.creation_timestamp
+        for entry in obj.metadata.managed_fields or []:
+            if entry.time and (written is None or entry.time > written):
+                written = entry.time
+        if obj.metadata.deletion_timestamp:
+            written = obj.metadata.deletion_timestamp
+        if not written:
+            return
+
+        lag = max(0.0, (datetime.now(timezone.utc) - written).total_seconds())
+        self.last_event_lag = lag
+        self.max_event_lag = max(self.max_event_lag, lag)
+
+
+class LogStream:
+    """
+    Iterator over raw log chunks as the apiserver sends them.
+    
+    Nothing is buffered beyond the current chunk. close() releases the
+    connection and may be called from another thread to end a blocked read,
+    e.g. when the HTTP client that requested the stream disconnects.
+    """
+
+    def __init__(self, response, chunk_size: int = 8192):
+        self._response = response
+        if response.chunked and response.supports_chunked_reads():
+            # Forward each chunk as soon as it arrives (follow mode)
+            self._chunks = response.read_chunked(decode_content=False)
+        else:
+            self._chunks = response.stream(chunk_size, decode_content=False)
+        self.closed = False
+        self.bytes_sent = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        if self.closed:
+            raise StopIteration
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            self.close()
+            raise
+        except Exception:
+            if self.closed:
+                raise StopIteration
+            self.close()
+            raise
+        self.bytes_sent += len(chunk)
+        return chunk
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self._response.close()
+            self._response.release_conn()
+        except Exception as e:
+            logger.debug(f"Error closing log stream: {e}")
+
+
 class KubernetesClient:
     """Client for interacting with Kubernetes API"""
     
-    def __init__(self, kubeconfig_path: Optional[str] = None):
+    # Objects per apiserver list call when listing everything (kubectl's default chunk size)
+    LIST_PAGE_SIZE = 500
+    
+    # List errors caused by the request (bad selector, expired resourceVersion) that are
+    # raised to the caller instead of being logged and returned as an empty list
+    CALLER_ERRORS = (400, 410)
+    
+    def __init__(self, kubeconfig_path: Optional[str] = None, use_informers: bool = False,
+                 connection_pool_maxsize: int = 64, informer_namespaces: Optional[List[str]] = None,
+                 max_informers: int = 30, informer_idle_timeout: float = 600.0):
         """
         Initialize Kubernetes client
         
         Args:
             kubeconfig_path: Path to kubeconfig file. If None, uses default location
+            use_informers: Serve pod/service/deployment lists from watch-backed caches
+            connection_pool_maxsize: Keep-alive connections shared by all API groups
+            informer_namespaces: Namespaces whose lists may start an informer; None for any
+            max_informers: Informers started by list reads; further reads go to the apiserver
+            informer_idle_timeout: Seconds without reads or listeners after which an informer is stopped
         """
+        self.use_informers = use_informers
+        self.informer_namespaces = set(informer_namespaces) if informer_namespaces is not None else None
+        self.max_informers = max_informers
+        self.informer_idle_timeout = informer_idle_timeout
+        self._informers: Dict[tuple, ResourceInformer] = {}
+        self._informers_lock = threading.Lock()
+        
         try:
             if kubeconfig_path:
                 config.load_kube_config(config_file=kubeconfig_path)
@@ -33,9 +333,15 @@ class KubernetesClient:
                     config.load_kube_config()
                     logger.info("Loaded Kubernetes config from kubeconfig")
             
-            self.core_v1 = client.CoreV1Api()
-            self.apps_v1 = client.AppsV1Api()
-            self.custom_objects = client.CustomObjectsApi()
+            # One ApiClient (and one connection pool) shared by every API group
+            configuration = client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = connection_pool_maxsize
+            self.api_client = instrument_api_client(client.ApiClient(configuration))
+            
+            self.core_v1 = client.CoreV1Api(self.api_client)
+            self.apps_v1 = client.AppsV1Api(self.api_client)
+            self.custom_objects = client.CustomObjectsApi(self.api_client)
+            self.version_api = client.VersionApi(self.api_client)
             self.connected = True
             logger.info("Kubernetes client initialized successfully")
             
@@ -60,7 +366,7 @@ class KubernetesClient:
     def get_cluster_info(self) -> Dict[str, Any]:
         """Get basic cluster information"""
         try:
-            version = client.VersionApi().get_code()
+            version = self.version_api.get_code()
             nodes = self.core_v1.list_node()
             
             return {
@@ -74,27 +380,26 @@ class KubernetesClient:
             return {"connected": False, "error": str(e)}
     
     # Pod Operations
-    def list_pods(self, namespace: str = "default", label_selector: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List pods in a namespace"""
+    def list_pods(self, namespace: str = "default", label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None, all_namespaces: bool = False,
+                  resource_version: Optional[str] = None,
+                  resource_version_match: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List pods in a namespace, or in all namespaces; selectors are applied by the apiserver"""
+        if self._cacheable(label_selector, field_selector, all_namespaces, resource_version):
+            cached = self._cached_list("pods", namespace)
+            if cached is not None:
+                return cached
+        
         try:
-            pods = self.core_v1.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=label_selector
-            )
-            
-            return [{
-                "name": pod.metadata.name,
-                "namespace": pod.metadata.namespace,
-                "status": pod.status.phase,
-                "ready": sum(1 for c in pod.status.container_statuses if c.ready) if pod.status.container_statuses else 0,
-                "total_containers": len(pod.spec.containers),
-                "node": pod.spec.node_name,
-                "ip": pod.status.pod_ip,
-                "labels": pod.metadata.labels or {},
-                "created": pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else None
-            } for pod in pods.items]
+            return [pod for page in self.iter_pages("pods", namespace, label_selector=label_selector,
+                                                    field_selector=field_selector, all_namespaces=all_namespaces,
+                                                    resource_version=resource_version,
+                                                    resource_version_match=resource_version_match)
+                    for pod in page]
             
         except ApiException as e:
+            if e.status in self.CALLER_ERRORS:
+                raise
             logger.error(f"Failed to list pods: {e}")
             return []
     
@@ -145,6 +450,27 @@ class KubernetesClient:
             logger.error(f"Failed to get logs for pod {name}: {e}")
             return f"Error getting logs: {e.reason}"
     
+    def stream_pod_logs(self, name: str, namespace: str = "default", container: Optional[str] = None,
+                        follow: bool = False, since_seconds: Optional[int] = None,
+                        limit_bytes: Optional[int] = None, tail_lines: Optional[int] = None) -> LogStream:
+        """
+        Open a streaming log request for a pod
+        
+        Raises ApiException before any data is read if the pod or container
+        does not exist, so callers can report a proper error status.
+        """
+        response = self.core_v1.read_namespaced_pod_log(
+            name=name,
+            namespace=namespace,
+            container=container,
+            follow=follow,
+            since_seconds=since_seconds,
+            limit_bytes=limit_bytes,
+            tail_lines=tail_lines,
+            _preload_content=False
+        )
+        return LogStream(response)
+    
     def delete_pod(self, name: str, namespace: str = "default") -> bool:
         """Delete a pod"""
         try:
@@ -156,46 +482,80 @@ class KubernetesClient:
             return False
     
     # Service Operations
-    def list_services(self, namespace: str = "default") -> List[Dict[str, Any]]:
-        """List services in a namespace"""
+    def list_services(self, namespace: str = "default", label_selector: Optional[str] = None,
+                      field_selector: Optional[str] = None, all_namespaces: bool = False,
+                      resource_version: Optional[str] = None,
+                      resource_version_match: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List services in a namespace, or in all namespaces; selectors are applied by the apiserver"""
+        if self._cacheable(label_selector, field_selector, all_namespaces, resource_version):
+            cached = self._cached_list("services", namespace)
+            if cached is not None:
+                return cached
+        
         try:
-            services = self.core_v1.list_namespaced_service(namespace=namespace)
-            
-            return [{
-                "name": svc.metadata.name,
-                "namespace": svc.metadata.namespace,
-                "type": svc.spec.type,
-                "cluster_ip": svc.spec.cluster_ip,
-                "ports": [{"port": p.port, "target_port": str(p.target_port), "protocol": p.protocol} 
-                         for p in svc.spec.ports] if svc.spec.ports else [],
-                "selector": svc.spec.selector or {},
-                "labels": svc.metadata.labels or {}
-            } for svc in services.items]
+            return [svc for page in self.iter_pages("services", namespace, label_selector=label_selector,
+                                                    field_selector=field_selector, all_namespaces=all_namespaces,
+                                                    resource_version=resource_version,
+                                                    resource_version_match=resource_version_match)
+                    for svc in page]
             
         except ApiException as e:
+            if e.status in self.CALLER_ERRORS:
+                raise
             logger.error(f"Failed to list services: {e}")
             return []
     
     # Deployment Operations
-    def list_deployments(self, namespace: str = "default") -> List[Dict[str, Any]]:
-        """List deployments in a namespace"""
+    def list_deployments(self, namespace: str = "default", label_selector: Optional[str] = None,
+                         field_selector: Optional[str] = None, all_namespaces: bool = False,
+                         resource_version: Optional[str] = None,
+                         resource_version_match: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List deployments in a namespace, or in all namespaces; selectors are applied by the apiserver"""
+        if self._cacheable(label_selector, field_selector, all_namespaces, resource_version):
+            cached = self._cached_list("deployments", namespace)
+            if cached is not None:
+                return cached
+        
         try:
-            deployments = self.apps_v1.list_namespaced_deployment(namespace=namespace)
-            
-            return [{
-                "name": dep.metadata.name,
-                "namespace": dep.metadata.namespace,
-                "replicas": dep.spec.replicas,
-                "ready_replicas": dep.status.ready_replicas or 0,
-                "available_replicas": dep.status.available_replicas or 0,
-                "labels": dep.metadata.labels or {},
-                "selector": dep.spec.selector.match_labels if dep.spec.selector else {}
-            } for dep in deployments.items]
+            return [dep for page in self.iter_pages("deployments", namespace, label_selector=label_selector,
+                                                    field_selector=field_selector, all_namespaces=all_namespaces,
+                                                    resource_version=resource_version,
+                                                    resource_version_match=resource_version_match)
+                    for dep in page]
             
         except ApiException as e:
+            if e.status in self.CALLER_ERRORS:
+                raise
             logger.error(f"Failed to list deployments: {e}")
             return []
     
+    def get_deployment(self, name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
+        """Get a deployment with the rollout progress fields kubectl rollout status uses"""
+        try:
+            dep = self.apps_v1.read_namespaced_deployment(name=name, namespace=namespace)
+            return {
+                **self._deployment_to_dict(dep),
+                "updated_replicas": dep.status.updated_replicas or 0,
+                "generation": dep.metadata.generation,
+                "observed_generation": dep.status.observed_generation
+            }
+        except ApiException as e:
+            logger.error(f"Failed to get deployment {name}: {e}")
+            return None
+    
+    def restart_deployment(self, name: str, namespace: str = "default") -> bool:
+        """Trigger a rolling restart the way kubectl rollout restart does"""
+        body = {"spec": {"template": {"metadata": {"annotations": {
+            "kubectl.kubernetes.io/restartedAt": datetime.now(timezone.utc).isoformat()
+        }}}}}
+        try:
+            self.apps_v1.patch_namespaced_deployment(name=name, namespace=namespace, body=body)
+            logger.info(f"Restarted deployment {name} in namespace {namespace}")
+            return True
+        except ApiException as e:
+            logger.error(f"Failed to restart deployment {name}: {e}")
+            return False
+    
     def scale_deployment(self, name: str, replicas: int, namespace: str = "default") -> bool:
         """Scale a deployment"""
         try:
@@ -208,13 +568,60 @@ class KubernetesClient:
             logger.error(f"Failed to scale deployment {name}: {e}")
             return False
     
+    # Metrics Operations
+    def get_pod_metrics(self, namespace: str = "default", label_selector: Optional[str] = None,
+                        all_namespaces: bool = False) -> Optional[List[Dict[str, Any]]]:
+        """
+        Pod CPU (millicores) and memory (bytes) from the metrics API
+        
+        Returns None when metrics-server is not installed.
+        """
+        try:
+            if all_namespaces:
+                result = self.custom_objects.list_cluster_custom_object(
+                    "metrics.k8s.io", "v1beta1", "pods", label_selector=label_selector)
+            else:
+                result = self.custom_objects.list_namespaced_custom_object(
+                    "metrics.k8s.io", "v1beta1", namespace, "pods", label_selector=label_selector)
+        except ApiException as e:
+            logger.error(f"Failed to get pod metrics: {e}")
+            return None
+        
+        return [{
+            "name": item["metadata"]["name"],
+            "namespace": item["metadata"].get("namespace"),
+            "cpu_millicores": int(sum(parse_quantity(c["usage"]["cpu"]) for c in item.get("containers", [])) * 1000),
+            "memory_bytes": int(sum(parse_quantity(c["usage"]["memory"]) for c in item.get("containers", [])))
+        } for item in result.get("items", [])]
+    
+    def get_node_metrics(self) -> Optional[List[Dict[str, Any]]]:
+        """Node CPU (millicores) and memory (bytes) from the metrics API; None without metrics-server"""
+        try:
+            result = self.custom_objects.list_cluster_custom_object("metrics.k8s.io", "v1beta1", "nodes")
+        except ApiException as e:
+            logger.error(f"Failed to get node metrics: {e}")
+            return None
+        
+        return [{
+            "name": item["metadata"]["name"],
+            "cpu_millicores": int(parse_quantity(item["usage"]["cpu"]) * 1000),
+            "memory_bytes": int(parse_quantity(item["usage"]["memory"]))
+        } for item in result.get("items", [])]
+    
     # Namespace Operations
-    def list_namespaces(self) -> List[str]:
+    def list_namespaces(self, label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                        resource_version: Optional[str] = None,
+                        resource_version_match: Optional[str] = None) -> List[str]:
         """List all namespaces"""
         try:
-            namespaces = self.core_v1.list_namespace()
-            return [ns.metadata.name for ns in namespaces.items]
+            return [ns for page in self.iter_pages("namespaces", label_selector=label_selector,
+                                                   field_selector=field_selector,
+                                                   resource_version=resource_version,
+                                                   resource_version_match=resource_version_match)
+                    for ns in page]
         except ApiException as e:
+            if e.status in self.CALLER_ERRORS:
+                raise
             logger.error(f"Failed to list namespaces: {e}")
             return []
     
@@ -231,126 +638,266 @@ class KubernetesClient:
             logger.error(f"Failed to create namespace {name}: {e}")
             return False
     
-    # Helper Methods
-    def _get_container_state(self, state) -> str:
-        """Extract container state from status"""
-        if state.running:
-            return "running"
-        elif state.waiting:
-            return f"waiting: {state.waiting.reason}"
-        elif state.terminated:
-            return f"terminated: {state.terminated.reason}"
-        return "unknown"
+    # Paginated Listing
+    def _list_func(self, kind: str, all_namespaces: bool = False):
+        """Return (list function, converter, namespaced) for a resource kind"""
+        if all_namespaces:
+            kinds = {
+                "pods": (self.core_v1.list_pod_for_all_namespaces, self._pod_to_dict, False),
+                "services": (self.core_v1.list_service_for_all_namespaces, self._service_to_dict, False),
+                "deployments": (self.apps_v1.list_deployment_for_all_namespaces, self._deployment_to_dict, False),
+                "namespaces": (self.core_v1.list_namespace, self._namespace_to_name, False)
+            }
+        else:
+            kinds = {
+                "pods": (self.core_v1.list_namespaced_pod, self._pod_to_dict, True),
+                "services": (self.core_v1.list_namespaced_service, self._service_to_dict, True),
+                "deployments": (self.apps_v1.list_namespaced_deployment, self._deployment_to_dict, True),
+                "namespaces": (self.core_v1.list_namespace, self._namespace_to_name, False)
+            }
+        if kind not in kinds:
+            raise ValueError(f"Unsupported resource kind: {kind}")
+        return kinds[kind]
     
-    def execute_kubectl_command(self, command: str, namespace: str = "default") -> Dict[str, Any]:
-        """
-        Simulate kubectl command execution
-        This is a simplified version - in production, you'd parse and execute actual commands
+    def list_page(self, kind: str, namespace: Optional[str] = None, limit: int = LIST_PAGE_SIZE,
+                  continue_token: Optional[str] = None, label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None, all_namespaces: bool = False,
+                  resource_version: Optional[str] = None,
+                  resource_version_match: Optional[str] = None) -> Dict[str, Any]:
         """
-        parts = command.strip().split()
+        List one page of a resource kind using the apiserver's limit/continue
         
-        if len(parts) < 2 or parts[0] != "kubectl":
-            return {"error": "Invalid kubectl command"}
+        Selectors are evaluated by the apiserver. resource_version and
+        resource_version_match apply to the first page only; continued pages
+        are served from the snapshot the continue token points at.
         
-        action = parts[1]
+        Returns:
+            {"items": [...], "continue": token or None, "remaining": count or None}
         
-        try:
-            if action == "get":
-                if len(parts) < 3:
-                    return {"error": "Missing resource type"}
-                
-                resource_type = parts[2]
-                
-                if resource_type in ["pod", "pods"]:
-                    pods = self.list_pods(namespace=namespace)
-                    return {"output": self._format_pods_table(pods), "success": True}
-                
-                elif resource_type in ["service", "services", "svc"]:
-                    services = self.list_services(namespace=namespace)
-                    return {"output": self._format_services_table(services), "success": True}
-                
-                elif resource_type in ["deployment", "deployments", "deploy"]:
-                    deployments = self.list_deployments(namespace=namespace)
-                    return {"output": self._format_deployments_table(deployments), "success": True}
-            
-            elif action == "logs":
-                if len(parts) < 3:
-                    return {"error": "Missing pod name"}
-                pod_name = parts[2]
-                logs = self.get_pod_logs(pod_name, namespace=namespace)
-                return {"output": logs, "success": True}
-            
-            elif action == "describe":
-                if len(parts) < 4:
-                    return {"error": "Missing resource type or name"}
-                resource_type = parts[2]
-                resource_name = parts[3]
-                
-                if resource_type == "pod":
-                    pod = self.get_pod(resource_name, namespace=namespace)
-                    if pod:
-                        return {"output": self._format_pod_describe(pod), "success": True}
-                    return {"error": f"Pod {resource_name} not found"}
-            
-            return {"error": f"Command '{action}' not yet implemented"}
-            
-        except Exception as e:
-            return {"error": str(e), "success": False}
-    
-    def _format_pods_table(self, pods: List[Dict]) -> str:
-        """Format pods as kubectl-style table"""
-        if not pods:
-            return "No resources found"
+        Raises ApiException, e.g. 410 Gone when the continue token has expired.
+        """
+        list_func, converter, namespaced = self._list_func(kind, all_namespaces)
         
-        lines = ["NAME                          READY   STATUS    RESTARTS   AGE"]
-        for pod in pods:
-            ready = f"{pod['ready']}/{pod['total_containers']}"
-            lines.append(f"{pod['name']:<30} {ready:<7} {pod['status']:<9} 0          1d")
+        kwargs = {"limit": limit, "label_selector": label_selector}
+        if field_selector:
+            kwargs["field_selector"] = field_selector
+        if namespaced:
+            kwargs["namespace"] = namespace or "default"
+        if continue_token:
+            kwargs["_continue"] = continue_token
+        elif resource_version is not None:
+            kwargs["resource_version"] = resource_version
+            if resource_version_match:
+                kwargs["resource_version_match"] = resource_version_match
         
-        return "\n".join(lines)
+        result = list_func(**kwargs)
+        return {
+            "items": [converter(item) for item in result.items],
+            "continue": result.metadata._continue or None,
+            "remaining": result.metadata.remaining_item_count,
+            "resource_version": result.metadata.resource_version
+        }
     
-    def _format_services_table(self, services: List[Dict]) -> str:
-        """Format services as kubectl-style table"""
-        if not services:
-            return "No resources found"
-        
-        lines = ["NAME                TYPE        CLUSTER-IP      PORT(S)"]
-        for svc in services:
-            ports = ",".join([f"{p['port']}/{p['protocol']}" for p in svc['ports']])
-            lines.append(f"{svc['name']:<20} {svc['type']:<11} {svc['cluster_ip']:<15} {ports}")
+    def iter_pages(self, kind: str, namespace: Optional[str] = None, page_size: int = LIST_PAGE_SIZE,
+                   label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                   all_namespaces: bool = False, resource_version: Optional[str] = None,
+                   resource_version_match: Optional[str] = None) -> Iterator[List[Any]]:
+        """
+        Yield converted pages until the listing is exhausted
         
-        return "\n".join(lines)
+        Only one page of raw API objects is held in memory at a time.
+        """
+        continue_token = None
+        while True:
+            page = self.list_page(kind, namespace, limit=page_size, continue_token=continue_token,
+                                  label_selector=label_selector, field_selector=field_selector,
+                                  all_namespaces=all_namespaces, resource_version=resource_version,
+                                  resource_version_match=resource_version_match)
+            yield page["items"]
+            continue_token = page["continue"]
+            if not continue_token:
+                break
     
-    def _format_deployments_table(self, deployments: List[Dict]) -> str:
-        """Format deployments as kubectl-style table"""
-        if not deployments:
-            return "No resources found"
-        
-        lines = ["NAME                READY   UP-TO-DATE   AVAILABLE   AGE"]
-        for dep in deployments:
-            ready = f"{dep['ready_replicas']}/{dep['replicas']}"
-            lines.append(f"{dep['name']:<20} {ready:<7} {dep['replicas']:<12} {dep['available_replicas']:<11} 1d")
+    # Informer Cache
+    @staticmethod
+    def _cacheable(label_selector: Optional[str], field_selector: Optional[str], all_namespaces: bool,
+                   resource_version: Optional[str]) -> bool:
+        """
+        Whether a list can be answered from the namespace's informer cache.
+        resourceVersion "0" means any version is acceptable, which the cache satisfies.
+        """
+        return not (label_selector or field_selector or all_namespaces) and resource_version in (None, "", "0")
+    
+    def _cached_list(self, kind: str, namespace: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the cached list for kind/namespace, or None if it must be fetched.
         
-        return "\n".join(lines)
-    
-    def _format_pod_describe(self, pod: Dict) -> str:
-        """Format pod details as kubectl describe output"""
-        lines = [
-            f"Name:         {pod['name']}",
-            f"Namespace:    {pod['namespace']}",
-            f"Status:       {pod['status']}",
-            f"IP:           {pod['ip']}",
-            f"Node:         {pod['node']}",
-            "",
-            "Containers:"
-        ]
+        The first read for a namespace starts its informer; reads fall through to
+        the apiserver until the initial list has been stored. Namespaces outside
+        informer_namespaces, and reads while max_informers are running, are
+        always listed directly, so a client cannot start a watch per namespace
+        it names.
+        """
+        if not self.use_informers:
+            return None
         
-        for container in pod['containers']:
-            lines.extend([
-                f"  {container['name']}:",
-                f"    State:         {container['state']}",
-                f"    Ready:         {container['ready']}",
-                f"    Restart Count: {container['restart_count']}"
-            ])
+        informer = self._get_informer(kind, namespace, required=False)
+        if informer is None:
+            LIST_CACHE_REQUESTS.inc(kind, "uncached")
+            return None
+        if not informer.has_synced():
+            LIST_CACHE_REQUESTS.inc(kind, "miss")
+            return None
+        LIST_CACHE_REQUESTS.inc(kind, "hit")
+        return informer.list()
+    
+    def _get_informer(self, kind: str, namespace: str, required: bool = True) -> Optional[ResourceInformer]:
+        """
+        Get or start the informer for kind/namespace. Unless required, none is
+        started for a namespace outside informer_namespaces or beyond max_informers
+        """
+        key = (kind, namespace)
+        with self._informers_lock:
+            informer = self._informers.get(key)
+            if informer is not None:
+                return informer
+            if not required and self.informer_namespaces is not None and namespace not in self.informer_namespaces:
+                return None
+            
+            self._stop_idle_informers()
+            if not required and len(self._informers) >= self.max_informers:
+                return None
+            list_func, converter, _ = self._list_func(kind)
+            informer = ResourceInformer(kind, namespace, list_func, converter)
+            informer.start()
+            self._informers[key] = informer
+            logger.info(f"Started {kind} informer for namespace {namespace}")
+            return informer
+    
+    def _stop_idle_informers(self):
+        """Stop informers nobody has read or listened to for informer_idle_timeout; caller holds the lock"""
+        now = time.monotonic()
+        for key, informer in list(self._informers.items()):
+            if not informer.has_listeners() and now - informer.last_read >= self.informer_idle_timeout:
+                del self._informers[key]
+                informer.stop()
+                logger.info(f"Stopped idle {informer.kind} informer for namespace {informer.namespace}")
+    
+    def add_pod_listener(self, namespace: str, listener: Callable) -> bool:
+        """
+        Watch pods in namespace and call listener(event_type, old, new) on changes.
+        False if informer_namespaces or max_informers rule out an informer for it
+        """
+        informer = self._get_informer("pods", namespace, required=False)
+        if informer is None:
+            return False
+        informer.last_read = time.monotonic()
+        informer.add_listener(listener)
+        return True
+    
+    def remove_pod_listener(self, namespace: str, listener: Callable):
+        with self._informers_lock:
+            informer = self._informers.get(("pods", namespace))
+        if informer:
+            informer.remove_listener(listener)
+            # Counts from here towards the idle timeout, so a reconnecting client finds it running
+            informer.last_read = time.monotonic()
+    
+    def warm_informers(self, namespaces: List[str], timeout: float = 10.0):
+        """Start informers for the given namespaces and wait for the initial lists"""
+        if not self.use_informers:
+            return
         
-        return "\n".join(lines)
+        informers = [self._get_informer(kind, ns)
+                     for ns in namespaces for kind in ("pods", "services", "deployments")]
+        deadline = time.monotonic() + timeout
+        for informer in informers:
+            informer.wait_for_sync(max(0.0, deadline - time.monotonic()))
+    
+    def informer_metrics(self) -> List[Dict[str, Any]]:
+        """Staleness and event-lag metrics for every running informer"""
+        with self._informers_lock:
+            informers = list(self._informers.values())
+        return [informer.metrics() for informer in informers]
+    
+    def stop_informers(self):
+        """Stop all running informers"""
+        with self._informers_lock:
+            informers = list(self._informers.values())
+            self._informers.clear()
+        for informer in informers:
+            informer.stop()
+    
+    def close(self):
+        """Stop the informers and close the connection pool; the client is unusable afterwards"""
+        self.stop_informers()
+        api_client = getattr(self, "api_client", None)
+        if api_client is not None:
+            api_client.close()
+    
+    # Helper Methods
+    @staticmethod
+    def _pod_to_dict(pod) -> Dict[str, Any]:
+        """Convert a V1Pod to the API representation"""
+        return {
+            "name": pod.metadata.name,
+            "namespace": pod.metadata.namespace,
+            "status": pod.status.phase,
+            "ready": sum(1 for c in pod.status.container_statuses if c.ready) if pod.status.container_statuses else 0,
+            "total_containers": len(pod.spec.containers),
+            "restarts": sum(c.restart_count for c in pod.status.container_statuses) if pod.status.container_statuses else 0,
+            "node": pod.spec.node_name,
+            "ip": pod.status.pod_ip,
+            "labels": pod.metadata.labels or {},
+            "created": pod.metadata.creation_timestamp.isoformat() if pod.metadata.creation_timestamp else None
+        }
+    
+    @staticmethod
+    def _service_to_dict(svc) -> Dict[str, Any]:
+        """Convert a V1Service to the API representation"""
+        return {
+            "name": svc.metadata.name,
+            "namespace": svc.metadata.namespace,
+            "type": svc.spec.type,
+            "cluster_ip": svc.spec.cluster_ip,
+            "ports": [{"port": p.port, "target_port": str(p.target_port), "protocol": p.protocol} 
+                     for p in svc.spec.ports] if svc.spec.ports else [],
+            "selector": svc.spec.selector or {},
+            "labels": svc.metadata.labels or {}
+        }
+    
+    @staticmethod
+    def _deployment_to_dict(dep) -> Dict[str, Any]:
+        """Convert a V1Deployment to the API representation"""
+        return {
+            "name": dep.metadata.name,
+            "namespace": dep.metadata.namespace,
+            "replicas": dep.spec.replicas,
+            "ready_replicas": dep.status.ready_replicas or 0,
+            "available_replicas": dep.status.available_replicas or 0,
+            "labels": dep.metadata.labels or {},
+            "selector": dep.spec.selector.match_labels if dep.spec.selector else {}
+        }
+    
+    @staticmethod
+    def _namespace_to_name(ns) -> str:
+        """Namespaces are listed by name only"""
+        return ns.metadata.name
+    
+    def _get_container_state(self, state) -> str:
+        """Extract container state from status"""
+        if state.running:
+            return "running"
+        elif state.waiting:
+            return f"waiting: {state.waiting.reason}"
+        elif state.terminated:
+            return f"terminated: {state.terminated.reason}"
+        return "unknown"
+    
+    def execute_kubectl_command(self, command: str, namespace: str = "default") -> Dict[str, Any]:
+        """Run a kubectl command line against this client; see kubectl.py for what is supported"""
+        return kubectl.execute(self, command, namespace)
+
+
+# Per-item converters are called once per object and would only add noise
+instrument_class(KubernetesClient, exclude=("_pod_to_dict", "_service_to_dict", "_deployment_to_dict", "_namespace_to_name"))
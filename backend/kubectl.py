@@ -0,0 +1,414 @@
+"""
+kubectl for KubeChaos
+Parses the kubectl subset the game supports and runs it against a KubernetesClient,
+turning namespace, label and field selector flags into server-side filters
+"""
+
+from kubernetes.client.rest import ApiException
+from typing import Callable, Dict, List, Optional, Tuple, Any
+from datetime import datetime, timezone
+import json
+import shlex
+import yaml
+
+HELP = """Available commands:
+  kubectl get pods|services|deployments [NAME] [-n NS | -A] [-l SELECTOR] [--field-selector SELECTOR] [-o wide|json|yaml]
+  kubectl describe pod|deployment NAME [-n NS]
+  kubectl logs POD [-c CONTAINER] [--tail N] [-n NS]
+  kubectl top pods [-n NS | -A] [-l SELECTOR]
+  kubectl top nodes
+  kubectl rollout status|restart deployment/NAME [-n NS]"""
+
+
+class KubectlError(Exception):
+    """A command that cannot be run; the message is shown to the player"""
+
+
+class ParsedCommand:
+    """A kubectl command line split into verb, positional arguments and flags"""
+
+    __slots__ = ("verb", "args", "namespace", "all_namespaces", "label_selector", "field_selector",
+                 "output", "container", "tail")
+
+    def __init__(self, verb: str, namespace: str):
+        self.verb = verb
+        self.args: List[str] = []
+        self.namespace = namespace
+        self.all_namespaces = False
+        self.label_selector: Optional[str] = None
+        self.field_selector: Optional[str] = None
+        self.output: Optional[str] = None
+        self.container: Optional[str] = None
+        self.tail: Optional[int] = None
+
+
+# Flag spelling -> (ParsedCommand attribute, takes a value)
+FLAGS: Dict[str, Tuple[str, bool]] = {
+    "-n": ("namespace", True),
+    "--namespace": ("namespace", True),
+    "-A": ("all_namespaces", False),
+    "--all-namespaces": ("all_namespaces", False),
+    "-l": ("label_selector", True),
+    "--selector": ("label_selector", True),
+    "--field-selector": ("field_selector", True),
+    "-o": ("output", True),
+    "--output": ("output", True),
+    "-c": ("container", True),
+    "--container": ("container", True),
+    "--tail": ("tail", True),
+}
+
+OUTPUT_FORMATS = ("wide", "json", "yaml")
+
+RESOURCE_ALIASES = {
+    "po": "pods", "pod": "pods", "pods": "pods",
+    "svc": "services", "service": "services", "services": "services",
+    "deploy": "deployments", "deployment": "deployments", "deployments": "deployments",
+    "no": "nodes", "node": "nodes", "nodes": "nodes",
+}
+
+SINGULAR = {"pods": "pod", "services": "service", "deployments": "deployment", "nodes": "node"}
+
+
+def parse(command: str, namespace: str = "default") -> ParsedCommand:
+    """Parse a kubectl command line; namespace is used unless -n or -A is given"""
+    try:
+        tokens = shlex.split(command)
+    except ValueError as e:
+        raise KubectlError(f"Invalid command: {e}")
+    if len(tokens) < 2 or tokens[0] != "kubectl":
+        raise KubectlError("Invalid kubectl command")
+
+    parsed = ParsedCommand("", namespace)
+    positional = []
+    i = 1
+    while i < len(tokens):
+        token = tokens[i]
+        i += 1
+        if not token.startswith("-") or token == "-":
+            positional.append(token)
+            continue
+
+        # --flag=value, -ovalue and -o=value forms
+        value = None
+        if token.startswith("--") and "=" in token:
+            token, value = token.split("=", 1)
+        elif not token.startswith("--") and len(token) > 2:
+            token, value = token[:2], token[2:].lstrip("=")
+
+        if token not in FLAGS:
+            raise KubectlError(f"unknown flag: {token}")
+        attr, takes_value = FLAGS[token]
+        if not takes_value:
+            setattr(parsed, attr, True)
+            continue
+        if value is None:
+            if i >= len(tokens):
+                raise KubectlError(f"flag needs an argument: {token}")
+            value = tokens[i]
+            i += 1
+        setattr(parsed, attr, value)
+
+    if not positional:
+        raise KubectlError("Missing command")
+    parsed.verb, parsed.args = positional[0], positional[1:]
+
+    if parsed.output and parsed.output not in OUTPUT_FORMATS:
+        raise KubectlError(f"unable to match a printer suitable for the output format \"{parsed.output}\", "
+                           f"allowed formats are: {','.join(OUTPUT_FORMATS)}")
+    if parsed.tail is not None:
+        try:
+            parsed.tail = int(parsed.tail)
+        except ValueError:
+            raise KubectlError(f"invalid argument \"{parsed.tail}\" for \"--tail\"")
+    return parsed
+
+
+def _resource_and_name(args: List[str], allowed: Tuple[str, ...]) -> Tuple[str, Optional[str]]:
+    """Resolve "TYPE NAME" or "TYPE/NAME" to (canonical type, name or None)"""
+    if not args:
+        raise KubectlError("You must specify the type of resource")
+    resource, _, name = args[0].partition("/")
+    kind = RESOURCE_ALIASES.get(resource.lower())
+    if kind not in allowed:
+        raise KubectlError(f"the server doesn't have a resource type \"{resource}\"")
+    if not name and len(args) > 1:
+        name = args[1]
+    return kind, name or None
+
+
+def _name_selector(name: Optional[str], field_selector: Optional[str]) -> Optional[str]:
+    """Fold a requested name into the field selector so the apiserver does the lookup"""
+    if not name:
+        return field_selector
+    return f"metadata.name={name}" + (f",{field_selector}" if field_selector else "")
+
+
+# Formatting
+def _age(created: Optional[str]) -> str:
+    if not created:
+        return "<unknown>"
+    try:
+        seconds = int((datetime.now(timezone.utc) - datetime.fromisoformat(created)).total_seconds())
+    except (TypeError, ValueError):
+        return "<unknown>"
+    if seconds < 120:
+        return f"{max(seconds, 0)}s"
+    if seconds < 7200:
+        return f"{seconds // 60}m"
+    if seconds < 172800:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
+
+
+def _table(headers: List[str], rows: List[List[Any]]) -> str:
+    """Left-aligned columns three spaces apart, as kubectl prints them"""
+    cells = [headers] + [[str(cell) for cell in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    return "\n".join("   ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in cells)
+
+
+def _pod_rows(pods: List[Dict], wide: bool) -> Tuple[List[str], List[List[Any]]]:
+    headers = ["NAME", "READY", "STATUS", "RESTARTS", "AGE"] + (["IP", "NODE"] if wide else [])
+    rows = []
+    for pod in pods:
+        row = [pod["name"], f"{pod['ready']}/{pod['total_containers']}", pod["status"],
+               pod.get("restarts", 0), _age(pod.get("created"))]
+        if wide:
+            row += [pod.get("ip") or "<none>", pod.get("node") or "<none>"]
+        rows.append(row)
+    return headers, rows
+
+
+def _service_rows(services: List[Dict], wide: bool) -> Tuple[List[str], List[List[Any]]]:
+    headers = ["NAME", "TYPE", "CLUSTER-IP", "PORT(S)"] + (["SELECTOR"] if wide else [])
+    rows = []
+    for svc in services:
+        ports = ",".join(f"{p['port']}/{p['protocol']}" for p in svc["ports"]) or "<none>"
+        row = [svc["name"], svc["type"], svc["cluster_ip"], ports]
+        if wide:
+            row.append(",".join(f"{k}={v}" for k, v in svc.get("selector", {}).items()) or "<none>")
+        rows.append(row)
+    return headers, rows
+
+
+def _deployment_rows(deployments: List[Dict], wide: bool) -> Tuple[List[str], List[List[Any]]]:
+    headers = ["NAME", "READY", "UP-TO-DATE", "AVAILABLE"] + (["SELECTOR"] if wide else [])
+    rows = []
+    for dep in deployments:
+        row = [dep["name"], f"{dep['ready_replicas']}/{dep['replicas']}", dep["replicas"], dep["available_replicas"]]
+        if wide:
+            row.append(",".join(f"{k}={v}" for k, v in (dep.get("selector") or {}).items()) or "<none>")
+        rows.append(row)
+    return headers, rows
+
+
+ROW_FORMATTERS: Dict[str, Callable] = {
+    "pods": _pod_rows,
+    "services": _service_rows,
+    "deployments": _deployment_rows,
+}
+
+
+def _print_objects(kind: str, items: List[Dict], parsed: ParsedCommand, single: bool) -> str:
+    if parsed.output in ("json", "yaml"):
+        document: Any = items[0] if single else {"apiVersion": "v1", "kind": "List", "items": items}
+        if parsed.output == "json":
+            return json.dumps(document, indent=4)
+        return yaml.safe_dump(document, sort_keys=False).rstrip("\n")
+
+    if not items:
+        where = "" if parsed.all_namespaces else f" in {parsed.namespace} namespace"
+        return f"No resources found{where}."
+    headers, rows = ROW_FORMATTERS[kind](items, parsed.output == "wide")
+    if parsed.all_namespaces:
+        headers = ["NAMESPACE"] + headers
+        rows = [[item.get("namespace", "")] + row for item, row in zip(items, rows)]
+    return _table(headers, rows)
+
+
+def _format_pod_describe(pod: Dict) -> str:
+    lines = [
+        f"Name:         {pod['name']}",
+        f"Namespace:    {pod['namespace']}",
+        f"Status:       {pod['status']}",
+        f"IP:           {pod['ip']}",
+        f"Node:         {pod['node']}",
+        f"Labels:       {','.join(f'{k}={v}' for k, v in pod.get('labels', {}).items()) or '<none>'}",
+        "",
+        "Containers:"
+    ]
+    for container in pod["containers"]:
+        lines.extend([
+            f"  {container['name']}:",
+            f"    State:         {container['state']}",
+            f"    Ready:         {container['ready']}",
+            f"    Restart Count: {container['restart_count']}"
+        ])
+    if pod.get("conditions"):
+        lines.append("Conditions:")
+        lines.extend(f"  {c['type']:<14} {c['status']}" for c in pod["conditions"])
+    return "\n".join(lines)
+
+
+def _format_deployment_describe(dep: Dict) -> str:
+    return "\n".join([
+        f"Name:         {dep['name']}",
+        f"Namespace:    {dep['namespace']}",
+        f"Labels:       {','.join(f'{k}={v}' for k, v in dep.get('labels', {}).items()) or '<none>'}",
+        f"Selector:     {','.join(f'{k}={v}' for k, v in (dep.get('selector') or {}).items()) or '<none>'}",
+        f"Replicas:     {dep['replicas']} desired | {dep.get('updated_replicas', 0)} updated | "
+        f"{dep['available_replicas']} available | {dep['replicas'] - dep['available_replicas']} unavailable"
+    ])
+
+
+# Commands
+def _list(client, kind: str, parsed: ParsedCommand, field_selector: Optional[str]) -> List[Dict]:
+    listers = {
+        "pods": client.list_pods,
+        "services": client.list_services,
+        "deployments": client.list_deployments,
+    }
+    return listers[kind](parsed.namespace, label_selector=parsed.label_selector,
+                         field_selector=field_selector, all_namespaces=parsed.all_namespaces)
+
+
+def _get(client, parsed: ParsedCommand) -> str:
+    if not parsed.args:
+        raise KubectlError("You must specify the type of resource to get")
+    # kubectl get pods,services
+    if "," in parsed.args[0] and "/" not in parsed.args[0]:
+        if len(parsed.args) > 1:
+            raise KubectlError("names cannot be given when getting several resource types")
+        return "\n\n".join(_get_kind(client, parsed, *_resource_and_name([resource], tuple(ROW_FORMATTERS)))
+                           for resource in parsed.args[0].split(","))
+    return _get_kind(client, parsed, *_resource_and_name(parsed.args, tuple(ROW_FORMATTERS)))
+
+
+def _get_kind(client, parsed: ParsedCommand, kind: str, name: Optional[str]) -> str:
+    items = _list(client, kind, parsed, _name_selector(name, parsed.field_selector))
+    if name and not items:
+        raise KubectlError(f"Error from server (NotFound): {kind} \"{name}\" not found")
+    return _print_objects(kind, items, parsed, single=bool(name))
+
+
+def _describe(client, parsed: ParsedCommand) -> str:
+    kind, name = _resource_and_name(parsed.args, ("pods", "deployments"))
+    if not name:
+        raise KubectlError(f"You must specify the name of the {SINGULAR[kind]} to describe")
+    if kind == "pods":
+        pod = client.get_pod(name, namespace=parsed.namespace)
+        if not pod:
+            raise KubectlError(f"Error from server (NotFound): pods \"{name}\" not found")
+        return _format_pod_describe(pod)
+    dep = client.get_deployment(name, namespace=parsed.namespace)
+    if not dep:
+        raise KubectlError(f"Error from server (NotFound): deployments.apps \"{name}\" not found")
+    return _format_deployment_describe(dep)
+
+
+def _logs(client, parsed: ParsedCommand) -> str:
+    if not parsed.args:
+        raise KubectlError("Missing pod name")
+    name = parsed.args[0]
+    if "/" in name:
+        resource, _, name = name.partition("/")
+        if RESOURCE_ALIASES.get(resource) != "pods":
+            raise KubectlError("logs are only available for pods")
+    return client.get_pod_logs(name, namespace=parsed.namespace, container=parsed.container,
+                               tail_lines=parsed.tail if parsed.tail is not None else 100)
+
+
+def _top(client, parsed: ParsedCommand) -> str:
+    kind, name = _resource_and_name(parsed.args, ("pods", "nodes"))
+    if kind == "nodes":
+        metrics = client.get_node_metrics()
+    else:
+        metrics = client.get_pod_metrics(parsed.namespace, label_selector=parsed.label_selector,
+                                         all_namespaces=parsed.all_namespaces)
+    if metrics is None:
+        raise KubectlError("error: Metrics API not available")
+    if name:
+        metrics = [m for m in metrics if m["name"] == name]
+    if not metrics:
+        return "No resources found"
+
+    headers = ["NAME", "CPU(cores)", "MEMORY(bytes)"]
+    rows = [[m["name"], f"{m['cpu_millicores']}m", f"{m['memory_bytes'] // (1024 * 1024)}Mi"] for m in metrics]
+    if kind == "pods" and parsed.all_namespaces:
+        headers = ["NAMESPACE"] + headers
+        rows = [[m.get("namespace", "")] + row for m, row in zip(metrics, rows)]
+    return _table(headers, rows)
+
+
+def _rollout_status(client, parsed: ParsedCommand, name: str) -> str:
+    dep = client.get_deployment(name, namespace=parsed.namespace)
+    if not dep:
+        raise KubectlError(f"Error from server (NotFound): deployments.apps \"{name}\" not found")
+    # One check rather than kubectl's watch, so the terminal never blocks
+    if dep.get("observed_generation") is not None and dep.get("generation") is not None \
+            and dep["observed_generation"] < dep["generation"]:
+        return "Waiting for deployment spec update to be observed..."
+    if dep.get("updated_replicas", dep["replicas"]) < dep["replicas"]:
+        return (f"Waiting for deployment \"{name}\" rollout to finish: "
+                f"{dep['updated_replicas']} out of {dep['replicas']} new replicas have been updated...")
+    if dep["available_replicas"] < dep["replicas"]:
+        return (f"Waiting for deployment \"{name}\" rollout to finish: "
+                f"{dep['available_replicas']} of {dep['replicas']} updated replicas are available...")
+    return f"deployment \"{name}\" successfully rolled out"
+
+
+def _rollout_restart(client, parsed: ParsedCommand, name: str) -> str:
+    if not client.restart_deployment(name, namespace=parsed.namespace):
+        raise KubectlError(f"Error from server (NotFound): deployments.apps \"{name}\" not found")
+    return f"deployment.apps/{name} restarted"
+
+
+ROLLOUT_COMMANDS: Dict[str, Callable[[Any, ParsedCommand, str], str]] = {
+    "status": _rollout_status,
+    "restart": _rollout_restart,
+}
+
+
+def _rollout(client, parsed: ParsedCommand) -> str:
+    if not parsed.args or parsed.args[0] not in ROLLOUT_COMMANDS:
+        raise KubectlError(f"rollout supports: {', '.join(ROLLOUT_COMMANDS)}")
+    _, name = _resource_and_name(parsed.args[1:], ("deployments",))
+    if not name:
+        raise KubectlError("You must specify the name of the deployment")
+    return ROLLOUT_COMMANDS[parsed.args[0]](client, parsed, name)
+
+
+# Verb -> handler(client, parsed) returning the command output
+COMMANDS: Dict[str, Callable[[Any, ParsedCommand], str]] = {
+    "get": _get,
+    "describe": _describe,
+    "logs": _logs,
+    "top": _top,
+    "rollout": _rollout,
+}
+
+
+def execute(client, command: str, namespace: str = "default") -> Dict[str, Any]:
+    """Run a kubectl command line against client; returns {"output", "success"} or {"error", "success"}"""
+    try:
+        parsed = parse(command, namespace)
+        handler = COMMANDS.get(parsed.verb)
+        if handler is None:
+            return {"error": f"Command '{parsed.verb}' not yet implemented", "success": False}
+        return {"output": handler(client, parsed), "success": True}
+    except ApiException as e:
+        return {"error": _api_error(e), "success": False}
+    except Exception as e:
+        return {"error": str(e), "success": False}
+
+
+def _api_error(e: ApiException) -> str:
+    """kubectl's one-line server error; str(e) would show the player the response headers and body"""
+    try:
+        status = json.loads(e.body or "")
+    except (TypeError, ValueError):
+        status = None
+    if isinstance(status, dict) and status.get("message"):
+        return f"Error from server ({status.get('reason') or e.reason}): {status['message']}"
+    return f"Error from server: {e.reason or e.status}"
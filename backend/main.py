@@ -1,10 +1,21 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from kubernetes.client.rest import ApiException
 from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from models import GameState
-from game_logic import game_manager
+from game_logic import game_manager, KUBERNETES_WORKERS, MAX_APPLY_BYTES, MAX_LOG_STREAMS, STATUS_HISTORY_ENTRIES
+from sessions import DEFAULT_SESSION
+from metrics import REGISTRY, HTTP_DURATION, HTTP_IN_FLIGHT, HTTP_REQUESTS
+from tracing import propagate, span, tracer
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import json
 import logging
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,6 +41,87 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.middleware("http")
+async def require_known_session(request: Request, call_next):
+    """Reject tokens that were never issued or whose session is gone; the client should start a new one"""
+    token = _session_token(request)
+    if token and request.url.path != "/sessions" and not game_manager.session_exists(token):
+        return JSONResponse({"detail": "Unknown or expired session; start a new one with POST /sessions"},
+                            status_code=404)
+    return await call_next(request)
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Count and time every request by its route template, not its raw path"""
+    HTTP_IN_FLIGHT.inc()
+    started = time.perf_counter()
+    code = "500"
+    try:
+        response = await call_next(request)
+        code = str(response.status_code)
+        return response
+    finally:
+        HTTP_IN_FLIGHT.dec()
+        route = request.scope.get("route")
+        path = getattr(route, "path", None) or "unmatched"
+        HTTP_DURATION.observe(time.perf_counter() - started, request.method, path)
+        HTTP_REQUESTS.inc(request.method, path, code)
+
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    """
+    Trace the request when asked with X-KubeChaos-Trace: 1 or ?trace=1 (honoured
+    only with KUBECHAOS_TRACE_ON_REQUEST), or when sampled by KUBECHAOS_TRACE;
+    the trace id is returned as X-Trace-Id
+    """
+    flag = request.headers.get("x-kubechaos-trace") or request.query_params.get("trace")
+    if not tracer.should_trace((flag or "").lower() in ("1", "true", "yes")):
+        return await call_next(request)
+    
+    handle = tracer.start(f"{request.method} {request.url.path}", **{"http.method": request.method})
+    response = None
+    try:
+        response = await call_next(request)
+        response.headers["X-Trace-Id"] = handle[0].trace_id
+        return response
+    finally:
+        # Name the root span after the route template so traces of one route fold together
+        route = getattr(request.scope.get("route"), "path", None)
+        if route:
+            handle[1].name = f"{request.method} {route}"
+        handle[1].attributes["http.status_code"] = response.status_code if response else 500
+        trace = tracer.finish(handle)
+        await asyncio.get_running_loop().run_in_executor(None, tracer.export, trace)
+
+# Blocking Kubernetes calls run on their own bounded pool so slow apiserver
+# requests cannot starve Starlette's shared threadpool
+k8s_executor = ThreadPoolExecutor(max_workers=KUBERNETES_WORKERS, thread_name_prefix="k8s")
+
+# Streaming log reads block for as long as a pod is followed, so they get their own pool
+log_executor = ThreadPoolExecutor(max_workers=MAX_LOG_STREAMS, thread_name_prefix="logs")
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking GameManager call on the Kubernetes executor"""
+    loop = asyncio.get_running_loop()
+    # propagate() carries the request's trace, if any, onto the executor thread
+    return await loop.run_in_executor(k8s_executor, propagate(functools.partial(func, *args, **kwargs)))
+
+@app.on_event("startup")
+async def start_background_tasks():
+    """Connect to the cluster without blocking startup"""
+    game_manager.event_hub.bind_loop(asyncio.get_running_loop())
+    game_manager.start_background_tasks()
+
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    game_manager.stop_background_tasks()
+    k8s_executor.shutdown(wait=False)
+    log_executor.shutdown(wait=False)
+
+def _session_token(connection: Union[Request, WebSocket]) -> Optional[str]:
+    """Player session from the X-Session-Token header or ?session= (browsers cannot set WebSocket headers)"""
+    return connection.headers.get("x-session-token") or connection.query_params.get("session")
+
 # Request Models
 class CommandRequest(BaseModel):
     command: str
@@ -39,15 +131,43 @@ class ChaosExperimentRequest(BaseModel):
     scenario_id: str
     namespace: Optional[str] = "ecommerce"
 
+class BatchTarget(BaseModel):
+    namespace: str
+    selector: Optional[Dict[str, Any]] = None  # Overrides the scenario's Chaos Mesh selector
+
+class BatchScenarioRequest(BaseModel):
+    namespaces: List[str] = []
+    targets: List[BatchTarget] = []
+    rollback: bool = False  # Delete what was created if any target fails
+
 class CustomChaosRequest(BaseModel):
     chaos_type: str  # PodChaos, NetworkChaos, etc.
     name: str
     namespace: str
     config: Dict[str, Any]
 
+# Session Endpoints
+@app.post("/sessions")
+async def create_session():
+    """Start a player session; send the token as X-Session-Token on later requests"""
+    return {"token": game_manager.create_session()}
+
+@app.delete("/sessions")
+async def end_session(request: Request):
+    """End the caller's player session"""
+    token = _session_token(request)
+    if not token or token == DEFAULT_SESSION:
+        raise HTTPException(status_code=400, detail="No session token provided")
+    return {"success": game_manager.end_session(token)}
+
+@app.get("/sessions/stats")
+async def get_session_stats():
+    """Session count, memory use and evictions"""
+    return game_manager.get_session_stats()
+
 # Health & Status Endpoints
 @app.get("/")
-def read_root():
+async def read_root():
     return {
         "message": "KubeChaos API is running",
         "version": "2.0.0",
@@ -55,51 +175,159 @@ def read_root():
     }
 
 @app.get("/health")
-def health_check():
-    """Health check endpoint"""
-    cluster_status = game_manager.get_cluster_status()
+async def health_check():
+    """Health check endpoint; answers from memory and never waits on the apiserver"""
+    cluster_status = game_manager.get_cluster_status(block=False)
     return {
         "status": "healthy",
+        "cluster_state": game_manager.connection_state.value,
         "cluster_connected": cluster_status.get("connected", False),
-        "chaos_mesh_installed": cluster_status.get("chaos_mesh_installed", False)
+        "chaos_mesh_installed": cluster_status.get("chaos_mesh_installed", False),
+        "age_seconds": cluster_status.get("age_seconds"),
+        "refreshing": cluster_status.get("refreshing", False)
     }
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """True if the If-None-Match header lists etag (weak comparison) or *"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(",")]
+    return "*" in tags or any(tag.replace("W/", "", 1) == etag.replace("W/", "", 1) for tag in tags)
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus metrics: route and apiserver latencies, cache hit ratios, active experiments"""
+    return Response(REGISTRY.render(), media_type=REGISTRY.CONTENT_TYPE)
+
 @app.get("/status", response_model=GameState)
-def get_status():
-    """Get current game state"""
-    return game_manager.get_state()
+async def get_status(
+    request: Request,
+    history: Optional[int] = Query(None, ge=0, le=1000),
+    since: Optional[str] = Query(None, max_length=64)
+):
+    """
+    Get current game state with the last `history` terminal entries (0 for summary only).
+    
+    Responses carry an ETag tied to the state revision; an If-None-Match poll
+    with an unchanged revision gets 304. With `since=<X-State-Revision>` only
+    the fields changed after that revision are returned, or all of them with
+    full=true when the revision is from an earlier epoch of the session (a
+    restart or a recreated session).
+    """
+    session = _session_token(request)
+    history_entries = STATUS_HISTORY_ENTRIES if history is None else history
+    etag = game_manager.state_etag(history_entries, session)
+    headers = {
+        "ETag": etag,
+        "X-State-Revision": game_manager.state_revision(session),
+        "Vary": "X-Session-Token"
+    }
+    
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    
+    if since is not None:
+        body = game_manager.get_state_delta(since, history_entries, session)
+    else:
+        body = game_manager.get_state(history_entries, session)
+    with span("encode GameState"):
+        content = jsonable_encoder(body)
+    return JSONResponse(content, headers=headers)
+
+@app.websocket("/ws")
+async def game_events(websocket: WebSocket, namespace: str = "ecommerce"):
+    """
+    Push experiment status changes, pod phase transitions, score updates and
+    terminal output as they happen. Events are JSON objects with type,
+    namespace, timestamp and data. A "dropped" event tells a slow client how
+    many events it missed; it should resync from /status.
+    """
+    session = _session_token(websocket) or DEFAULT_SESSION
+    if not game_manager.session_exists(session):
+        await websocket.close(code=4404, reason="Unknown or expired session")
+        return
+    if not game_manager.is_game_namespace(namespace):
+        # Each streamed namespace holds an upstream watch, so clients cannot pick arbitrary ones
+        await websocket.close(code=1008, reason="Namespace is not one the game plays in")
+        return
+    await websocket.accept()
+    subscriber = game_manager.event_hub.subscribe(namespace, session)
+    
+    async def send_events():
+        await websocket.send_json({
+            "type": "hello",
+            "namespace": namespace,
+            "data": {"revision": game_manager.state_revision(session), "state": game_manager.connection_state.value}
+        })
+        while True:
+            event = await subscriber.queue.get()
+            notice = subscriber.take_drop_notice()
+            if notice:
+                await websocket.send_json(notice)
+            await websocket.send_json(event)
+    
+    async def wait_for_disconnect():
+        # Clients do not send anything; this returns once the socket closes
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return
+    
+    sender = asyncio.ensure_future(send_events())
+    receiver = asyncio.ensure_future(wait_for_disconnect())
+    try:
+        done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            error = task.exception()
+            if error and not isinstance(error, WebSocketDisconnect):
+                logger.debug(f"WebSocket closed: {error}")
+    finally:
+        sender.cancel()
+        receiver.cancel()
+        game_manager.event_hub.unsubscribe(subscriber)
+
+@app.get("/history")
+async def get_history(request: Request, after_seq: int = Query(0, ge=0), limit: int = Query(100, ge=1, le=1000)):
+    """Page through terminal history; pass next_after_seq back as after_seq"""
+    return game_manager.get_history(after_seq, limit, _session_token(request))
 
 @app.get("/cluster/info")
-def get_cluster_info():
+async def get_cluster_info():
     """Get Kubernetes cluster information"""
-    return game_manager.get_cluster_status()
+    return await run_blocking(game_manager.get_cluster_status)
+
+@app.get("/cluster/cache")
+async def get_cache_metrics():
+    """Get informer cache staleness and event-lag metrics"""
+    return game_manager.get_cache_metrics()
 
 # Game Control Endpoints
 @app.post("/start")
-def start_game():
+async def start_game(request: Request):
     """Start the game"""
     try:
-        game_manager.start_game()
+        game_manager.start_game(_session_token(request))
         return {"message": "Game started", "success": True}
     except Exception as e:
         logger.error(f"Failed to start game: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/stop")
-def stop_game():
+async def stop_game(request: Request):
     """Stop the game"""
     try:
-        game_manager.stop_game()
+        game_manager.stop_game(_session_token(request))
         return {"message": "Game stopped", "success": True}
     except Exception as e:
         logger.error(f"Failed to stop game: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/reset")
-def reset_game():
+async def reset_game(request: Request):
     """Reset game state"""
     try:
-        game_manager.reset_game()
+        game_manager.reset_game(_session_token(request))
         return {"message": "Game reset", "success": True}
     except Exception as e:
         logger.error(f"Failed to reset game: {e}")
@@ -107,10 +335,11 @@ def reset_game():
 
 # Kubectl Command Execution
 @app.post("/command")
-def execute_command(request: CommandRequest):
+async def execute_command(request: CommandRequest, http_request: Request):
     """Execute a kubectl command"""
     try:
-        result = game_manager.execute_command(request.command, request.namespace)
+        result = await run_blocking(game_manager.execute_command, request.command, request.namespace,
+                                    _session_token(http_request))
         return result
     except Exception as e:
         logger.error(f"Command execution failed: {e}")
@@ -118,28 +347,45 @@ def execute_command(request: CommandRequest):
 
 # Scenario Management
 @app.get("/scenarios")
-def list_scenarios():
-    """List all available game scenarios"""
-    return game_manager.list_scenarios()
+async def list_scenarios(request: Request):
+    """
+    List all available game scenarios. The ETag lets clients keep a local copy
+    and revalidate it with If-None-Match (304 while unchanged)
+    """
+    body, etag = game_manager.scenarios_json()
+    return _scenario_listing_response(request, body, etag)
 
 @app.get("/scenarios/{scenario_id}")
-def get_scenario(scenario_id: str):
+async def get_scenario(scenario_id: str):
     """Get details of a specific scenario"""
-    scenario = game_manager.get_scenario(scenario_id)
-    if not scenario:
+    body = game_manager.scenario_json(scenario_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="Scenario not found")
-    return scenario
+    return Response(body, media_type="application/json")
 
 @app.get("/scenarios/difficulty/{difficulty}")
-def get_scenarios_by_difficulty(difficulty: str):
+async def get_scenarios_by_difficulty(request: Request, difficulty: str):
     """Get scenarios by difficulty level"""
-    return game_manager.get_scenarios_by_difficulty(difficulty)
+    body, etag = game_manager.scenarios_json(difficulty)
+    return _scenario_listing_response(request, body, etag)
+
+@app.get("/scenario-packs")
+async def get_scenario_packs():
+    """Scenario pack directory, loaded files and validation errors of rejected files"""
+    return game_manager.scenario_packs_status()
+
+def _scenario_listing_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve pre-encoded scenario JSON as is, or 304 when the client's copy is current"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 @app.post("/scenarios/{scenario_id}/start")
-def start_scenario(scenario_id: str, namespace: Optional[str] = "ecommerce"):
+async def start_scenario(request: Request, scenario_id: str, namespace: Optional[str] = "ecommerce"):
     """Start a game scenario (creates chaos experiment)"""
     try:
-        result = game_manager.start_scenario(scenario_id, namespace)
+        result = await run_blocking(game_manager.start_scenario, scenario_id, namespace, _session_token(request))
         if not result:
             raise HTTPException(status_code=400, detail="Failed to start scenario")
         
@@ -155,22 +401,45 @@ def start_scenario(scenario_id: str, namespace: Optional[str] = "ecommerce"):
         logger.error(f"Failed to start scenario: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/scenarios/{scenario_id}/batch")
+async def start_scenario_batch(request: Request, scenario_id: str, batch: BatchScenarioRequest):
+    """
+    Start a scenario in many namespaces at once. Experiments get unique names
+    and are created concurrently; the response has one result per target.
+    """
+    targets = [{"namespace": ns} for ns in batch.namespaces] + [dict(t) for t in batch.targets]
+    if not targets:
+        raise HTTPException(status_code=400, detail="No namespaces or targets given")
+    
+    try:
+        result = await run_blocking(game_manager.start_scenario_batch, scenario_id, targets,
+                                    batch.rollback, _session_token(request))
+    except Exception as e:
+        logger.error(f"Failed to start scenario batch: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Scenario {scenario_id} not found")
+    return {**result, "success": result["failed"] == 0}
+
 # Chaos Experiment Management
 @app.get("/chaos/experiments")
-def list_experiments(namespace: Optional[str] = "ecommerce"):
+async def list_experiments(namespace: Optional[str] = "ecommerce"):
     """List all active chaos experiments"""
     try:
-        experiments = game_manager.list_chaos_experiments(namespace)
-        return {"experiments": experiments, "count": len(experiments)}
+        experiments = await run_blocking(game_manager.list_chaos_experiments, namespace)
+        # partial: some kinds failed or timed out and are missing from experiments
+        return {"experiments": experiments, "count": len(experiments),
+                "partial": bool(experiments.incomplete), "incomplete": experiments.incomplete}
     except Exception as e:
         logger.error(f"Failed to list experiments: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/chaos/experiments/{experiment_name}")
-def get_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce", chaos_type: Optional[str] = "PodChaos"):
+async def get_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce", chaos_type: Optional[str] = "PodChaos"):
     """Get details of a specific chaos experiment"""
     try:
-        experiment = game_manager.get_chaos_experiment(experiment_name, namespace, chaos_type)
+        experiment = await run_blocking(game_manager.get_chaos_experiment, experiment_name, namespace, chaos_type)
         if not experiment:
             raise HTTPException(status_code=404, detail="Experiment not found")
         return experiment
@@ -178,11 +447,20 @@ def get_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce",
         logger.error(f"Failed to get experiment: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/chaos/workflows/{workflow_name}")
+async def get_workflow_status(workflow_name: str, namespace: Optional[str] = "ecommerce"):
+    """Get a workflow's overall phase and the phase of each of its templates"""
+    status = await run_blocking(game_manager.get_workflow_status, workflow_name, namespace)
+    if not status:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+    return status
+
 @app.post("/chaos/experiments/custom")
-def create_custom_experiment(request: CustomChaosRequest):
+async def create_custom_experiment(request: CustomChaosRequest):
     """Create a custom chaos experiment"""
     try:
-        result = game_manager.create_custom_chaos(
+        result = await run_blocking(
+            game_manager.create_custom_chaos,
             chaos_type=request.chaos_type,
             name=request.name,
             namespace=request.namespace,
@@ -199,11 +477,44 @@ def create_custom_experiment(request: CustomChaosRequest):
         logger.error(f"Failed to create custom experiment: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/chaos/apply")
+async def apply_chaos_manifests(request: Request, namespace: Optional[str] = "ecommerce", dry_run: bool = False):
+    """
+    Create or update the Chaos Mesh objects in a multi-document YAML request
+    body. Every document is validated first (422 lists the errors, nothing is
+    applied); then all objects are server-side applied concurrently. Bodies
+    over MAX_APPLY_BYTES get 413.
+    """
+    too_large = HTTPException(status_code=413, detail=f"Manifests are limited to {MAX_APPLY_BYTES} bytes")
+    length = request.headers.get("content-length", "")
+    if length.isdigit() and int(length) > MAX_APPLY_BYTES:
+        raise too_large
+    # Content-Length may be missing (chunked) or wrong, so the read is capped as well
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > MAX_APPLY_BYTES:
+            raise too_large
+    
+    try:
+        yaml_content = body.decode("utf-8")
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="Manifests must be UTF-8 encoded YAML")
+    
+    try:
+        result = await run_blocking(game_manager.apply_chaos_manifests, yaml_content, namespace, dry_run)
+    except Exception as e:
+        logger.error(f"Failed to apply chaos manifests: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    if result["errors"]:
+        raise HTTPException(status_code=422, detail=result["errors"])
+    return result
+
 @app.post("/chaos/experiments/{experiment_name}/pause")
-def pause_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce", chaos_type: Optional[str] = "PodChaos"):
+async def pause_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce", chaos_type: Optional[str] = "PodChaos"):
     """Pause a running chaos experiment"""
     try:
-        success = game_manager.pause_chaos_experiment(experiment_name, namespace, chaos_type)
+        success = await run_blocking(game_manager.pause_chaos_experiment, experiment_name, namespace, chaos_type)
         if not success:
             raise HTTPException(status_code=400, detail="Failed to pause experiment")
         return {"message": "Experiment paused", "success": True}
@@ -212,10 +523,10 @@ def pause_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/chaos/experiments/{experiment_name}/resume")
-def resume_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce", chaos_type: Optional[str] = "PodChaos"):
+async def resume_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce", chaos_type: Optional[str] = "PodChaos"):
     """Resume a paused chaos experiment"""
     try:
-        success = game_manager.resume_chaos_experiment(experiment_name, namespace, chaos_type)
+        success = await run_blocking(game_manager.resume_chaos_experiment, experiment_name, namespace, chaos_type)
         if not success:
             raise HTTPException(status_code=400, detail="Failed to resume experiment")
         return {"message": "Experiment resumed", "success": True}
@@ -223,11 +534,44 @@ def resume_experiment(experiment_name: str, namespace: Optional[str] = "ecommerc
         logger.error(f"Failed to resume experiment: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.delete("/chaos/experiments")
+async def teardown_experiments(
+    namespace: Optional[str] = "ecommerce",
+    wait: bool = False,
+    timeout: float = Query(120.0, gt=0, le=3600)
+):
+    """
+    Delete every game experiment (label app=kubechaos-game) in namespace.
+    
+    Progress is streamed as NDJSON: one "deleted" line per chaos kind, one
+    "finalized" line per kind with wait=true, then a final "done" line.
+    """
+    progress = game_manager.teardown_experiments(namespace, wait, timeout)
+    return StreamingResponse(_stream_progress(progress), media_type="application/x-ndjson")
+
+async def _stream_progress(progress):
+    """Relay a blocking progress iterator as NDJSON lines"""
+    try:
+        while True:
+            entry = await run_blocking(next, progress, None)
+            if entry is None:
+                break
+            yield (json.dumps(entry) + "\n").encode()
+    except Exception as e:
+        logger.error(f"Teardown failed: {e}")
+        yield (json.dumps({"event": "error", "error": str(e)}) + "\n").encode()
+    finally:
+        try:
+            progress.close()
+        except ValueError:
+            # Still running in the executor after a client disconnect; it ends on its own
+            pass
+
 @app.delete("/chaos/experiments/{experiment_name}")
-def delete_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce", chaos_type: Optional[str] = "PodChaos"):
+async def delete_experiment(experiment_name: str, namespace: Optional[str] = "ecommerce", chaos_type: Optional[str] = "PodChaos"):
     """Delete a chaos experiment"""
     try:
-        success = game_manager.delete_chaos_experiment(experiment_name, namespace, chaos_type)
+        success = await run_blocking(game_manager.delete_chaos_experiment, experiment_name, namespace, chaos_type)
         if not success:
             raise HTTPException(status_code=400, detail="Failed to delete experiment")
         return {"message": "Experiment deleted", "success": True}
@@ -237,33 +581,112 @@ def delete_experiment(experiment_name: str, namespace: Optional[str] = "ecommerc
 
 # Legacy Chaos Endpoints (for backward compatibility)
 @app.post("/chaos/generate")
-def generate_chaos():
+async def generate_chaos():
     """Generate a chaos event (legacy - simulation mode)"""
     game_manager.generate_chaos_event()
     return {"message": "Chaos event generation triggered"}
 
 @app.post("/chaos/resolve/{event_id}")
-def resolve_chaos(event_id: str):
+async def resolve_chaos(event_id: str):
     """Resolve a chaos event (legacy - simulation mode)"""
     game_manager.resolve_event(event_id)
     return {"message": f"Event {event_id} resolution attempted"}
 
 # Kubernetes Resource Endpoints
-@app.get("/k8s/pods")
-def list_pods(namespace: Optional[str] = "default"):
-    """List pods in a namespace"""
+RESOURCE_VERSION_MATCHES = ("NotOlderThan", "Exact")
+
+def _list_filters(label_selector: Optional[str], field_selector: Optional[str],
+                  resource_version: Optional[str], resource_version_match: Optional[str]) -> Dict[str, Any]:
+    """List options passed through to the apiserver, checked the way the apiserver would"""
+    if resource_version_match is not None:
+        if resource_version_match not in RESOURCE_VERSION_MATCHES:
+            raise HTTPException(status_code=400, detail=f"resource_version_match must be one of "
+                                                        f"{', '.join(RESOURCE_VERSION_MATCHES)}")
+        if resource_version is None:
+            raise HTTPException(status_code=400, detail="resource_version_match requires resource_version")
+    return {
+        "label_selector": label_selector,
+        "field_selector": field_selector,
+        "resource_version": resource_version,
+        "resource_version_match": resource_version_match
+    }
+
+async def _paginated_list(kind: str, namespace: Optional[str], limit: Optional[int],
+                          continue_token: Optional[str], stream: bool, filters: Dict[str, Any],
+                          list_func, *args):
+    """
+    Shared body of the list endpoints.
+    
+    Without limit/stream the full list is returned as before. With limit, one
+    page is returned with the apiserver's continue token as the cursor. With
+    stream=true, objects are sent as NDJSON, converted page by page. The
+    filters (label/field selectors, resourceVersion) are evaluated by the
+    apiserver in every mode.
+    """
+    if stream:
+        return StreamingResponse(_stream_pages(kind, namespace, filters), media_type="application/x-ndjson")
+    
     try:
-        pods = game_manager.list_pods(namespace)
-        return {"pods": pods, "count": len(pods)}
+        if limit is None:
+            items = await run_blocking(list_func, *args, **filters)
+            return {kind: items, "count": len(items)}
+        
+        page = await run_blocking(game_manager.list_resource_page, kind, namespace,
+                                  limit=limit, continue_token=continue_token, **filters)
+        return {
+            kind: page["items"],
+            "count": len(page["items"]),
+            "continue": page["continue"],
+            "remaining": page["remaining"],
+            "resource_version": page.get("resource_version")
+        }
+    except ApiException as e:
+        # 410 Gone means the continue token expired; the client restarts the listing
+        raise HTTPException(status_code=e.status or 500, detail=e.reason)
     except Exception as e:
-        logger.error(f"Failed to list pods: {e}")
+        logger.error(f"Failed to list {kind}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+async def _stream_pages(kind: str, namespace: Optional[str], filters: Dict[str, Any]):
+    """Encode each page as NDJSON lines as soon as it has been fetched"""
+    pages = game_manager.iter_resource_pages(kind, namespace, **filters)
+    try:
+        while True:
+            page = await run_blocking(next, pages, None)
+            if page is None:
+                break
+            yield "".join(json.dumps(item) + "\n" for item in page).encode()
+    except Exception as e:
+        logger.error(f"Failed to stream {kind}: {e}")
+        yield (json.dumps({"error": str(e)}) + "\n").encode()
+    finally:
+        try:
+            pages.close()
+        except ValueError:
+            # Still running in the executor after a client disconnect; it ends on its own
+            pass
+
+@app.get("/k8s/pods")
+async def list_pods(
+    namespace: Optional[str] = "default",
+    limit: Optional[int] = Query(None, ge=1, le=5000),
+    continue_token: Optional[str] = Query(None, alias="continue"),
+    stream: bool = False,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    resource_version: Optional[str] = None,
+    resource_version_match: Optional[str] = None
+):
+    """List pods in a namespace; e.g. label_selector=app=payment-service or field_selector=status.phase!=Running"""
+    return await _paginated_list("pods", namespace, limit, continue_token, stream,
+                                 _list_filters(label_selector, field_selector, resource_version, resource_version_match),
+                                 game_manager.list_pods, namespace)
+
 @app.get("/k8s/pods/{pod_name}")
-def get_pod(pod_name: str, namespace: Optional[str] = "default"):
+async def get_pod(pod_name: str, namespace: Optional[str] = "default"):
     """Get details of a specific pod"""
     try:
-        pod = game_manager.get_pod(pod_name, namespace)
+        pod = await run_blocking(game_manager.get_pod, pod_name, namespace)
         if not pod:
             raise HTTPException(status_code=404, detail="Pod not found")
         return pod
@@ -272,44 +695,108 @@ def get_pod(pod_name: str, namespace: Optional[str] = "default"):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/k8s/pods/{pod_name}/logs")
-def get_pod_logs(pod_name: str, namespace: Optional[str] = "default", tail_lines: Optional[int] = 100):
+async def get_pod_logs(pod_name: str, namespace: Optional[str] = "default", tail_lines: Optional[int] = 100):
     """Get logs from a pod"""
     try:
-        logs = game_manager.get_pod_logs(pod_name, namespace, tail_lines)
+        logs = await run_blocking(game_manager.get_pod_logs, pod_name, namespace, tail_lines)
         return {"logs": logs}
     except Exception as e:
         logger.error(f"Failed to get pod logs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/k8s/services")
-def list_services(namespace: Optional[str] = "default"):
-    """List services in a namespace"""
+async def _relay_log_stream(request: Request, stream):
+    """Forward log chunks to the client, closing the upstream stream on disconnect"""
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            chunk = await loop.run_in_executor(log_executor, next, stream, None)
+            if chunk is None or await request.is_disconnected():
+                break
+            yield chunk
+    finally:
+        # Ends a read blocked in the executor if the client went away mid-chunk
+        stream.close()
+
+@app.get("/k8s/pods/{pod_name}/logs/stream")
+async def stream_pod_logs(
+    request: Request,
+    pod_name: str,
+    namespace: Optional[str] = "default",
+    container: Optional[str] = None,
+    follow: bool = False,
+    since_seconds: Optional[int] = None,
+    limit_bytes: Optional[int] = None,
+    tail_lines: Optional[int] = None
+):
+    """Stream logs from a pod as chunked text, optionally following new output"""
     try:
-        services = game_manager.list_services(namespace)
-        return {"services": services, "count": len(services)}
+        stream = await run_blocking(
+            game_manager.stream_pod_logs,
+            pod_name, namespace,
+            container=container,
+            follow=follow,
+            since_seconds=since_seconds,
+            limit_bytes=limit_bytes,
+            tail_lines=tail_lines
+        )
+    except ApiException as e:
+        raise HTTPException(status_code=e.status or 500, detail=e.reason)
     except Exception as e:
-        logger.error(f"Failed to list services: {e}")
+        logger.error(f"Failed to stream pod logs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(
+        _relay_log_stream(request, stream),
+        media_type="text/plain; charset=utf-8",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.get("/k8s/services")
+async def list_services(
+    namespace: Optional[str] = "default",
+    limit: Optional[int] = Query(None, ge=1, le=5000),
+    continue_token: Optional[str] = Query(None, alias="continue"),
+    stream: bool = False,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    resource_version: Optional[str] = None,
+    resource_version_match: Optional[str] = None
+):
+    """List services in a namespace, optionally filtered by label and field selectors"""
+    return await _paginated_list("services", namespace, limit, continue_token, stream,
+                                 _list_filters(label_selector, field_selector, resource_version, resource_version_match),
+                                 game_manager.list_services, namespace)
 
 @app.get("/k8s/deployments")
-def list_deployments(namespace: Optional[str] = "default"):
-    """List deployments in a namespace"""
-    try:
-        deployments = game_manager.list_deployments(namespace)
-        return {"deployments": deployments, "count": len(deployments)}
-    except Exception as e:
-        logger.error(f"Failed to list deployments: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+async def list_deployments(
+    namespace: Optional[str] = "default",
+    limit: Optional[int] = Query(None, ge=1, le=5000),
+    continue_token: Optional[str] = Query(None, alias="continue"),
+    stream: bool = False,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    resource_version: Optional[str] = None,
+    resource_version_match: Optional[str] = None
+):
+    """List deployments in a namespace, optionally filtered by label and field selectors"""
+    return await _paginated_list("deployments", namespace, limit, continue_token, stream,
+                                 _list_filters(label_selector, field_selector, resource_version, resource_version_match),
+                                 game_manager.list_deployments, namespace)
 
 @app.get("/k8s/namespaces")
-def list_namespaces():
+async def list_namespaces(
+    limit: Optional[int] = Query(None, ge=1, le=5000),
+    continue_token: Optional[str] = Query(None, alias="continue"),
+    stream: bool = False,
+    label_selector: Optional[str] = None,
+    field_selector: Optional[str] = None,
+    resource_version: Optional[str] = None,
+    resource_version_match: Optional[str] = None
+):
     """List all namespaces"""
-    try:
-        namespaces = game_manager.list_namespaces()
-        return {"namespaces": namespaces, "count": len(namespaces)}
-    except Exception as e:
-        logger.error(f"Failed to list namespaces: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return await _paginated_list("namespaces", None, limit, continue_token, stream,
+                                 _list_filters(label_selector, field_selector, resource_version, resource_version_match),
+                                 game_manager.list_namespaces)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,328 @@
+"""
+Metrics for KubeChaos
+Prometheus counters, gauges and histograms with per-thread recording and scrape-time aggregation
+"""
+
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Any
+import threading
+import time
+import weakref
+
+# Latency buckets in seconds, from fast cache hits to slow apiserver calls
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _ShardOwner:
+    """Lives in a thread's locals and is freed when the thread exits"""
+
+    __slots__ = ("__weakref__",)
+
+
+class _ThreadShards:
+    """
+    One dict per recording thread.
+
+    A thread only ever writes its own shard, so recording takes no lock;
+    the lock is only held to register or retire a shard and to copy the
+    shard list at scrape time. When a thread exits its shard is folded into
+    a retired total with merge, so counters never go backwards and short-lived
+    threads do not accumulate shards.
+    """
+
+    def __init__(self, merge: Callable[[Dict, Dict], None]):
+        self._local = threading.local()
+        self._shards: Dict[int, Dict] = {}
+        # Replaced, never mutated, so a scrape can read it outside the lock
+        self._retired: Dict = {}
+        self._merge = merge
+        self._lock = threading.Lock()
+
+    def get(self) -> Dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            owner = _ShardOwner()
+            self._local.shard = shard
+            self._local.owner = owner
+            with self._lock:
+                self._shards[id(shard)] = shard
+            weakref.finalize(owner, self._retire, shard)
+        return shard
+
+    def _retire(self, shard: Dict):
+        with self._lock:
+            retired = dict(self._retired)
+            self._merge(retired, shard)
+            self._retired = retired
+            del self._shards[id(shard)]
+
+    def collect(self) -> List[Dict]:
+        with self._lock:
+            return list(self._shards.values()) + [self._retired]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic counter with optional labels"""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._shards = _ThreadShards(self._merge)
+
+    def inc(self, *labels: Any, amount: float = 1):
+        shard = self._shards.get()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    @staticmethod
+    def _merge(into: Dict, shard: Dict):
+        for labels, value in list(shard.items()):
+            into[labels] = into.get(labels, 0) + value
+
+    def values(self) -> Dict[tuple, float]:
+        totals: Dict[tuple, float] = {}
+        for shard in self._shards.collect():
+            self._merge(totals, shard)
+        return totals
+
+    def render(self) -> Iterable[str]:
+        values = self.values()
+        if not values and not self.labelnames:
+            values = {(): 0}
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    """Gauge that can go up and down; increments and decrements may come from different threads"""
+
+    metric_type = "gauge"
+
+    def dec(self, *labels: Any, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram:
+    """Cumulative histogram with optional labels"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._shards = _ThreadShards(self._merge)
+
+    def observe(self, value: float, *labels: Any):
+        shard = self._shards.get()
+        series = shard.get(labels)
+        if series is None:
+            # Per-bucket (non-cumulative) counts with a final +Inf slot, then sum
+            series = shard[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def time(self, *labels: Any) -> "_Timer":
+        """Context manager that observes the elapsed time of its block"""
+        return _Timer(self, labels)
+
+    @staticmethod
+    def _merge(into: Dict, shard: Dict):
+        # Builds new series rather than adding in place, since into may share them with a retired total
+        for labels, (counts, total) in list(shard.items()):
+            merged = into.get(labels)
+            into[labels] = [[a + b for a, b in zip(merged[0], counts)], merged[1] + total] if merged \
+                else [list(counts), total]
+
+    def values(self) -> Dict[tuple, list]:
+        totals: Dict[tuple, list] = {}
+        for shard in self._shards.collect():
+            self._merge(totals, shard)
+        return totals
+
+    def render(self) -> Iterable[str]:
+        for labels, (counts, total) in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield (f"{self.name}_bucket"
+                       f"{_format_labels(self.labelnames, labels, ('le', _format_value(float(bound))))} {cumulative}")
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}"
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: tuple):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.started, *self.labels)
+
+
+class GaugeFunc:
+    """Gauge computed at scrape time; the callback returns {label values: value}"""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str],
+                 callback: Callable[[], Dict[tuple, float]]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def render(self) -> Iterable[str]:
+        for labels, value in sorted(self.callback().items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Registry:
+    """Collection of metrics rendered together in the Prometheus text format"""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_func(self, name: str, documentation: str, labelnames: Sequence[str],
+                   callback: Callable[[], Dict[tuple, float]]) -> GaugeFunc:
+        return self.register(GaugeFunc(name, documentation, labelnames, callback))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.metric_type}")
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                # A failing callback must not break the whole scrape
+                lines.append(f"# {metric.name} unavailable: {e}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# HTTP
+HTTP_REQUESTS = REGISTRY.counter(
+    "kubechaos_http_requests_total", "HTTP requests by route and status code", ("method", "route", "code"))
+HTTP_DURATION = REGISTRY.histogram(
+    "kubechaos_http_request_duration_seconds", "HTTP request latency by route", ("method", "route"))
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "kubechaos_http_requests_in_flight", "HTTP requests currently being served")
+
+# Apiserver
+APISERVER_REQUESTS = REGISTRY.counter(
+    "kubechaos_apiserver_requests_total", "Apiserver calls by verb, resource and status code",
+    ("verb", "resource", "code"))
+APISERVER_DURATION = REGISTRY.histogram(
+    "kubechaos_apiserver_request_duration_seconds",
+    "Apiserver call latency by verb and resource (until response headers for streams)",
+    ("verb", "resource"))
+
+# Caches
+LIST_CACHE_REQUESTS = REGISTRY.counter(
+    "kubechaos_list_cache_requests_total", "Informer cache lookups by kind and result (hit, miss, or uncached when no informer may be started)",
+    ("kind", "result"))
+
+
+def classify_api_call(resource_path: str, method: str, path_params: Optional[Dict[str, Any]],
+                      query_params: Optional[List[tuple]]) -> Tuple[str, str]:
+    """
+    Map an apiserver call to (verb, resource) as the apiserver's own metrics do,
+    e.g. GET /api/v1/namespaces/{namespace}/pods/{name}/log -> ("get", "pods/log")
+    """
+    path_params = path_params or {}
+    parts = [p for p in resource_path.strip("/").split("/") if p]
+
+    # Drop the API prefix: api/v1 or apis/{group}/{version}
+    if parts[:1] == ["api"]:
+        parts = parts[2:]
+    elif parts[:1] == ["apis"]:
+        parts = parts[3:]
+    if parts[:2] == ["namespaces", "{namespace}"] and len(parts) > 2:
+        parts = parts[2:]
+
+    named = "{name}" in parts
+    segments = [str(path_params.get(p[1:-1], p)) if p == "{plural}" else p
+                for p in parts if p == "{plural}" or not p.startswith("{")]
+    resource = "/".join(segments) or "unknown"
+
+    method = method.upper()
+    if method == "GET":
+        watching = any(k == "watch" and v for k, v in (query_params or []))
+        verb = "watch" if watching else ("get" if named else "list")
+    elif method == "DELETE":
+        verb = "delete" if named else "deletecollection"
+    else:
+        verb = {"POST": "create", "PUT": "update", "PATCH": "patch"}.get(method, method.lower())
+    return verb, resource
+
+
+def instrument_api_client(api_client):
+    """Record count, latency and status of every call made through a kubernetes ApiClient"""
+    call_api = api_client.call_api
+
+    def timed_call_api(resource_path, method, path_params=None, query_params=None, *args, **kwargs):
+        verb, resource = classify_api_call(resource_path, method, path_params, query_params)
+        started = time.perf_counter()
+        code = "error"
+        try:
+            result = call_api(resource_path, method, path_params, query_params, *args, **kwargs)
+            code = "2xx"
+            return result
+        except Exception as e:
+            status = getattr(e, "status", None)
+            code = str(status) if status else "error"
+            raise
+        finally:
+            APISERVER_DURATION.observe(time.perf_counter() - started, verb, resource)
+            APISERVER_REQUESTS.inc(verb, resource, code)
+
+    api_client.call_api = timed_call_api
+    return api_client
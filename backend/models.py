@@ -88,6 +88,13 @@ class GameScore(BaseModel):
     incidentsResolved: int
     proactiveChecks: int
 
+class HistorySummary(BaseModel):
+    entries: int
+    bytes: int
+    firstSeq: int
+    lastSeq: int
+    dropped: int
+
 class GameState(BaseModel):
     isGameRunning: bool
     gameStartTime: Optional[datetime]
@@ -100,6 +107,8 @@ class GameState(BaseModel):
     terminalHistory: List[str]
     currentCommand: str
     score: GameScore
+    historySummary: Optional[HistorySummary] = None
+    activeScenario: Optional[str] = None
 
 # New Models for Chaos Mesh Integration
 class ChaosExperimentStatus(str, Enum):
@@ -128,6 +137,12 @@ class ScenarioInfo(BaseModel):
     max_score: int
     hints: List[str]
 
+class ConnectionState(str, Enum):
+    connecting = "connecting"
+    real = "real"
+    simulation = "simulation"
+    degraded = "degraded"
+
 class ClusterStatus(BaseModel):
     connected: bool
     chaos_mesh_installed: bool
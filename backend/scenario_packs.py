@@ -0,0 +1,318 @@
+"""
+Scenario packs for KubeChaos
+Loads scenarios from a directory of YAML files into the scenario registry.
+Validation results are cached by file hash, and files that change on disk
+are reloaded on their own without touching the rest of the registry.
+"""
+
+from game_scenarios import GameScenario, Difficulty, ScenarioCategory, ScenarioRegistry
+from typing import Dict, List, Optional, Tuple, Any
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# The libyaml parser when PyYAML was built with it, otherwise the pure-Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump when validation rules change so cached results are not trusted across versions
+SCHEMA_VERSION = 1
+
+PACK_SUFFIXES = (".yaml", ".yml")
+CHAOS_TYPES = ("PodChaos", "NetworkChaos", "StressChaos", "IOChaos", "Workflow")
+
+# Scenario ids end up in experiment names (game-{id}-{batch}-{n}), which must stay valid DNS labels
+ID_PATTERN = re.compile(r"^[a-z0-9]([a-z0-9-]{0,38}[a-z0-9])?$")
+
+# field -> (type, required, default)
+FIELDS: Dict[str, Tuple[type, bool, Any]] = {
+    "id": (str, True, None),
+    "name": (str, True, None),
+    "description": (str, True, None),
+    "difficulty": (str, True, None),
+    "category": (str, True, None),
+    "learning_objectives": (list, False, []),
+    "chaos_config": (dict, True, None),
+    "success_criteria": (dict, False, {}),
+    "hints": (list, False, []),
+    "time_limit_seconds": (int, False, 300),
+    "max_score": (int, False, 1000),
+}
+
+
+def validate_scenario(data: Any, where: str) -> Tuple[Optional[Dict[str, Any]], List[str]]:
+    """Check one scenario mapping; returns it with defaults filled in, or the errors"""
+    if not isinstance(data, dict):
+        return None, [f"{where}: expected a mapping, got {type(data).__name__}"]
+    where = f"{where} ({data['id']})" if isinstance(data.get("id"), str) else where
+
+    errors = [f"{where}: unknown field {key!r}" for key in data if key not in FIELDS]
+    spec: Dict[str, Any] = {}
+    for field, (kind, required, default) in FIELDS.items():
+        if field not in data:
+            if required:
+                errors.append(f"{where}: missing {field}")
+            else:
+                spec[field] = copy.deepcopy(default)
+            continue
+        value = data[field]
+        # bool is an int subclass, but "time_limit_seconds: yes" is a mistake
+        if not isinstance(value, kind) or (kind is int and isinstance(value, bool)):
+            errors.append(f"{where}: {field} must be a {kind.__name__}")
+            continue
+        spec[field] = value
+    if errors:
+        return None, errors
+
+    if not ID_PATTERN.match(spec["id"]):
+        errors.append(f"{where}: id must be lowercase letters, digits and '-', at most 40 characters")
+    if spec["difficulty"] not in [d.value for d in Difficulty]:
+        errors.append(f"{where}: difficulty must be one of {', '.join(d.value for d in Difficulty)}")
+    if spec["category"] not in [c.value for c in ScenarioCategory]:
+        errors.append(f"{where}: category must be one of {', '.join(c.value for c in ScenarioCategory)}")
+    if spec["chaos_config"].get("type") not in CHAOS_TYPES:
+        errors.append(f"{where}: chaos_config.type must be one of {', '.join(CHAOS_TYPES)}")
+    for field in ("learning_objectives", "hints"):
+        if not all(isinstance(item, str) for item in spec[field]):
+            errors.append(f"{where}: {field} must be a list of strings")
+    for field in ("time_limit_seconds", "max_score"):
+        if spec[field] <= 0:
+            errors.append(f"{where}: {field} must be positive")
+    return (None, errors) if errors else (spec, [])
+
+
+def parse_pack(text: str, name: str) -> Dict[str, Any]:
+    """
+    Parse and validate one pack file. A file holds one scenario, a list of
+    them under `scenarios:`, or several YAML documents of either form.
+    Returns {"scenarios": [...], "errors": [...]}; any error rejects the file.
+    """
+    try:
+        documents = [doc for doc in yaml.load_all(text, Loader=YAML_LOADER) if doc is not None]
+    except yaml.YAMLError as e:
+        return {"scenarios": [], "errors": [f"{name}: invalid YAML: {e}"]}
+
+    entries = []
+    for doc in documents:
+        if isinstance(doc, dict) and set(doc) == {"scenarios"} and isinstance(doc["scenarios"], list):
+            entries.extend(doc["scenarios"])
+        else:
+            entries.append(doc)
+
+    scenarios, errors, seen = [], [], set()
+    for index, entry in enumerate(entries):
+        spec, entry_errors = validate_scenario(entry, f"{name}[{index}]")
+        errors.extend(entry_errors)
+        if spec:
+            if spec["id"] in seen:
+                errors.append(f"{name}[{index}]: duplicate id {spec['id']!r}")
+            seen.add(spec["id"])
+            scenarios.append(spec)
+    if not entries:
+        errors.append(f"{name}: no scenarios")
+    return {"scenarios": [] if errors else scenarios, "errors": errors}
+
+
+def build_scenario(spec: Dict[str, Any]) -> GameScenario:
+    return GameScenario(**{
+        **spec,
+        "difficulty": Difficulty(spec["difficulty"]),
+        "category": ScenarioCategory(spec["category"])
+    })
+
+
+class ValidationCache:
+    """
+    parse_pack results keyed by the SHA-256 of the file contents, persisted as
+    JSON so a restart only hashes unchanged files instead of parsing them
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        if path:
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                if data.get("schema") == SCHEMA_VERSION:
+                    self._entries = data.get("entries", {})
+            except (OSError, ValueError):
+                pass
+
+    def get(self, digest: str) -> Optional[Dict[str, Any]]:
+        return self._entries.get(digest)
+
+    def put(self, digest: str, result: Dict[str, Any]):
+        self._entries[digest] = result
+        self._dirty = True
+
+    def save(self, keep: set):
+        """Write the cache, dropping results for contents no longer on disk"""
+        stale = set(self._entries) - keep
+        if stale:
+            for digest in stale:
+                del self._entries[digest]
+            self._dirty = True
+        if not self._dirty or not self.path:
+            return
+        try:
+            with open(f"{self.path}.tmp", "w") as f:
+                json.dump({"schema": SCHEMA_VERSION, "entries": self._entries}, f)
+            os.replace(f"{self.path}.tmp", self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not write scenario validation cache {self.path}: {e}")
+            self.path = None
+
+
+class PackFile:
+    """What was last loaded from one pack file"""
+
+    __slots__ = ("mtime_ns", "size", "digest", "ids")
+
+    def __init__(self, mtime_ns: int, size: int, digest: str, ids: List[str]):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.digest = digest
+        self.ids = ids
+
+
+class ScenarioPackLoader:
+    """
+    Keeps a registry in step with a directory of scenario pack files.
+
+    Each scan() stats every pack file and only reads files whose size or
+    mtime changed, only validates contents whose hash is not in the cache,
+    and applies all additions and removals to the registry at once. A file
+    that fails validation keeps its previously loaded scenarios. Packs may
+    replace built-in scenarios by id; the built-in comes back when the pack
+    scenario is removed.
+    """
+
+    def __init__(self, directory: str, registry: ScenarioRegistry, cache_file: Optional[str] = None):
+        self.directory = directory
+        self.registry = registry
+        self.cache = ValidationCache(cache_file or os.path.join(directory, ".kubechaos-validated.json"))
+        self.errors: Dict[str, List[str]] = {}
+        self._files: Dict[str, PackFile] = {}
+        self._owners: Dict[str, str] = {}
+        self._builtins = {s.id: s for s in registry.all()}
+        self._lock = threading.Lock()
+
+    def _pack_files(self) -> Dict[str, os.stat_result]:
+        found = {}
+        for root, dirs, files in os.walk(self.directory):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            for name in sorted(files):
+                if name.endswith(PACK_SUFFIXES) and not name.startswith("."):
+                    path = os.path.join(root, name)
+                    try:
+                        found[path] = os.stat(path)
+                    except OSError:
+                        pass
+        return found
+
+    def scan(self) -> Dict[str, int]:
+        """Load new and changed pack files and drop deleted ones; returns counts of what changed"""
+        with self._lock:
+            if not os.path.isdir(self.directory):
+                logger.warning(f"Scenario pack directory {self.directory} does not exist")
+                return {"loaded": 0, "removed": 0, "failed": 0}
+
+            add: Dict[str, GameScenario] = {}
+            release: List[str] = []
+            counts = {"loaded": 0, "removed": 0, "failed": 0}
+            found = self._pack_files()
+
+            for path, stat in found.items():
+                known = self._files.get(path)
+                if known and known.mtime_ns == stat.st_mtime_ns and known.size == stat.st_size:
+                    continue
+                try:
+                    with open(path, "rb") as f:
+                        content = f.read()
+                except OSError as e:
+                    logger.error(f"Could not read scenario pack {path}: {e}")
+                    continue
+                digest = hashlib.sha256(content).hexdigest()
+                if known and known.digest == digest:
+                    known.mtime_ns, known.size = stat.st_mtime_ns, stat.st_size
+                    continue
+
+                result = self.cache.get(digest)
+                if result is None:
+                    result = parse_pack(content.decode("utf-8", errors="replace"), os.path.relpath(path, self.directory))
+                    self.cache.put(digest, result)
+
+                errors = list(result["errors"]) + [
+                    f"{os.path.relpath(path, self.directory)}: id {spec['id']!r} is already defined in "
+                    f"{os.path.relpath(self._owners[spec['id']], self.directory)}"
+                    for spec in result["scenarios"]
+                    if self._owners.get(spec["id"], path) != path
+                ]
+                if errors:
+                    if self.errors.get(path) != errors:
+                        for error in errors:
+                            logger.error(f"Scenario pack rejected: {error}")
+                        counts["failed"] += 1
+                    self.errors[path] = errors
+                    # Invalid contents are not re-read until the file changes. An id clash is
+                    # retried on the next scan, since the other file may be giving the id up
+                    if result["errors"]:
+                        old_ids = known.ids if known else []
+                        self._files[path] = PackFile(stat.st_mtime_ns, stat.st_size, digest, old_ids)
+                    continue
+
+                new_ids = [spec["id"] for spec in result["scenarios"]]
+                release.extend(i for i in (known.ids if known else []) if i not in new_ids)
+                for spec in result["scenarios"]:
+                    add[spec["id"]] = build_scenario(spec)
+                    self._owners[spec["id"]] = path
+                self._files[path] = PackFile(stat.st_mtime_ns, stat.st_size, digest, new_ids)
+                self.errors.pop(path, None)
+                counts["loaded"] += 1
+
+            for path in [p for p in self._files if p not in found]:
+                release.extend(self._files.pop(path).ids)
+                self.errors.pop(path, None)
+                counts["removed"] += 1
+
+            # Released ids go away, or fall back to the built-in scenario they replaced
+            remove = []
+            for scenario_id in release:
+                self._owners.pop(scenario_id, None)
+                if scenario_id in self._builtins:
+                    add[scenario_id] = self._builtins[scenario_id]
+                else:
+                    remove.append(scenario_id)
+            if add or remove:
+                self.registry.update(add=add.values(), remove=remove)
+
+            self.cache.save({f.digest for f in self._files.values()})
+            if any(counts.values()):
+                logger.info(f"Scenario packs: {counts['loaded']} files loaded, {counts['removed']} removed, "
+                            f"{counts['failed']} rejected; {len(self.registry)} scenarios available")
+            return counts
+
+    def watch(self, interval: float, stop_event: threading.Event):
+        """Rescan every interval seconds until stop_event is set"""
+        while not stop_event.wait(interval):
+            try:
+                self.scan()
+            except Exception as e:
+                logger.error(f"Scenario pack reload failed: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "directory": self.directory,
+            "files": len(self._files),
+            "scenarios": len(self._owners),
+            "errors": {os.path.relpath(path, self.directory): errors for path, errors in self.errors.items()}
+        }
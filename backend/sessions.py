@@ -0,0 +1,249 @@
+"""
+Game Sessions for KubeChaos
+Per-player game state keyed by a session token, with idle eviction and a memory budget
+"""
+
+from models import GameState, GameScore, HistorySummary
+from terminal_history import TerminalHistory
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Any
+from datetime import datetime
+import logging
+import secrets
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Session used by clients that do not send a token; never evicted
+DEFAULT_SESSION = "default"
+
+# Rough fixed cost of a session (GameState, score, bookkeeping) on top of its history bytes
+SESSION_OVERHEAD_BYTES = 4096
+
+
+class UnknownSession(KeyError):
+    """A session token that was never issued, or whose session has been evicted or ended"""
+
+
+class GameSession:
+    """One player's game state, terminal history and state revision"""
+
+    # GameState fields tracked for /status deltas; currentTime changes on every read and is excluded
+    STATE_FIELDS = (
+        "isGameRunning", "gameStartTime", "pods", "services", "deployments", "chaosEvents",
+        "activeEvents", "terminalHistory", "currentCommand", "score", "historySummary",
+        "activeScenario"
+    )
+
+    __slots__ = ("token", "game_state", "history", "epoch", "revision", "_field_revisions", "_lock", "last_seen",
+                 "counted_bytes")
+
+    def __init__(self, token: str, history_max_entries: int, history_max_bytes: int,
+                 on_resize: Optional[Callable[["GameSession", int], None]] = None):
+        self.token = token
+        self.game_state = self._initialize_state()
+        self.history = TerminalHistory(history_max_entries, history_max_bytes,
+                                       on_resize=(lambda delta: on_resize(self, delta)) if on_resize else None)
+
+        # Monotonic state revision and the revision at which each field last changed. Revisions
+        # restart at 0 with every new session object, so they are only compared within one epoch
+        self.epoch = secrets.token_hex(4)
+        self.revision = 0
+        self._field_revisions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.last_seen = time.monotonic()
+        # Bytes the owning SessionStore has counted for this session; None once it left the store
+        self.counted_bytes: Optional[int] = None
+
+    @staticmethod
+    def _initialize_state() -> GameState:
+        """Initialize game state"""
+        return GameState(
+            isGameRunning=False,
+            gameStartTime=None,
+            currentTime=datetime.now(),
+            pods=[],
+            services=[],
+            deployments=[],
+            chaosEvents=[],
+            activeEvents=[],
+            terminalHistory=[],
+            currentCommand="",
+            score=GameScore(
+                totalScore=0,
+                mttr=0.0,
+                commandsUsed=0,
+                incidentsResolved=0,
+                proactiveChecks=0
+            )
+        )
+
+    def reset(self):
+        """Start over with a fresh state and empty history"""
+        self.game_state = self._initialize_state()
+        self.history.clear()
+        self.touch()
+
+    def touch(self, *fields: str):
+        """Record that the given GameState fields changed"""
+        with self._lock:
+            self.revision += 1
+            for field in fields or self.STATE_FIELDS:
+                self._field_revisions[field] = self.revision
+
+    @property
+    def revision_token(self) -> str:
+        """The revision qualified by the epoch, as handed to clients, e.g. 3f2a9c1e.42"""
+        return f"{self.epoch}.{self.revision}"
+
+    def etag(self, history_entries: int) -> str:
+        """Weak ETag for /status; the body also depends on how much history is included"""
+        return f'W/"{self.revision_token}-{history_entries}"'
+
+    def get_state(self, history_entries: int) -> GameState:
+        """Current game state with only the last history_entries terminal lines"""
+        self.game_state.currentTime = datetime.now()
+        self.game_state.terminalHistory = self.history.tail(history_entries)
+        self.game_state.historySummary = HistorySummary(**self.history.summary())
+        return self.game_state
+
+    def changed_fields(self, since: str) -> tuple:
+        """
+        Return (revision token, fields changed after the revision token `since`, full)
+
+        A token from another epoch (a restart, or a session that was evicted
+        and recreated) or one that cannot be parsed says nothing about this
+        session, so every field is returned and full is True.
+        """
+        epoch, _, revision = since.partition(".")
+        with self._lock:
+            if epoch != self.epoch or not revision.isdigit() or int(revision) > self.revision:
+                return self.revision_token, list(self.STATE_FIELDS), True
+            return self.revision_token, [f for f, rev in self._field_revisions.items() if rev > int(revision)], False
+
+    def size_bytes(self) -> int:
+        """Approximate memory held by this session"""
+        return SESSION_OVERHEAD_BYTES + self.history.summary()["bytes"]
+
+
+class SessionStore:
+    """
+    LRU map of session token -> GameSession.
+
+    Sessions idle for longer than idle_timeout are dropped, and when the
+    sessions together exceed memory_budget bytes the least recently used
+    ones are evicted until they fit. Eviction runs on access, so there is
+    no sweeper thread. The default session is never evicted. The memory in
+    use is kept as a running total that histories update as they grow and
+    shrink, so eviction does not walk every session.
+    """
+
+    def __init__(self, idle_timeout: float = 3600.0, memory_budget: int = 64 * 1024 * 1024,
+                 history_max_entries: int = 1000, history_max_bytes: int = 1024 * 1024):
+        self.idle_timeout = idle_timeout
+        self.memory_budget = memory_budget
+        self.history_max_entries = history_max_entries
+        self.history_max_bytes = history_max_bytes
+        self._sessions: "OrderedDict[str, GameSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Guards _bytes and counted_bytes; histories report growth without taking _lock
+        self._bytes_lock = threading.Lock()
+        self._bytes = 0
+        self.evicted_idle = 0
+        self.evicted_memory = 0
+
+    def create(self) -> GameSession:
+        """Start a session under a new random token"""
+        with self._lock:
+            return self._add(secrets.token_urlsafe(16), time.monotonic())
+
+    def get(self, token: Optional[str] = None) -> GameSession:
+        """
+        Get the session for token; no token means the default session
+
+        Only tokens issued by create() are accepted. An unknown token, or one
+        whose session was evicted or ended, raises UnknownSession rather than
+        silently starting a new session under a client-chosen token.
+        """
+        token = token or DEFAULT_SESSION
+        now = time.monotonic()
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                if token != DEFAULT_SESSION:
+                    raise UnknownSession(token)
+                return self._add(token, now)
+            self._sessions.move_to_end(token)
+            session.last_seen = now
+            self._evict(now, keep=token)
+            return session
+
+    def remove(self, token: str) -> bool:
+        with self._lock:
+            session = self._sessions.pop(token, None)
+            if session is None:
+                return False
+            self._untrack(session)
+            return True
+
+    def sessions(self) -> List[GameSession]:
+        with self._lock:
+            return list(self._sessions.values())
+
+    def _add(self, token: str, now: float) -> GameSession:
+        session = GameSession(token, self.history_max_entries, self.history_max_bytes, on_resize=self._resize)
+        session.last_seen = now
+        self._sessions[token] = session
+        with self._bytes_lock:
+            session.counted_bytes = session.size_bytes()
+            self._bytes += session.counted_bytes
+        self._evict(now, keep=token)
+        return session
+
+    def _resize(self, session: GameSession, delta: int):
+        """A session's history grew or shrank by delta bytes"""
+        with self._bytes_lock:
+            # Output recorded after the session left the store is not counted
+            if session.counted_bytes is not None:
+                session.counted_bytes += delta
+                self._bytes += delta
+
+    def _untrack(self, session: GameSession):
+        with self._bytes_lock:
+            self._bytes -= session.counted_bytes or 0
+            session.counted_bytes = None
+
+    def _evict(self, now: float, keep: str):
+        """Drop idle sessions, then least recently used ones while over the memory budget"""
+        for token, session in list(self._sessions.items()):
+            # Ordered by last use, so the first recent session ends the idle scan
+            if now - session.last_seen <= self.idle_timeout:
+                break
+            if token not in (keep, DEFAULT_SESSION):
+                del self._sessions[token]
+                self._untrack(session)
+                self.evicted_idle += 1
+
+        if self._bytes <= self.memory_budget:
+            return
+        for token, session in list(self._sessions.items()):
+            if self._bytes <= self.memory_budget:
+                break
+            if token not in (keep, DEFAULT_SESSION):
+                del self._sessions[token]
+                self._untrack(session)
+                self.evicted_memory += 1
+                logger.info("Evicted least recently used session to stay within the memory budget")
+
+    def stats(self) -> Dict[str, Any]:
+        """Session count and memory use; tokens are not included"""
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "bytes": self._bytes,
+                "memory_budget": self.memory_budget,
+                "idle_timeout": self.idle_timeout,
+                "evicted_idle": self.evicted_idle,
+                "evicted_memory": self.evicted_memory
+            }
@@ -0,0 +1,1088 @@
+"""
+Simulated Cluster for KubeChaos
+Discrete-event model of pods, deployments, services and Chaos Mesh experiments,
+served through the same interfaces as KubernetesClient and ChaosMeshClient
+"""
+
+from k8s_client import KubernetesClient
+from chaos_mesh_client import ChaosMeshClient, ExperimentList
+from tracing import instrument_class
+from typing import Callable, Dict, Iterator, List, Optional, Any
+from datetime import datetime, timedelta, timezone
+import heapq
+import logging
+import random
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Seconds for a controller to notice a missing pod, and for a new pod to become ready
+POD_RESCHEDULE_DELAY = 2.0
+POD_START_DELAY = 5.0
+# Seconds between restarts of a pod kept failing by pod-failure chaos
+CRASH_LOOP_INTERVAL = 10.0
+# Seconds a memory-stressed pod survives before it is OOMKilled
+OOM_KILL_DELAY = 20.0
+# Seconds between simulated log lines
+LOG_INTERVAL = 5.0
+
+# Deterministic clock origin used when the simulation is not tied to wall-clock time
+SIMULATION_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# The e-commerce application every scenario targets
+ECOMMERCE_TOPOLOGY = [
+    # name, replicas, labels, port
+    ("frontend", 2, {"app": "frontend", "tier": "frontend"}, 80),
+    ("api-gateway", 2, {"app": "api-gateway", "tier": "gateway"}, 8080),
+    ("payment-service", 3, {"app": "payment-service", "tier": "backend"}, 8080),
+    ("product-catalog", 3, {"app": "product-catalog", "tier": "backend"}, 8080),
+    ("cart-service", 2, {"app": "cart-service", "tier": "backend"}, 8080),
+    ("postgres", 1, {"app": "postgres", "tier": "database"}, 5432),
+    ("redis", 1, {"app": "redis", "tier": "cache"}, 6379),
+]
+
+
+def parse_duration(value: Any, default: float = 30.0) -> float:
+    """Parse Chaos Mesh durations such as "30s", "2m", "1h30m" or "500ms" into seconds"""
+    if value is None:
+        return default
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h)", str(value))
+    if not parts:
+        return default
+    scale = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+    return sum(float(amount) * scale[unit] for amount, unit in parts)
+
+
+def parse_label_selector(selector: Optional[str]) -> Dict[str, str]:
+    """Parse an equality-based label selector such as app=web,tier=backend"""
+    return dict(part.strip().split("=", 1) for part in (selector or "").split(",") if "=" in part)
+
+
+def match_selector(values: Dict[str, Any], selector: Optional[str]) -> bool:
+    """
+    Match a label or field selector such as app=web,tier!=cache against values.
+    A bare key (or !key) only checks that the key is present (or absent).
+    """
+    for requirement in (selector or "").split(","):
+        requirement = requirement.strip()
+        if not requirement:
+            continue
+        if "!=" in requirement:
+            key, wanted = requirement.split("!=", 1)
+            if str(values.get(key.strip())) == wanted.strip():
+                return False
+        elif "=" in requirement:
+            key, wanted = requirement.replace("==", "=").split("=", 1)
+            if str(values.get(key.strip())) != wanted.strip():
+                return False
+        elif requirement.startswith("!"):
+            if requirement[1:] in values:
+                return False
+        elif requirement not in values:
+            return False
+    return True
+
+
+class SimPod:
+    """A pod in the simulated cluster"""
+
+    __slots__ = ("name", "namespace", "labels", "deployment", "phase", "ready", "restarts",
+                 "node", "ip", "created", "reason", "effects")
+
+    def __init__(self, name: str, namespace: str, labels: Dict[str, str], deployment: str,
+                 node: str, ip: str, created: float):
+        self.name = name
+        self.namespace = namespace
+        self.labels = labels
+        self.deployment = deployment
+        self.phase = "Pending"
+        self.ready = False
+        self.restarts = 0
+        self.node = node
+        self.ip = ip
+        self.created = created
+        self.reason: Optional[str] = "ContainerCreating"
+        # Active chaos effects keyed by experiment, e.g. {"ecommerce/PodChaos/x": "PodChaos:pod-failure"}
+        self.effects: Dict[str, str] = {}
+
+    @property
+    def status(self) -> str:
+        """Status column as kubectl shows it"""
+        if self.reason in ("CrashLoopBackOff", "OOMKilled"):
+            return self.reason
+        return self.phase
+
+    def fields(self) -> Dict[str, Any]:
+        """Values pod field selectors can match"""
+        return {
+            "metadata.name": self.name,
+            "metadata.namespace": self.namespace,
+            "status.phase": self.phase,
+            "spec.nodeName": self.node,
+            "status.podIP": self.ip
+        }
+
+
+class SimExperiment:
+    """A chaos experiment in the simulated cluster"""
+
+    __slots__ = ("kind", "name", "namespace", "body", "created", "duration", "phase",
+                 "targets", "target_pods", "injected", "timers", "nodes", "children")
+
+    def __init__(self, kind: str, body: Dict[str, Any], created: float):
+        self.kind = kind
+        self.name = body["metadata"]["name"]
+        self.namespace = body["metadata"]["namespace"]
+        self.body = body
+        self.created = created
+        self.duration = parse_duration(body.get("spec", {}).get("duration"))
+        self.phase = "Running"
+        self.targets: List[str] = []
+        # The pods picked at injection, in whichever namespaces the selector named
+        self.target_pods: List[SimPod] = []
+        # False for a workflow step created while its workflow was paused, until it is resumed
+        self.injected = False
+        self.timers: List[list] = []
+        # Workflows only: template phases and the chaos experiments the workflow created
+        self.nodes: Dict[str, Dict[str, str]] = {}
+        self.children: List["SimExperiment"] = []
+
+    @property
+    def key(self) -> str:
+        return f"{self.kind}/{self.name}"
+
+    @property
+    def effect_key(self) -> str:
+        """Key of this experiment's effects on pods, which may live in other namespaces"""
+        return f"{self.namespace}/{self.kind}/{self.name}"
+
+
+class SimulatedCluster:
+    """
+    Discrete-event simulation of a small Kubernetes cluster with Chaos Mesh.
+
+    Nothing runs in the background: pending events are processed lazily up to
+    the current simulated time whenever the cluster is read or changed. With
+    realtime=True simulated time follows the wall clock (scaled by speed);
+    with realtime=False it only moves through advance(), which makes runs
+    fully deterministic for a given seed.
+    """
+
+    def __init__(self, seed: int = 0, realtime: bool = True, speed: float = 1.0,
+                 namespace: str = "ecommerce", nodes: int = 3):
+        self.seed = seed
+        self.realtime = realtime
+        self.speed = speed
+        self.nodes = [f"sim-node-{i}" for i in range(nodes)]
+        self._rng = random.Random(seed)
+        self._lock = threading.RLock()
+
+        self._now = 0.0
+        self._offset = 0.0
+        self._started = time.monotonic()
+        self._epoch = datetime.now(timezone.utc) if realtime else SIMULATION_EPOCH
+
+        self._queue: List[list] = []  # [time, seq, callback, args, active]
+        self._seq = 0
+        self._ip_counter = 10
+
+        self.namespaces = ["default", "kube-system", namespace]
+        self.pods: Dict[str, Dict[str, SimPod]] = {}
+        self.deployments: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.services: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.experiments: Dict[str, Dict[str, SimExperiment]] = {}
+        self._listeners: Dict[str, List[Callable]] = {}
+
+        self.events_processed = 0
+        self._seed_namespace(namespace)
+
+    # Clock
+    def now(self) -> float:
+        """Current simulated time in seconds"""
+        with self._lock:
+            self._sync()
+            return self._now
+
+    def advance(self, seconds: float):
+        """Move simulated time forward and process everything due by then"""
+        with self._lock:
+            self._offset += seconds
+            self._sync()
+
+    def timestamp(self, sim_time: float) -> datetime:
+        return self._epoch + timedelta(seconds=sim_time)
+
+    def _target_time(self) -> float:
+        elapsed = (time.monotonic() - self._started) * self.speed if self.realtime else 0.0
+        return elapsed + self._offset
+
+    def _sync(self):
+        """Process queued events up to the current simulated time"""
+        target = self._target_time()
+        while self._queue and self._queue[0][0] <= target:
+            when, _, callback, args, active = heapq.heappop(self._queue)
+            if not active:
+                continue
+            self._now = max(self._now, when)
+            self.events_processed += 1
+            callback(*args)
+        self._now = max(self._now, target)
+
+    def _schedule(self, delay: float, callback: Callable, *args) -> list:
+        self._seq += 1
+        entry = [self._now + delay, self._seq, callback, args, True]
+        heapq.heappush(self._queue, entry)
+        return entry
+
+    @staticmethod
+    def _cancel(entry: list):
+        entry[4] = False
+
+    # Topology
+    def _seed_namespace(self, namespace: str):
+        self.pods.setdefault(namespace, {})
+        self.deployments.setdefault(namespace, {})
+        self.services.setdefault(namespace, {})
+        self.experiments.setdefault(namespace, {})
+
+        for index, (name, replicas, labels, port) in enumerate(ECOMMERCE_TOPOLOGY):
+            self.deployments[namespace][name] = {"name": name, "replicas": replicas, "labels": dict(labels)}
+            self.services[namespace][name] = {
+                "name": name,
+                "namespace": namespace,
+                "type": "LoadBalancer" if name == "frontend" else "ClusterIP",
+                "cluster_ip": f"10.96.{index}.{10 + index}",
+                "ports": [{"port": port, "target_port": str(port), "protocol": "TCP"}],
+                "selector": {"app": labels["app"]},
+                "labels": dict(labels)
+            }
+            for _ in range(replicas):
+                pod = self._new_pod(namespace, name)
+                self._mark_running(pod, notify=False)
+
+    def _new_pod(self, namespace: str, deployment: str) -> SimPod:
+        suffix = "".join(self._rng.choice("bcdfghjklmnpqrstvwxz2456789") for _ in range(5))
+        labels = dict(self.deployments[namespace][deployment]["labels"])
+        self._ip_counter += 1
+        pod = SimPod(
+            name=f"{deployment}-{suffix}",
+            namespace=namespace,
+            labels=labels,
+            deployment=deployment,
+            node=self.nodes[self._ip_counter % len(self.nodes)],
+            ip=f"10.244.{self._ip_counter // 250}.{self._ip_counter % 250}",
+            created=self._now
+        )
+        self.pods[namespace][pod.name] = pod
+        return pod
+
+    # Listeners
+    def add_listener(self, namespace: str, listener: Callable):
+        with self._lock:
+            self._listeners.setdefault(namespace, []).append(listener)
+
+    def remove_listener(self, namespace: str, listener: Callable):
+        with self._lock:
+            listeners = self._listeners.get(namespace, [])
+            if listener in listeners:
+                listeners.remove(listener)
+
+    def _change_pod(self, pod: SimPod, event_type: str = "MODIFIED", notify: bool = True, **changes):
+        """Apply attribute changes to a pod and tell listeners"""
+        listeners = self._listeners.get(pod.namespace) if notify else None
+        old = self.pod_to_dict(pod) if listeners and event_type != "ADDED" else None
+        for attr, value in changes.items():
+            setattr(pod, attr, value)
+        if listeners:
+            new = None if event_type == "DELETED" else self.pod_to_dict(pod)
+            for listener in list(listeners):
+                try:
+                    listener(event_type, old, new)
+                except Exception as e:
+                    logger.error(f"Simulated pod listener failed: {e}")
+
+    # Controllers
+    def _mark_running(self, pod: SimPod, notify: bool = True):
+        if pod.name not in self.pods.get(pod.namespace, {}):
+            return
+        self._change_pod(pod, notify=notify, phase="Running", ready=True, reason=None)
+
+    def _delete_pod(self, pod: SimPod):
+        """Remove a pod and let its deployment controller replace it"""
+        if self.pods[pod.namespace].pop(pod.name, None) is None:
+            return
+        self._change_pod(pod, "DELETED")
+        self._schedule(POD_RESCHEDULE_DELAY, self._reconcile, pod.namespace, pod.deployment)
+
+    def _reconcile(self, namespace: str, deployment: str):
+        """Deployment controller: create or remove pods to match the desired replicas"""
+        spec = self.deployments[namespace].get(deployment)
+        if not spec:
+            return
+        pods = self._deployment_pods(namespace, deployment)
+        missing = spec["replicas"] - len(pods)
+
+        for _ in range(missing):
+            pod = self._new_pod(namespace, deployment)
+            self._change_pod(pod, "ADDED")
+            self._schedule(POD_START_DELAY, self._mark_running, pod)
+        for pod in sorted(pods, key=lambda p: p.created, reverse=True)[:max(0, -missing)]:
+            self.pods[namespace].pop(pod.name, None)
+            self._change_pod(pod, "DELETED")
+
+    def _deployment_pods(self, namespace: str, deployment: str) -> List[SimPod]:
+        return [p for p in self.pods.get(namespace, {}).values() if p.deployment == deployment]
+
+    # Chaos Injection
+    def _select_targets(self, spec: Dict[str, Any], default_namespace: str) -> List[SimPod]:
+        """Resolve a Chaos Mesh selector and mode to concrete pods"""
+        selector = spec.get("selector", {})
+        namespaces = selector.get("namespaces") or [default_namespace]
+        labels = selector.get("labelSelectors", {})
+
+        candidates = sorted(
+            (pod for ns in namespaces for pod in self.pods.get(ns, {}).values()
+             if all(pod.labels.get(k) == v for k, v in labels.items())),
+            key=lambda p: p.name
+        )
+        if not candidates:
+            return []
+
+        mode = spec.get("mode", "one")
+        value = spec.get("value")
+        if mode == "all":
+            count = len(candidates)
+        elif mode == "fixed":
+            count = int(value or 1)
+        elif mode == "fixed-percent":
+            count = max(1, len(candidates) * int(value or 100) // 100)
+        elif mode == "random-max-percent":
+            count = self._rng.randint(1, max(1, len(candidates) * int(value or 100) // 100))
+        else:
+            count = 1
+        return self._rng.sample(candidates, min(count, len(candidates)))
+
+    def _inject(self, experiment: SimExperiment):
+        """Pick an experiment's target pods and apply its effect to them"""
+        targets = self._select_targets(experiment.body.get("spec", {}), experiment.namespace)
+        experiment.targets = [pod.name for pod in targets]
+        experiment.target_pods = targets
+        experiment.injected = True
+        self._apply_effects(experiment, targets, kill=True)
+
+    def _apply_effects(self, experiment: SimExperiment, targets: List[SimPod], kill: bool):
+        """Start the experiment's effect on targets; pod-kill is one-shot and only runs when kill is set"""
+        spec = experiment.body.get("spec", {})
+        action = spec.get("action") or ("stress" if experiment.kind == "StressChaos" else "")
+        key = experiment.effect_key
+
+        for pod in targets:
+            if experiment.kind == "PodChaos" and action == "pod-kill":
+                if kill:
+                    self._delete_pod(pod)
+                continue
+            if pod.name not in self.pods.get(pod.namespace, {}):
+                continue
+
+            pod.effects[key] = f"{experiment.kind}:{action}"
+            if experiment.kind == "PodChaos" and action in ("pod-failure", "container-kill"):
+                self._crash(pod, experiment)
+            elif experiment.kind == "StressChaos" and spec.get("stressors", {}).get("memory"):
+                self._schedule_timer(experiment, OOM_KILL_DELAY, self._oom_kill, pod, experiment)
+            else:
+                self._change_pod(pod)
+
+    def _schedule_timer(self, experiment: SimExperiment, delay: float, callback: Callable, *args):
+        """Schedule an effect timer that pausing or ending the experiment cancels"""
+        experiment.timers = [t for t in experiment.timers if t[0] > self._now]
+        experiment.timers.append(self._schedule(delay, callback, *args))
+
+    def _crash(self, pod: SimPod, experiment: SimExperiment):
+        """Keep a pod in CrashLoopBackOff while the experiment affects it"""
+        if experiment.effect_key not in pod.effects or pod.name not in self.pods.get(pod.namespace, {}):
+            return
+        self._change_pod(pod, ready=False, reason="CrashLoopBackOff", restarts=pod.restarts + 1)
+        self._schedule_timer(experiment, CRASH_LOOP_INTERVAL, self._crash, pod, experiment)
+
+    def _oom_kill(self, pod: SimPod, experiment: SimExperiment):
+        """Memory stress eventually OOMKills the container, which restarts"""
+        if experiment.effect_key not in pod.effects or pod.name not in self.pods.get(pod.namespace, {}):
+            return
+        self._change_pod(pod, ready=False, reason="OOMKilled", restarts=pod.restarts + 1)
+        self._schedule(POD_START_DELAY, self._mark_running, pod)
+        self._schedule_timer(experiment, OOM_KILL_DELAY, self._oom_kill, pod, experiment)
+
+    def _recover(self, experiment: SimExperiment):
+        """Remove an experiment's effects from the pods it still affects"""
+        for timer in experiment.timers:
+            self._cancel(timer)
+        experiment.timers = []
+
+        for pod in experiment.target_pods:
+            effect = pod.effects.pop(experiment.effect_key, None)
+            if effect and pod.reason in ("CrashLoopBackOff", "OOMKilled") and not pod.effects:
+                self._change_pod(pod, reason=None)
+                self._schedule(POD_START_DELAY, self._mark_running, pod)
+            elif effect:
+                self._change_pod(pod)
+
+    def _finish(self, experiment: SimExperiment):
+        if experiment.phase in ("Running", "Paused"):
+            self._recover(experiment)
+            experiment.phase = "Finished"
+            for child in experiment.children:
+                self._finish(child)
+            for node in experiment.nodes.values():
+                if node["phase"] == "Running":
+                    node["phase"] = "Finished"
+
+    def _pause(self, experiment: SimExperiment, paused: bool):
+        if paused and experiment.phase == "Running":
+            self._recover(experiment)
+            experiment.phase = "Paused"
+        elif not paused and experiment.phase == "Paused":
+            # Resume the effect on the pods picked at injection; a kill is not repeated. A step
+            # its workflow started while paused has not been injected yet, so it is now
+            experiment.phase = "Running"
+            if experiment.kind != "Workflow" and not experiment.injected:
+                self._inject(experiment)
+            else:
+                self._apply_effects(experiment, experiment.target_pods, kill=False)
+        for child in experiment.children:
+            self._pause(child, paused)
+
+    # Workflows
+    def _start_workflow(self, workflow: SimExperiment):
+        """Run the entry template's children one after another (Serial) or all at once (Parallel)"""
+        spec = workflow.body.get("spec", {})
+        templates = {t["name"]: t for t in spec.get("templates", [])}
+        entry = templates.get(spec.get("entry"), {})
+        workflow.nodes = {name: {"type": t.get("templateType"), "phase": "Pending"}
+                          for name, t in templates.items() if name != spec.get("entry")}
+        workflow.duration = parse_duration(entry.get("deadline"), default=workflow.duration)
+
+        children = [templates[name] for name in entry.get("children", []) if name in templates]
+        if entry.get("templateType") == "Parallel":
+            for template in children:
+                self._start_node(workflow, template)
+        else:
+            self._run_serial(workflow, children, 0)
+
+    def _run_serial(self, workflow: SimExperiment, templates: List[Dict[str, Any]], index: int):
+        if index >= len(templates) or workflow.phase == "Finished":
+            return
+        deadline = self._start_node(workflow, templates[index])
+        self._schedule(deadline, self._run_serial, workflow, templates, index + 1)
+
+    def _start_node(self, workflow: SimExperiment, template: Dict[str, Any]) -> float:
+        """Create the chaos experiment for one template; returns its deadline in seconds"""
+        kind = template.get("templateType")
+        deadline = parse_duration(template.get("deadline"))
+        if kind not in ChaosMeshClient.CHAOS_TYPES or kind == "Workflow":
+            workflow.nodes[template["name"]]["phase"] = "Finished"
+            return 0.0
+
+        body = {
+            "apiVersion": workflow.body.get("apiVersion"),
+            "kind": kind,
+            "metadata": {
+                "name": f"{workflow.name}-{template['name']}",
+                "namespace": workflow.namespace,
+                "labels": {ChaosMeshClient.WORKFLOW_LABEL: workflow.name}
+            },
+            "spec": {**template.get(ChaosMeshClient._workflow_spec_key(kind), {}), "duration": f"{deadline}s"}
+        }
+        child = SimExperiment(kind, body, self._now)
+        self.experiments[workflow.namespace][child.key] = child
+        workflow.children.append(child)
+        workflow.nodes[template["name"]]["phase"] = "Running"
+
+        if workflow.phase == "Paused":
+            child.phase = "Paused"
+        else:
+            self._inject(child)
+        self._schedule(deadline, self._finish_node, workflow, template["name"], child)
+        return deadline
+
+    def _finish_node(self, workflow: SimExperiment, template_name: str, child: SimExperiment):
+        self._finish(child)
+        node = workflow.nodes.get(template_name)
+        if node and node["phase"] == "Running":
+            node["phase"] = "Finished"
+        if workflow.nodes and all(n["phase"] == "Finished" for n in workflow.nodes.values()):
+            self._finish(workflow)
+
+    def workflow_nodes(self, namespace: str, name: str) -> Optional[List[Dict[str, Any]]]:
+        """Phase of each template of a workflow"""
+        with self._lock:
+            self._sync()
+            workflow = self.experiments.get(namespace, {}).get(f"Workflow/{name}")
+            if not workflow:
+                return None
+            return [{"name": n, "type": node["type"], "phase": node["phase"]}
+                    for n, node in workflow.nodes.items()]
+
+    # Experiment API
+    def create_experiment(self, kind: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._sync()
+            namespace = body["metadata"]["namespace"]
+            experiments = self.experiments.setdefault(namespace, {})
+            experiment = SimExperiment(kind, body, self._now)
+            if experiment.key in experiments:
+                logger.error(f"Failed to create {kind} experiment: {experiment.name} already exists")
+                return None
+
+            experiments[experiment.key] = experiment
+            if kind == "Workflow":
+                self._start_workflow(experiment)
+            else:
+                self._inject(experiment)
+            self._schedule(experiment.duration, self._finish, experiment)
+            return self.experiment_to_object(experiment)
+
+    def apply_experiment(self, kind: str, body: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Create an experiment, or replace one whose spec or labels differ. An
+        unchanged experiment is left running; a changed one restarts, since
+        the simulation cannot retarget injected chaos in place
+        """
+        with self._lock:
+            self._sync()
+            metadata = body["metadata"]
+            existing = self.experiments.get(metadata["namespace"], {}).get(f"{kind}/{metadata['name']}")
+            if existing:
+                if existing.body.get("spec") == body.get("spec") and \
+                        existing.body["metadata"].get("labels") == metadata.get("labels"):
+                    return self.experiment_to_object(existing)
+                self.delete_experiment(metadata["namespace"], kind, metadata["name"])
+            return self.create_experiment(kind, body)
+
+    def list_experiments(self, namespace: str, kind: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            self._sync()
+            return [self.experiment_to_object(e) for e in self.experiments.get(namespace, {}).values()
+                    if kind is None or e.kind == kind]
+
+    def get_experiment(self, namespace: str, kind: str, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            self._sync()
+            experiment = self.experiments.get(namespace, {}).get(f"{kind}/{name}")
+            return self.experiment_to_object(experiment) if experiment else None
+
+    def delete_experiment(self, namespace: str, kind: str, name: str) -> bool:
+        with self._lock:
+            self._sync()
+            experiment = self.experiments.get(namespace, {}).pop(f"{kind}/{name}", None)
+            if not experiment:
+                return False
+            self._finish(experiment)
+            # Child chaos is owned by its workflow and goes with it
+            for child in experiment.children:
+                self.experiments[namespace].pop(child.key, None)
+            return True
+
+    def delete_experiments(self, namespace: str, kind: str, labels: Dict[str, str]) -> List[str]:
+        """Delete every experiment of kind whose labels include labels; returns their names"""
+        with self._lock:
+            self._sync()
+            experiments = self.experiments.get(namespace, {})
+            matching = [e for e in experiments.values()
+                        if e.kind == kind and all(e.body["metadata"].get("labels", {}).get(k) == v
+                                                  for k, v in labels.items())]
+            for experiment in matching:
+                self.delete_experiment(namespace, kind, experiment.name)
+            return [e.name for e in matching]
+    
+    def set_paused(self, namespace: str, kind: str, name: str, paused: bool) -> bool:
+        with self._lock:
+            self._sync()
+            experiment = self.experiments.get(namespace, {}).get(f"{kind}/{name}")
+            if not experiment or experiment.phase == "Finished":
+                return False
+            self._pause(experiment, paused)
+            return True
+
+    def experiment_to_object(self, experiment: SimExperiment) -> Dict[str, Any]:
+        """Render an experiment the way the apiserver returns chaos CRDs"""
+        metadata = dict(experiment.body.get("metadata", {}))
+        metadata["creationTimestamp"] = self.timestamp(experiment.created).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if experiment.phase == "Paused":
+            metadata["annotations"] = {**metadata.get("annotations", {}), "experiment.chaos-mesh.org/pause": "true"}
+        if experiment.kind == "Workflow":
+            status = {
+                "entryNode": experiment.body.get("spec", {}).get("entry"),
+                "startTime": metadata["creationTimestamp"],
+                "conditions": [{"type": "Accomplished",
+                                "status": str(experiment.phase == "Finished")}]
+            }
+        else:
+            status = {
+                "experiment": {"phase": experiment.phase},
+                "targets": list(experiment.targets)
+            }
+        return {
+            **experiment.body,
+            "kind": experiment.kind,
+            "metadata": metadata,
+            "status": status
+        }
+
+    # Resource API
+    def pod_to_dict(self, pod: SimPod) -> Dict[str, Any]:
+        return {
+            "name": pod.name,
+            "namespace": pod.namespace,
+            "status": pod.status,
+            "ready": 1 if pod.ready else 0,
+            "total_containers": 1,
+            "restarts": pod.restarts,
+            "node": pod.node,
+            "ip": pod.ip,
+            "labels": dict(pod.labels),
+            "created": self.timestamp(pod.created).isoformat()
+        }
+
+    def _namespaces(self, namespace: Optional[str]) -> List[str]:
+        """The given namespace, or every namespace when it is None"""
+        return sorted(self.pods) if namespace is None else [namespace]
+
+    def list_pods(self, namespace: Optional[str], label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Pods in namespace (all namespaces when None) matching the selectors"""
+        with self._lock:
+            self._sync()
+            return [self.pod_to_dict(pod)
+                    for ns in self._namespaces(namespace)
+                    for pod in sorted(self.pods.get(ns, {}).values(), key=lambda p: p.name)
+                    if match_selector(pod.labels, label_selector) and match_selector(pod.fields(), field_selector)]
+
+    def get_pod(self, name: str, namespace: str) -> Optional[SimPod]:
+        with self._lock:
+            self._sync()
+            return self.pods.get(namespace, {}).get(name)
+
+    def delete_pod(self, name: str, namespace: str) -> bool:
+        with self._lock:
+            self._sync()
+            pod = self.pods.get(namespace, {}).get(name)
+            if not pod:
+                return False
+            self._delete_pod(pod)
+            return True
+
+    def list_deployments(self, namespace: Optional[str]) -> List[Dict[str, Any]]:
+        """Deployments in namespace, or in all namespaces when None"""
+        with self._lock:
+            self._sync()
+            result = []
+            for ns in self._namespaces(namespace):
+                for name, spec in sorted(self.deployments.get(ns, {}).items()):
+                    pods = self._deployment_pods(ns, name)
+                    ready = sum(1 for p in pods if p.ready)
+                    result.append({
+                        "name": name,
+                        "namespace": ns,
+                        "replicas": spec["replicas"],
+                        "ready_replicas": ready,
+                        "available_replicas": ready,
+                        "updated_replicas": len(pods),
+                        "labels": dict(spec["labels"]),
+                        "selector": {"app": spec["labels"]["app"]}
+                    })
+            return result
+
+    def restart_deployment(self, name: str, namespace: str) -> bool:
+        """Replace every pod of a deployment; the controller recreates them"""
+        with self._lock:
+            self._sync()
+            if name not in self.deployments.get(namespace, {}):
+                return False
+            for pod in self._deployment_pods(namespace, name):
+                self._delete_pod(pod)
+            return True
+
+    def scale_deployment(self, name: str, replicas: int, namespace: str) -> bool:
+        with self._lock:
+            self._sync()
+            spec = self.deployments.get(namespace, {}).get(name)
+            if not spec:
+                return False
+            spec["replicas"] = replicas
+            self._reconcile(namespace, name)
+            return True
+
+    def list_services(self, namespace: Optional[str]) -> List[Dict[str, Any]]:
+        """Services in namespace, or in all namespaces when None"""
+        with self._lock:
+            return [dict(svc) for ns in self._namespaces(namespace)
+                    for _, svc in sorted(self.services.get(ns, {}).items())]
+
+    def pod_metrics(self, namespace: Optional[str], label_selector: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        CPU and memory usage per running pod, as metrics-server would report it.
+        Usage is deterministic per pod and minute; stress chaos pushes it up.
+        """
+        with self._lock:
+            self._sync()
+            minute = int(self._now // 60)
+            result = []
+            for ns in self._namespaces(namespace):
+                for pod in sorted(self.pods.get(ns, {}).values(), key=lambda p: p.name):
+                    if pod.phase != "Running" or not match_selector(pod.labels, label_selector):
+                        continue
+                    rng = random.Random(f"{self.seed}-{pod.name}-{minute}")
+                    cpu = rng.randint(5, 60)
+                    memory = rng.randint(48, 160)
+                    for effect in pod.effects.values():
+                        if effect.startswith("StressChaos"):
+                            cpu += rng.randint(700, 950)
+                            memory += rng.randint(300, 450)
+                    result.append({
+                        "name": pod.name,
+                        "namespace": ns,
+                        "cpu_millicores": cpu,
+                        "memory_bytes": memory * 1024 * 1024
+                    })
+            return result
+
+    def node_metrics(self) -> List[Dict[str, Any]]:
+        """Node usage as the sum of the pods scheduled on each node plus system overhead"""
+        usage = {node: [250, 512 * 1024 * 1024] for node in self.nodes}
+        pod_nodes = {(p.namespace, p.name): p.node for pods in self.pods.values() for p in pods.values()}
+        for item in self.pod_metrics(None):
+            node = pod_nodes.get((item["namespace"], item["name"]))
+            if node in usage:
+                usage[node][0] += item["cpu_millicores"]
+                usage[node][1] += item["memory_bytes"]
+        return [{"name": node, "cpu_millicores": cpu, "memory_bytes": memory}
+                for node, (cpu, memory) in usage.items()]
+
+    def pod_logs(self, name: str, namespace: str, tail_lines: int = 100,
+                 since: Optional[float] = None) -> Optional[str]:
+        """Generate a pod's log lines; deterministic for a given seed and time"""
+        with self._lock:
+            self._sync()
+            pod = self.pods.get(namespace, {}).get(name)
+            if not pod:
+                return None
+
+            first = int(pod.created // LOG_INTERVAL) + 1
+            last = int(self._now // LOG_INTERVAL)
+            if since is not None:
+                first = max(first, int(since // LOG_INTERVAL) + 1)
+            first = max(first, last - tail_lines + 1)
+            effects = sorted(pod.effects.values())
+            return "".join(self._log_line(pod, tick, effects) + "\n" for tick in range(first, last + 1))
+
+    def _log_line(self, pod: SimPod, tick: int, effects: List[str]) -> str:
+        rng = random.Random(f"{self.seed}-{pod.name}-{tick}")
+        timestamp = self.timestamp(tick * LOG_INTERVAL).strftime("%Y-%m-%dT%H:%M:%SZ")
+        app = pod.labels.get("app", pod.deployment)
+
+        for effect in effects:
+            if effect.startswith("NetworkChaos:partition"):
+                return f"{timestamp} ERROR {app} upstream connect error: connection timed out after 5000ms"
+            if effect.startswith("NetworkChaos"):
+                return f"{timestamp} WARN  {app} slow upstream response: {rng.randint(450, 1500)}ms"
+            if effect.startswith("StressChaos"):
+                return f"{timestamp} WARN  {app} request queue saturated, p99={rng.randint(800, 3000)}ms"
+            if effect.startswith("IOChaos"):
+                return f"{timestamp} WARN  {app} disk write took {rng.randint(200, 900)}ms"
+            if effect.startswith("PodChaos"):
+                return f"{timestamp} ERROR {app} container exited with code 137, restarting"
+
+        latency = rng.randint(3, 40)
+        return f"{timestamp} INFO  {app} GET /health 200 {latency}ms"
+
+
+class SimulatedLogStream:
+    """Log iterator for the simulation; follow mode emits new lines as simulated time passes"""
+
+    def __init__(self, cluster: SimulatedCluster, name: str, namespace: str, tail_lines: int,
+                 follow: bool, since_seconds: Optional[int], limit_bytes: Optional[int]):
+        self.cluster = cluster
+        self.name = name
+        self.namespace = namespace
+        self.follow = follow
+        self.limit_bytes = limit_bytes
+        self.bytes_sent = 0
+        self.closed = False
+
+        now = cluster.now()
+        since = now - since_seconds if since_seconds else None
+        self._pending = cluster.pod_logs(name, namespace, tail_lines, since) or ""
+        self._last = now
+
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    def __next__(self) -> bytes:
+        while not self.closed:
+            if self._pending:
+                chunk = self._pending.encode()
+                self._pending = ""
+                if self.limit_bytes is not None:
+                    chunk = chunk[:max(0, self.limit_bytes - self.bytes_sent)]
+                    if not chunk:
+                        break
+                self.bytes_sent += len(chunk)
+                return chunk
+            if not self.follow:
+                break
+
+            time.sleep(0.5)
+            now = self.cluster.now()
+            logs = self.cluster.pod_logs(self.name, self.namespace, tail_lines=10 ** 6, since=self._last)
+            if logs is None:
+                break
+            self._pending = logs
+            self._last = now
+
+        self.closed = True
+        raise StopIteration
+
+    def close(self):
+        self.closed = True
+
+
+class SimulatedKubernetesClient(KubernetesClient):
+    """KubernetesClient backed by a SimulatedCluster instead of an apiserver"""
+
+    def __init__(self, cluster: SimulatedCluster):
+        self.cluster = cluster
+        self.use_informers = False
+        self._informers = {}
+        self._informers_lock = threading.Lock()
+        self.connected = True
+        logger.info("Simulated Kubernetes client initialized")
+
+    def is_connected(self) -> bool:
+        return True
+
+    def get_cluster_info(self) -> Dict[str, Any]:
+        return {
+            "connected": True,
+            "version": "v1.29.0-simulated",
+            "nodes": len(self.cluster.nodes),
+            "platform": "simulation"
+        }
+
+    # The simulation is always current, so any requested resourceVersion is satisfied
+    def list_pods(self, namespace: str = "default", label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None, all_namespaces: bool = False,
+                  resource_version: Optional[str] = None,
+                  resource_version_match: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self.cluster.list_pods(None if all_namespaces else namespace, label_selector, field_selector)
+
+    def get_pod(self, name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
+        pod = self.cluster.get_pod(name, namespace)
+        if not pod:
+            return None
+
+        if pod.ready:
+            state = "running"
+        elif pod.reason:
+            state = f"waiting: {pod.reason}"
+        else:
+            state = "waiting: ContainerCreating"
+        return {
+            **self.cluster.pod_to_dict(pod),
+            "annotations": {f"chaos.kubechaos.io/{k}": v for k, v in pod.effects.items()},
+            "containers": [{
+                "name": pod.labels.get("app", pod.deployment),
+                "ready": pod.ready,
+                "restart_count": pod.restarts,
+                "state": state
+            }],
+            "conditions": [{"type": "Ready", "status": str(pod.ready)}]
+        }
+
+    def get_pod_logs(self, name: str, namespace: str = "default",
+                     container: Optional[str] = None, tail_lines: int = 100) -> str:
+        logs = self.cluster.pod_logs(name, namespace, tail_lines)
+        return logs if logs is not None else f"Error getting logs: pod {name} not found"
+
+    def stream_pod_logs(self, name: str, namespace: str = "default", container: Optional[str] = None,
+                        follow: bool = False, since_seconds: Optional[int] = None,
+                        limit_bytes: Optional[int] = None, tail_lines: Optional[int] = None):
+        return SimulatedLogStream(self.cluster, name, namespace, tail_lines or 100,
+                                  follow, since_seconds, limit_bytes)
+
+    def delete_pod(self, name: str, namespace: str = "default") -> bool:
+        return self.cluster.delete_pod(name, namespace)
+
+    def list_services(self, namespace: str = "default", label_selector: Optional[str] = None,
+                      field_selector: Optional[str] = None, all_namespaces: bool = False,
+                      resource_version: Optional[str] = None,
+                      resource_version_match: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._filter(self.cluster.list_services(None if all_namespaces else namespace),
+                            label_selector, field_selector)
+
+    def list_deployments(self, namespace: str = "default", label_selector: Optional[str] = None,
+                         field_selector: Optional[str] = None, all_namespaces: bool = False,
+                         resource_version: Optional[str] = None,
+                         resource_version_match: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._filter(self.cluster.list_deployments(None if all_namespaces else namespace),
+                            label_selector, field_selector)
+
+    @staticmethod
+    def _filter(items: List[Dict[str, Any]], label_selector: Optional[str],
+                field_selector: Optional[str]) -> List[Dict[str, Any]]:
+        """Apply selectors to services and deployments, which only support metadata field selectors"""
+        return [item for item in items
+                if match_selector(item["labels"], label_selector)
+                and match_selector({"metadata.name": item["name"], "metadata.namespace": item["namespace"]},
+                                   field_selector)]
+
+    def get_deployment(self, name: str, namespace: str = "default") -> Optional[Dict[str, Any]]:
+        for dep in self.cluster.list_deployments(namespace):
+            if dep["name"] == name:
+                return dep
+        return None
+
+    def restart_deployment(self, name: str, namespace: str = "default") -> bool:
+        return self.cluster.restart_deployment(name, namespace)
+
+    def get_pod_metrics(self, namespace: str = "default", label_selector: Optional[str] = None,
+                        all_namespaces: bool = False) -> Optional[List[Dict[str, Any]]]:
+        return self.cluster.pod_metrics(None if all_namespaces else namespace, label_selector)
+
+    def get_node_metrics(self) -> Optional[List[Dict[str, Any]]]:
+        return self.cluster.node_metrics()
+
+    def scale_deployment(self, name: str, replicas: int, namespace: str = "default") -> bool:
+        return self.cluster.scale_deployment(name, replicas, namespace)
+
+    def list_namespaces(self, label_selector: Optional[str] = None, field_selector: Optional[str] = None,
+                        resource_version: Optional[str] = None,
+                        resource_version_match: Optional[str] = None) -> List[str]:
+        # Simulated namespaces carry no labels
+        return [ns for ns in self.cluster.namespaces
+                if match_selector({}, label_selector) and match_selector({"metadata.name": ns}, field_selector)]
+
+    def create_namespace(self, name: str) -> bool:
+        if name not in self.cluster.namespaces:
+            self.cluster.namespaces.append(name)
+        return True
+
+    def list_page(self, kind: str, namespace: Optional[str] = None, limit: int = KubernetesClient.LIST_PAGE_SIZE,
+                  continue_token: Optional[str] = None, label_selector: Optional[str] = None,
+                  field_selector: Optional[str] = None, all_namespaces: bool = False,
+                  resource_version: Optional[str] = None,
+                  resource_version_match: Optional[str] = None) -> Dict[str, Any]:
+        selectors = {"label_selector": label_selector, "field_selector": field_selector}
+        listers = {
+            "pods": lambda: self.list_pods(namespace or "default", all_namespaces=all_namespaces, **selectors),
+            "services": lambda: self.list_services(namespace or "default", all_namespaces=all_namespaces, **selectors),
+            "deployments": lambda: self.list_deployments(namespace or "default", all_namespaces=all_namespaces,
+                                                         **selectors),
+            "namespaces": lambda: self.list_namespaces(**selectors)
+        }
+        if kind not in listers:
+            raise ValueError(f"Unsupported resource kind: {kind}")
+
+        items = listers[kind]()
+        offset = int(continue_token or 0)
+        page = items[offset:offset + limit]
+        remaining = len(items) - offset - len(page)
+        return {
+            "items": page,
+            "continue": str(offset + limit) if remaining > 0 else None,
+            "remaining": remaining if remaining > 0 else None,
+            "resource_version": None
+        }
+
+    def add_pod_listener(self, namespace: str, listener: Callable) -> bool:
+        self.cluster.add_listener(namespace, listener)
+        return True
+
+    def remove_pod_listener(self, namespace: str, listener: Callable):
+        self.cluster.remove_listener(namespace, listener)
+
+    def warm_informers(self, namespaces: List[str], timeout: float = 10.0):
+        pass
+
+    def stop_informers(self):
+        pass
+
+
+class SimulatedChaosMeshClient(ChaosMeshClient):
+    """ChaosMeshClient backed by a SimulatedCluster; experiment bodies are built by the parent"""
+
+    def __init__(self, cluster: SimulatedCluster):
+        super().__init__(custom_objects_api=None, parallel_listing=False)
+        self.cluster = cluster
+        self._kinds_by_plural = {plural: kind for kind, plural in self.CHAOS_TYPES.items()}
+
+    def is_chaos_mesh_installed(self) -> bool:
+        return True
+
+    def _create_chaos_experiment(self, plural: str, namespace: str, body: Dict) -> Optional[Dict]:
+        kind = self._kinds_by_plural.get(plural, body.get("kind"))
+        result = self.cluster.create_experiment(kind, body)
+        if result:
+            logger.info(f"Created simulated {plural} experiment: {body['metadata']['name']}")
+        return result
+
+    def _apply_manifest(self, manifest: Dict, dry_run: bool = False) -> Dict[str, Any]:
+        metadata = manifest["metadata"]
+        result = {"kind": manifest["kind"], "name": metadata["name"], "resource_version": None, "generation": None,
+                  "error": None}
+        try:
+            if not dry_run and self.cluster.apply_experiment(manifest["kind"], manifest) is None:
+                result["error"] = "Failed to apply"
+        except Exception as e:
+            result["error"] = str(e)
+            logger.error(f"Failed to apply simulated {manifest['kind']} {metadata['name']}: {e}")
+        return result
+
+    def list_experiments(self, namespace: str = "default", chaos_type: Optional[str] = None,
+                         parallel: Optional[bool] = None) -> ExperimentList:
+        return ExperimentList(self._experiment_to_dict(item)
+                              for item in self.cluster.list_experiments(namespace, chaos_type))
+
+    def get_experiment(self, name: str, namespace: str, chaos_type: str) -> Optional[Dict]:
+        item = self.cluster.get_experiment(namespace, chaos_type, name)
+        return self._experiment_to_dict(item) if item else None
+
+    def delete_experiment(self, name: str, namespace: str, chaos_type: str) -> bool:
+        return self.cluster.delete_experiment(namespace, chaos_type, name)
+
+    def _delete_kind(self, chaos_type: str, namespace: str, label_selector: str) -> Dict[str, Any]:
+        labels = parse_label_selector(label_selector)
+        return {"type": chaos_type, "deleted": self.cluster.delete_experiments(namespace, chaos_type, labels),
+                "error": None}
+
+    def wait_for_deletion(self, namespace: str, chaos_type: str, label_selector: str = ChaosMeshClient.GAME_LABEL_SELECTOR,
+                          timeout: float = 120.0) -> List[str]:
+        # Simulated experiments have no finalizers; deletion is immediate
+        return []
+
+    def get_workflow_status(self, name: str, namespace: str) -> Optional[Dict[str, Any]]:
+        workflow = self.cluster.get_experiment(namespace, "Workflow", name)
+        nodes = self.cluster.workflow_nodes(namespace, name)
+        if workflow is None or nodes is None:
+            return None
+        return self._workflow_status(workflow, nodes)
+
+    def pause_experiment(self, name: str, namespace: str, chaos_type: str) -> bool:
+        return self.cluster.set_paused(namespace, chaos_type, name, True)
+
+    def resume_experiment(self, name: str, namespace: str, chaos_type: str) -> bool:
+        return self.cluster.set_paused(namespace, chaos_type, name, False)
+
+    def enforce_workflow_pause(self, name: str, namespace: str) -> bool:
+        # Steps a paused simulated workflow starts are created paused and injected on resume,
+        # so the simulation keeps no steps for this check to pause
+        workflow = self.cluster.get_experiment(namespace, "Workflow", name)
+        return bool(workflow) and workflow["metadata"].get("annotations", {}).get(self.PAUSE_ANNOTATION) == "true"
+
+
+instrument_class(SimulatedKubernetesClient)
+instrument_class(SimulatedChaosMeshClient)
@@ -0,0 +1,109 @@
+"""
+Terminal History for KubeChaos
+Fixed-capacity ring buffer of terminal lines with entry and byte limits
+"""
+
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Any
+import threading
+
+TRUNCATED_MARKER = "\n... [output truncated]"
+
+
+class TerminalHistory:
+    """
+    Ring buffer of terminal entries addressed by sequence number.
+
+    Sequence numbers increase monotonically and survive clear(), so a client
+    paging with after_seq never sees numbers reused. When either limit is
+    exceeded the oldest entries are dropped.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 1024 * 1024,
+                 on_resize: Optional[Callable[[int], None]] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Called with the change in retained bytes, outside the lock
+        self.on_resize = on_resize
+        self._entries = deque()  # (seq, text, size)
+        self._bytes = 0
+        self._next_seq = 1
+        self._lock = threading.Lock()
+        self.dropped = 0
+
+    def append(self, text: str) -> int:
+        """Add an entry and return its sequence number"""
+        size = len(text.encode("utf-8", "replace"))
+        if size > self.max_bytes:
+            # Keep the start of oversized output rather than evicting everything for it
+            budget = max(0, self.max_bytes - len(TRUNCATED_MARKER))
+            text = text.encode("utf-8", "replace")[:budget].decode("utf-8", "ignore") + TRUNCATED_MARKER
+            size = len(text.encode("utf-8", "replace"))
+
+        with self._lock:
+            before = self._bytes
+            seq = self._next_seq
+            self._next_seq += 1
+            self._entries.append((seq, text, size))
+            self._bytes += size
+
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, _, dropped_size = self._entries.popleft()
+                self._bytes -= dropped_size
+                self.dropped += 1
+            delta = self._bytes - before
+        if self.on_resize and delta:
+            self.on_resize(delta)
+        return seq
+
+    def tail(self, n: int) -> List[str]:
+        """Return the text of the last n entries"""
+        if n <= 0:
+            return []
+        with self._lock:
+            start = max(0, len(self._entries) - n)
+            return [text for _, text, _ in islice(self._entries, start, None)]
+
+    def page(self, after_seq: int = 0, limit: int = 100) -> Dict[str, Any]:
+        """
+        Return up to limit entries with a sequence number greater than after_seq
+
+        Entries already evicted from the buffer are skipped; first_seq tells the
+        client where the retained history starts.
+        """
+        with self._lock:
+            first_seq = self._entries[0][0] if self._entries else self._next_seq
+            # Sequence numbers are contiguous, so the start index is arithmetic
+            start = max(0, after_seq + 1 - first_seq)
+            entries = [{"seq": seq, "text": text}
+                       for seq, text, _ in islice(self._entries, start, start + limit)]
+            last_seq = self._next_seq - 1
+
+        return {
+            "entries": entries,
+            "first_seq": first_seq,
+            "last_seq": last_seq,
+            "next_after_seq": entries[-1]["seq"] if entries else max(after_seq, first_seq - 1),
+            "has_more": bool(entries) and entries[-1]["seq"] < last_seq
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Entry/byte counts and the retained sequence range"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "firstSeq": self._entries[0][0] if self._entries else self._next_seq,
+                "lastSeq": self._next_seq - 1,
+                "dropped": self.dropped
+            }
+
+    def clear(self):
+        """Drop all entries; sequence numbers keep increasing"""
+        with self._lock:
+            delta = -self._bytes
+            self._entries.clear()
+            self._bytes = 0
+        if self.on_resize and delta:
+            self.on_resize(delta)
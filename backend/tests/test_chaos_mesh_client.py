@@ -0,0 +1,145 @@
+from chaos_mesh_client import ChaosMeshClient
+from kubernetes.client.rest import ApiException
+import threading
+
+
+class FakeCustomObjects:
+    """Answers listings from a dict of plural -> items; plurals not in it have no CRD"""
+
+    def __init__(self, installed):
+        self.installed = installed
+        self.calls = []
+
+    def list_namespaced_custom_object(self, group, version, namespace, plural, **kwargs):
+        self.calls.append((plural, kwargs))
+        if plural not in self.installed:
+            raise ApiException(status=404, reason="Not Found")
+        return {"items": self.installed[plural]}
+
+
+def experiment(kind, name):
+    return {"kind": kind, "metadata": {"name": name, "namespace": "ecommerce"}, "spec": {}, "status": {}}
+
+
+def test_missing_kinds_are_skipped_until_the_ttl_passes():
+    api = FakeCustomObjects({"podchaos": [experiment("PodChaos", "a")]})
+    chaos = ChaosMeshClient(api, parallel_listing=False, absent_kind_ttl=60)
+    assert [e["name"] for e in chaos.list_experiments("ecommerce")] == ["a"]
+    first = len(api.calls)
+
+    chaos.list_experiments("ecommerce")
+    assert [plural for plural, _ in api.calls[first:]] == ["podchaos"]
+
+    # The other CRDs get installed; they are listed again once their entries expire
+    api.installed["networkchaos"] = [experiment("NetworkChaos", "b")]
+    chaos.absent_kind_ttl = 0
+    assert [e["name"] for e in chaos.list_experiments("ecommerce")] == ["a", "b"]
+
+
+def test_reset_absent_kinds():
+    api = FakeCustomObjects({})
+    chaos = ChaosMeshClient(api, parallel_listing=False)
+    chaos.list_experiments("ecommerce")
+    assert chaos._present_kinds(ChaosMeshClient.CHAOS_TYPES) == []
+    chaos.reset_absent_kinds()
+    assert chaos._present_kinds(ChaosMeshClient.CHAOS_TYPES) == list(ChaosMeshClient.CHAOS_TYPES)
+
+
+def test_listing_requests_are_bounded_by_the_list_timeout():
+    api = FakeCustomObjects({"podchaos": []})
+    ChaosMeshClient(api, list_timeout=2.5).list_experiments("ecommerce")
+    assert api.calls and all(kwargs["_request_timeout"] == 2.5 for _, kwargs in api.calls)
+
+
+
+def test_failed_and_timed_out_kinds_are_reported_incomplete():
+    release = threading.Event()
+
+    class Flaky(FakeCustomObjects):
+        def list_namespaced_custom_object(self, group, version, namespace, plural, **kwargs):
+            if plural == "networkchaos":
+                raise ApiException(status=500, reason="Internal Server Error")
+            if plural == "stresschaos":
+                release.wait(5)
+            return super().list_namespaced_custom_object(group, version, namespace, plural, **kwargs)
+
+    api = Flaky({plural: [] for plural in ("podchaos", "networkchaos", "stresschaos")})
+    api.installed["podchaos"] = [experiment("PodChaos", "a")]
+    chaos = ChaosMeshClient(api, list_timeout=0.2)
+    try:
+        listing = chaos.list_experiments("ecommerce")
+    finally:
+        release.set()
+    assert [e["name"] for e in listing] == ["a"]
+    assert listing.incomplete == ["NetworkChaos", "StressChaos"]
+
+
+def test_busy_apply_pool_does_not_delay_listings():
+    release = threading.Event()
+    chaos = ChaosMeshClient(FakeCustomObjects({"podchaos": [experiment("PodChaos", "a")]}),
+                            max_workers=1, list_timeout=1)
+    chaos._get_executor().submit(release.wait, 5)
+    try:
+        listing = chaos.list_experiments("ecommerce")
+    finally:
+        release.set()
+    assert [e["name"] for e in listing] == ["a"] and not listing.incomplete
+
+
+class FakeWorkflowObjects:
+    """A workflow with PodChaos children, enough for pause and resume"""
+
+    def __init__(self):
+        self.workflow = {
+            "metadata": {"name": "flow", "namespace": "ecommerce", "annotations": {}},
+            "spec": {"templates": [{"name": "entry", "templateType": "Serial"},
+                                   {"name": "first", "templateType": "PodChaos"},
+                                   {"name": "second", "templateType": "PodChaos"}]}
+        }
+        self.children = {}
+        self.patches = []
+
+    def add_child(self, name):
+        self.children[name] = {"metadata": {"name": name, "annotations": {}}}
+
+    def _annotate(self, obj, body):
+        for key, value in body["metadata"]["annotations"].items():
+            if value is None:
+                obj["metadata"]["annotations"].pop(key, None)
+            else:
+                obj["metadata"]["annotations"][key] = value
+        return obj
+
+    def get_namespaced_custom_object(self, group, version, namespace, plural, name):
+        return self.workflow
+
+    def patch_namespaced_custom_object(self, group, version, namespace, plural, name, body):
+        self.patches.append(name)
+        return self._annotate(self.workflow if plural == "workflows" else self.children[name], body)
+
+    def list_namespaced_custom_object(self, group, version, namespace, plural, label_selector=None, **kwargs):
+        assert label_selector == f"{ChaosMeshClient.WORKFLOW_LABEL}=flow"
+        return {"items": list(self.children.values())}
+
+
+def paused(obj):
+    return obj["metadata"]["annotations"].get(ChaosMeshClient.PAUSE_ANNOTATION) == "true"
+
+
+def test_steps_started_after_a_workflow_pause_are_paused():
+    api = FakeWorkflowObjects()
+    chaos = ChaosMeshClient(api)
+    api.add_child("flow-first")
+    assert chaos.pause_experiment("flow", "ecommerce", "Workflow")
+    assert paused(api.workflow) and paused(api.children["flow-first"])
+
+    # The serial workflow moves on to its next step while paused
+    api.add_child("flow-second")
+    api.patches.clear()
+    assert chaos.enforce_workflow_pause("flow", "ecommerce")
+    assert api.patches == ["flow-second"]
+    assert paused(api.children["flow-second"])
+
+    assert chaos.resume_experiment("flow", "ecommerce", "Workflow")
+    assert not any(paused(obj) for obj in [api.workflow, *api.children.values()])
+    assert not chaos.enforce_workflow_pause("flow", "ecommerce")
@@ -0,0 +1,64 @@
+from game_logic import ClusterStatusCache
+import threading
+import time
+
+
+def test_non_blocking_read_returns_placeholder_while_fetching():
+    release = threading.Event()
+    fetched = threading.Event()
+
+    def fetch():
+        release.wait(5)
+        fetched.set()
+        return {"connected": True, "chaos_mesh_installed": True}
+
+    cache = ClusterStatusCache(fetch, ttl=60)
+    placeholder = cache.get(block=False)
+    assert placeholder["refreshing"] and not placeholder["connected"]
+
+    release.set()
+    assert fetched.wait(5)
+    assert cache.get()["connected"]
+
+
+def test_invalidate_does_not_block_non_blocking_reads():
+    calls = []
+    cache = ClusterStatusCache(lambda: calls.append(1) or {"connected": True}, ttl=60)
+    assert cache.get()["connected"]
+    cache.invalidate()
+    status = cache.get(block=False)
+    assert status.get("refreshing") or status["connected"]
+    assert cache.get()["connected"]
+
+
+def test_waiter_gets_the_refresh_it_waited_on_despite_invalidate():
+    release = threading.Event()
+    cache = None
+
+    class InvalidatingCondition(threading.Condition):
+        def notify_all(self):
+            super().notify_all()
+            # The lock is reentrant, so this lands before the woken waiter runs
+            cache.invalidate()
+
+    def fetch():
+        release.wait(5)
+        return {"connected": True}
+
+    cache = ClusterStatusCache(fetch, ttl=60)
+    cache._condition = InvalidatingCondition()
+    refresher = threading.Thread(target=cache.refresh)
+    refresher.start()
+    while not cache._refreshing:
+        time.sleep(0.001)
+
+    results = []
+    reader = threading.Thread(target=lambda: results.append(cache.get()))
+    reader.start()
+    deadline = time.monotonic() + 5
+    while not cache._condition._waiters and time.monotonic() < deadline:
+        time.sleep(0.001)
+    release.set()
+    refresher.join(5)
+    reader.join(5)
+    assert results and results[0]["connected"]
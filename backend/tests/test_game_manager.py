@@ -0,0 +1,48 @@
+import game_logic
+from main import game_manager
+import pytest
+
+
+class FakeClient:
+    """Stands in for both cluster clients; records close()"""
+
+    def __init__(self, *args, connected=True, **kwargs):
+        self.custom_objects = None
+        self.connected = connected
+        self.closed = False
+
+    def is_connected(self):
+        return self.connected
+
+    def is_chaos_mesh_installed(self):
+        # Not installed keeps the manager in simulation mode, so nothing is fetched from the fakes
+        return False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(game_logic, "KubernetesClient", FakeClient)
+    monkeypatch.setattr(game_logic, "ChaosMeshClient", FakeClient)
+    for attribute in ("k8s_client", "chaos_client", "connection_state", "simulation_mode"):
+        monkeypatch.setattr(game_manager, attribute, getattr(game_manager, attribute))
+    return game_manager
+
+
+def test_reconnect_closes_the_replaced_clients(manager):
+    manager._initialize_clients()
+    first = (manager.k8s_client, manager.chaos_client)
+    manager._initialize_clients()
+    assert all(client.closed for client in first)
+    assert not manager.k8s_client.closed and not manager.chaos_client.closed
+
+
+def test_unconnected_client_is_closed(manager, monkeypatch):
+    created = []
+    monkeypatch.setattr(game_logic, "KubernetesClient",
+                        lambda **kwargs: created.append(FakeClient(connected=False)) or created[-1])
+    previous = manager.k8s_client
+    manager._initialize_clients()
+    assert created[0].closed and manager.k8s_client is previous
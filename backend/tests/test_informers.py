@@ -0,0 +1,82 @@
+from k8s_client import KubernetesClient, ResourceInformer
+from types import SimpleNamespace
+import pytest
+
+KUBECONFIG = """
+apiVersion: v1
+kind: Config
+clusters:
+- name: test
+  cluster:
+    server: http://127.0.0.1:1
+contexts:
+- name: test
+  context:
+    cluster: test
+    user: test
+current-context: test
+users:
+- name: test
+  user: {}
+"""
+
+
+def fake_list(names):
+    items = [SimpleNamespace(metadata=SimpleNamespace(name=name)) for name in names]
+    return lambda namespace: SimpleNamespace(items=items, metadata=SimpleNamespace(resource_version="1"))
+
+
+def test_informer_list_is_sorted_copies():
+    informer = ResourceInformer("pods", "ns", fake_list(["web-b", "web-a", "db"]),
+                                lambda item: {"name": item.metadata.name, "labels": {"app": "x"}})
+    informer._relist()
+    items = informer.list()
+    assert [item["name"] for item in items] == ["db", "web-a", "web-b"]
+
+    items[0]["labels"]["app"] = "changed"
+    informer.get("db")["name"] = "changed"
+    assert informer.get("db") == {"name": "db", "labels": {"app": "x"}}
+
+
+@pytest.fixture
+def k8s(tmp_path, monkeypatch):
+    # Informers are created but never started, so nothing talks to the fake server
+    monkeypatch.setattr(ResourceInformer, "start", lambda self: None)
+    path = tmp_path / "kubeconfig"
+    path.write_text(KUBECONFIG)
+    return lambda **kwargs: KubernetesClient(str(path), use_informers=True, **kwargs)
+
+
+def test_only_configured_namespaces_start_informers(k8s):
+    client = k8s(informer_namespaces=["ecommerce"])
+    assert client._cached_list("pods", "ecommerce") is None
+    assert client._cached_list("pods", "other") is None
+    assert list(client._informers) == [("pods", "ecommerce")]
+
+
+def test_informer_count_is_capped_and_idle_ones_stop(k8s):
+    client = k8s(max_informers=2, informer_idle_timeout=60)
+    for namespace in ("a", "b", "c"):
+        client._cached_list("pods", namespace)
+    assert sorted(client._informers) == [("pods", "a"), ("pods", "b")]
+
+    # Once an informer has gone unread for the idle timeout its slot is freed
+    client._informers[("pods", "a")].last_read -= 120
+    client._cached_list("pods", "c")
+    assert sorted(client._informers) == [("pods", "b"), ("pods", "c")]
+
+
+def test_listeners_keep_informers_running(k8s):
+    client = k8s(max_informers=1, informer_idle_timeout=0)
+    listener = lambda *args: None
+    client.add_pod_listener("watched", listener)
+    client._cached_list("pods", "other")
+    assert ("pods", "watched") in client._informers
+
+
+def test_pod_listeners_respect_informer_limits(k8s):
+    client = k8s(informer_namespaces=["ecommerce"], max_informers=1)
+    listener = lambda *args: None
+    assert not client.add_pod_listener("client-named", listener)
+    assert client.add_pod_listener("ecommerce", listener)
+    assert list(client._informers) == [("pods", "ecommerce")]
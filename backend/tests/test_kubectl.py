@@ -0,0 +1,81 @@
+from kubectl import parse, execute, KubectlError
+from simulated_cluster import SimulatedCluster, SimulatedKubernetesClient
+from kubernetes.client.rest import ApiException
+import json
+import pytest
+
+
+@pytest.fixture
+def client():
+    return SimulatedKubernetesClient(SimulatedCluster(seed=3, realtime=False))
+
+
+def test_parse_flags_and_positionals():
+    parsed = parse("kubectl get pods -n ecommerce -l app=redis --field-selector=status.phase=Running -owide")
+    assert parsed.verb == "get"
+    assert parsed.args == ["pods"]
+    assert parsed.namespace == "ecommerce"
+    assert parsed.label_selector == "app=redis"
+    assert parsed.field_selector == "status.phase=Running"
+    assert parsed.output == "wide"
+
+
+def test_parse_defaults_and_all_namespaces():
+    parsed = parse("kubectl logs web-1 --tail 20 -A", namespace="shop")
+    assert parsed.namespace == "shop"
+    assert parsed.all_namespaces
+    assert parsed.tail == 20
+    assert parse("kubectl get pods -o=json").output == "json"
+
+
+@pytest.mark.parametrize("command, message", [
+    ("get pods", "Invalid kubectl command"),
+    ("kubectl", "Invalid kubectl command"),
+    ("kubectl get pods --watch", "unknown flag: --watch"),
+    ("kubectl get pods -n", "flag needs an argument: -n"),
+    ("kubectl get pods -o table", "unable to match a printer"),
+    ("kubectl logs web --tail ten", "invalid argument"),
+    ("kubectl get 'pods", "Invalid command"),
+    ("kubectl -n default", "Missing command"),
+])
+def test_parse_errors(command, message):
+    with pytest.raises(KubectlError, match=message):
+        parse(command)
+
+
+def test_get_pods_filters_by_label(client):
+    result = execute(client, "kubectl get pods -l app=payment-service", "ecommerce")
+    assert result["success"]
+    lines = result["output"].splitlines()
+    assert lines[0].split()[:2] == ["NAME", "READY"]
+    assert len(lines) == 4
+    assert all(line.startswith("payment-service-") for line in lines[1:])
+
+
+def test_get_pod_by_name_as_json(client):
+    name = client.list_pods("ecommerce", "app=redis")[0]["name"]
+    result = execute(client, f"kubectl get pod/{name} -o json", "ecommerce")
+    assert result["success"]
+    assert json.loads(result["output"])["name"] == name
+
+
+def test_unknown_resource_and_verb(client):
+    assert execute(client, "kubectl get widgets")["error"] == "the server doesn't have a resource type \"widgets\""
+    assert execute(client, "kubectl cordon sim-node-0")["error"] == "Command 'cordon' not yet implemented"
+
+
+def test_api_errors_show_the_status_message_only(client, monkeypatch):
+    error = ApiException(status=403, reason="Forbidden")
+    error.headers = {"Audit-Id": "1234"}
+    error.body = json.dumps({"kind": "Status", "reason": "Forbidden",
+                             "message": "pods is forbidden: User \"game\" cannot list resource \"pods\""})
+
+    def forbidden(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(client, "list_pods", forbidden)
+    message = execute(client, "kubectl get pods", "ecommerce")["error"]
+    assert message == "Error from server (Forbidden): pods is forbidden: User \"game\" cannot list resource \"pods\""
+
+    error.body = "not json"
+    assert execute(client, "kubectl get pods", "ecommerce")["error"] == "Error from server: Forbidden"
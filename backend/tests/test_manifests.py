@@ -0,0 +1,61 @@
+from simulated_cluster import SimulatedCluster, SimulatedChaosMeshClient
+import pytest
+
+VALID = """
+apiVersion: chaos-mesh.org/v1alpha1
+kind: NetworkChaos
+metadata:
+  name: slow
+  namespace: elsewhere
+  resourceVersion: "12"
+  labels:
+    team: sre
+    app: mine
+spec:
+  action: delay
+"""
+
+
+@pytest.fixture
+def chaos():
+    return SimulatedChaosMeshClient(SimulatedCluster(realtime=False))
+
+
+def test_manifest_is_moved_and_labelled(chaos):
+    manifests, errors = chaos.parse_manifests("---\n" + VALID + "---\n", "ecommerce")
+    assert errors == []
+    [manifest] = manifests
+    assert manifest["metadata"]["namespace"] == "ecommerce"
+    assert manifest["metadata"]["labels"] == {"team": "sre", "app": "kubechaos-game"}
+    assert "resourceVersion" not in manifest["metadata"]
+
+
+
+def test_empty_labels_key_counts_as_no_labels(chaos):
+    manifests, errors = chaos.parse_manifests(VALID.replace("    team: sre\n    app: mine\n", ""), "ecommerce")
+    assert errors == []
+    assert manifests[0]["metadata"]["labels"] == {"app": "kubechaos-game"}
+
+
+@pytest.mark.parametrize("yaml_content, message", [
+    (VALID.replace("kind: NetworkChaos", "kind: Pod"), "unsupported kind 'Pod'"),
+    (VALID.replace("kind: NetworkChaos", "kind: [PodChaos]"), "unsupported kind ['PodChaos']"),
+    (VALID.replace("name: slow", "name: [a]"), "metadata.name must be"),
+    (VALID.replace("name: slow", "name: Slow_One"), "metadata.name must be"),
+    (VALID.replace("team: sre", "team: 3"), "metadata.labels must map strings to strings"),
+    (VALID.replace("apiVersion: chaos-mesh.org/v1alpha1", "apiVersion: v1"), "apiVersion must be"),
+    (VALID.replace("  action: delay", "").replace("spec:", "spec: []"), "spec must be a mapping"),
+    ("- just\n- a list\n", "expected a mapping"),
+    ("kind: [", "Invalid YAML"),
+    ("---\n---\n", "No manifests found"),
+])
+def test_invalid_documents(chaos, yaml_content, message):
+    manifests, errors = chaos.parse_manifests(yaml_content, "ecommerce")
+    assert manifests == []
+    assert any(message in error for error in errors), errors
+
+
+def test_duplicate_documents(chaos):
+    manifests, errors = chaos.parse_manifests(VALID + "---\n" + VALID, "ecommerce")
+    assert len(manifests) == 1
+    assert errors == ["document 1 (NetworkChaos/slow): defined more than once"]
@@ -0,0 +1,40 @@
+from metrics import Registry
+import pytest
+import threading
+
+
+def run_threads(target, count: int = 4):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_counter_keeps_totals_of_finished_threads():
+    counter = Registry().counter("requests_total", "Requests", ("route",))
+    run_threads(lambda: [counter.inc("/status") for _ in range(100)])
+    counter.inc("/status")
+    assert counter.values() == {("/status",): 401}
+    # Only the calling thread's shard is still live
+    assert len(counter._shards._shards) == 1
+
+
+def test_histogram_keeps_totals_of_finished_threads():
+    histogram = Registry().histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+    run_threads(lambda: [histogram.observe(value) for value in (0.05, 0.5, 5.0)])
+    counts, total = histogram.values()[()]
+    assert counts == [4, 4, 4]
+    assert total == pytest.approx(4 * 5.55)
+    assert len(histogram._shards._shards) == 0
+
+    lines = list(histogram.render())
+    assert 'latency_seconds_bucket{le="+Inf"} 12' in lines
+    assert "latency_seconds_count 12" in lines
+
+
+def test_gauge_nets_out_across_threads():
+    gauge = Registry().gauge("active", "Active")
+    run_threads(lambda: gauge.inc(amount=3), count=2)
+    gauge.dec(amount=2)
+    assert gauge.values() == {(): 4}
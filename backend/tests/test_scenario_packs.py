@@ -0,0 +1,79 @@
+from game_scenarios import ScenarioRegistry, ALL_SCENARIOS
+from scenario_packs import parse_pack, ScenarioPackLoader
+import os
+
+SCENARIO = """
+id: redis-outage
+name: Redis outage
+description: The cache goes away
+difficulty: beginner
+category: pod_failures
+chaos_config:
+  type: PodChaos
+  action: pod-kill
+"""
+
+
+def test_parse_single_scenario_fills_defaults():
+    result = parse_pack(SCENARIO, "pack.yaml")
+    assert result["errors"] == []
+    [spec] = result["scenarios"]
+    assert spec["id"] == "redis-outage"
+    assert spec["time_limit_seconds"] == 300
+    assert spec["hints"] == []
+
+
+def test_parse_scenarios_list_and_multiple_documents():
+    listed = "scenarios:\n" + "".join(
+        "  - " + SCENARIO.strip().replace("\n", "\n    ").replace("redis-outage", f"s{i}") + "\n"
+        for i in range(2))
+    result = parse_pack(listed + "---\n" + SCENARIO, "pack.yaml")
+    assert result["errors"] == []
+    assert [s["id"] for s in result["scenarios"]] == ["s0", "s1", "redis-outage"]
+
+
+def test_any_error_rejects_the_file():
+    bad = SCENARIO.replace("beginner", "impossible") + "time_limit_seconds: yes\nextra: 1\n"
+    result = parse_pack(SCENARIO + "---\n" + bad, "pack.yaml")
+    assert result["scenarios"] == []
+    assert any("unknown field 'extra'" in e for e in result["errors"])
+    assert any("time_limit_seconds must be a int" in e for e in result["errors"])
+
+
+def test_invalid_yaml_duplicates_and_empty_files():
+    assert parse_pack("id: [", "bad.yaml")["errors"][0].startswith("bad.yaml: invalid YAML")
+    assert "duplicate id" in parse_pack(SCENARIO + "---\n" + SCENARIO, "dup.yaml")["errors"][0]
+    assert parse_pack("", "empty.yaml")["errors"] == ["empty.yaml: no scenarios"]
+    assert "id must be lowercase" in parse_pack(SCENARIO.replace("redis-outage", "Redis"), "x.yaml")["errors"][0]
+
+
+def test_loader_adds_overrides_and_removes(tmp_path):
+    registry = ScenarioRegistry(ALL_SCENARIOS)
+    builtin = ALL_SCENARIOS[0]
+    loader = ScenarioPackLoader(str(tmp_path), registry, cache_file=str(tmp_path / "cache.json"))
+
+    pack = tmp_path / "pack.yaml"
+    pack.write_text(SCENARIO + "---\n" + SCENARIO.replace("redis-outage", builtin.id))
+    assert loader.scan() == {"loaded": 1, "removed": 0, "failed": 0}
+    assert registry.get("redis-outage").name == "Redis outage"
+    assert registry.get(builtin.id).name == "Redis outage"
+    assert loader.scan() == {"loaded": 0, "removed": 0, "failed": 0}
+
+    os.remove(pack)
+    assert loader.scan()["removed"] == 1
+    assert registry.get("redis-outage") is None
+    assert registry.get(builtin.id) is builtin
+
+
+def test_loader_keeps_previous_scenarios_when_file_breaks(tmp_path):
+    registry = ScenarioRegistry(ALL_SCENARIOS)
+    loader = ScenarioPackLoader(str(tmp_path), registry)
+    pack = tmp_path / "pack.yaml"
+    pack.write_text(SCENARIO)
+    loader.scan()
+
+    pack.write_text(SCENARIO + "bogus: true\n")
+    os.utime(pack, ns=(0, 1))
+    assert loader.scan()["failed"] == 1
+    assert registry.get("redis-outage") is not None
+    assert "pack.yaml" in loader.status()["errors"]
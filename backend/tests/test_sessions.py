@@ -0,0 +1,101 @@
+from sessions import SessionStore, UnknownSession, DEFAULT_SESSION, SESSION_OVERHEAD_BYTES
+import pytest
+
+
+def test_get_returns_same_session():
+    store = SessionStore()
+    session = store.create()
+    assert store.get(session.token) is session
+    assert store.get() is store.get(DEFAULT_SESSION)
+
+
+def test_changed_fields_since_revision():
+    session = SessionStore().create()
+    session.touch("pods")
+    since = session.revision_token
+    session.touch("score")
+    revision, fields, full = session.changed_fields(since)
+    assert revision == session.revision_token
+    assert (fields, full) == (["score"], False)
+
+
+@pytest.mark.parametrize("since", ["", "42", "abc.1", "epoch.x", "{epoch}.99"])
+def test_changed_fields_from_another_epoch_returns_everything(since):
+    session = SessionStore().create()
+    session.touch("pods")
+    _, fields, full = session.changed_fields(since.format(epoch=session.epoch))
+    assert full
+    assert set(fields) == set(session.STATE_FIELDS)
+
+
+def test_recreated_session_does_not_match_old_etag_or_revision():
+    store = SessionStore()
+    old = store.create()
+    etag, since = old.etag(50), old.revision_token
+    store.remove(old.token)
+    new = store.get()
+    assert new.revision == old.revision
+    assert new.etag(50) != etag
+    assert new.changed_fields(since)[2]
+
+
+def test_etag_changes_with_revision_and_history_size():
+    session = SessionStore().create()
+    etag = session.etag(50)
+    assert session.etag(50) == etag
+    assert session.etag(10) != etag
+    session.touch("pods")
+    assert session.etag(50) != etag
+
+
+def test_unknown_tokens_are_rejected():
+    store = SessionStore()
+    with pytest.raises(UnknownSession):
+        store.get("made-up-token")
+    session = store.create()
+    store.remove(session.token)
+    with pytest.raises(UnknownSession):
+        store.get(session.token)
+    assert store.stats()["sessions"] == 0
+
+
+def test_idle_sessions_are_evicted(monkeypatch):
+    store = SessionStore(idle_timeout=10)
+    clock = [1000.0]
+    monkeypatch.setattr("sessions.time.monotonic", lambda: clock[0])
+    old = store.create()
+    store.get()
+    clock[0] += 20
+    fresh = store.create()
+
+    tokens = {s.token for s in store.sessions()}
+    assert old.token not in tokens
+    assert {fresh.token, DEFAULT_SESSION} <= tokens
+    assert store.stats()["evicted_idle"] == 1
+
+
+def test_memory_budget_evicts_least_recently_used():
+    store = SessionStore(memory_budget=SESSION_OVERHEAD_BYTES * 2 + 100)
+    store.get()
+    first = store.create()
+    first.history.append("x" * 200)
+    second = store.create()
+
+    tokens = {s.token for s in store.sessions()}
+    assert first.token not in tokens
+    assert {second.token, DEFAULT_SESSION} <= tokens
+    assert store.stats()["evicted_memory"] == 1
+
+
+def test_memory_total_follows_history_and_removal():
+    store = SessionStore()
+    session = store.create()
+    assert store.stats()["bytes"] == SESSION_OVERHEAD_BYTES
+    session.history.append("x" * 100)
+    assert store.stats()["bytes"] == SESSION_OVERHEAD_BYTES + 100
+    session.reset()
+    assert store.stats()["bytes"] == SESSION_OVERHEAD_BYTES
+    session.history.append("y" * 10)
+    store.remove(session.token)
+    session.history.append("z" * 10)
+    assert store.stats()["bytes"] == 0
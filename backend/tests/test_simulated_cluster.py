@@ -0,0 +1,220 @@
+from simulated_cluster import (
+    SimulatedCluster, SimulatedKubernetesClient, SimulatedChaosMeshClient,
+    CRASH_LOOP_INTERVAL, POD_RESCHEDULE_DELAY, POD_START_DELAY
+)
+import pytest
+
+
+def make_cluster(seed: int = 7) -> SimulatedCluster:
+    return SimulatedCluster(seed=seed, realtime=False)
+
+
+def pod_chaos(name: str, namespace: str, action: str, target_namespace: str = "ecommerce",
+              app: str = "payment-service", mode: str = "one", duration: str = "60s"):
+    return {
+        "apiVersion": "chaos-mesh.org/v1alpha1",
+        "kind": "PodChaos",
+        "metadata": {"name": name, "namespace": namespace, "labels": {"app": "kubechaos-game"}},
+        "spec": {
+            "action": action,
+            "mode": mode,
+            "duration": duration,
+            "selector": {"namespaces": [target_namespace], "labelSelectors": {"app": app}}
+        }
+    }
+
+
+def pod_names(cluster: SimulatedCluster, namespace: str = "ecommerce", app: str = "payment-service"):
+    return sorted(p["name"] for p in cluster.list_pods(namespace, f"app={app}"))
+
+
+def test_same_seed_gives_same_run():
+    runs = []
+    for _ in range(2):
+        cluster = make_cluster()
+        cluster.create_experiment("PodChaos", pod_chaos("kill", "ecommerce", "pod-kill"))
+        cluster.advance(30)
+        runs.append((pod_names(cluster), cluster.events_processed))
+    assert runs[0] == runs[1]
+
+
+def test_pod_kill_is_replaced_by_deployment():
+    cluster = make_cluster()
+    before = pod_names(cluster)
+    created = cluster.create_experiment("PodChaos", pod_chaos("kill", "ecommerce", "pod-kill"))
+    killed = created["status"]["targets"]
+
+    assert len(killed) == 1 and killed[0] not in pod_names(cluster)
+    cluster.advance(POD_RESCHEDULE_DELAY + POD_START_DELAY)
+    after = cluster.list_pods("ecommerce", "app=payment-service")
+    assert len(after) == len(before)
+    assert all(p["status"] == "Running" for p in after)
+
+
+def test_pod_failure_crash_loops_until_finished():
+    cluster = make_cluster()
+    created = cluster.create_experiment("PodChaos", pod_chaos("fail", "ecommerce", "pod-failure", duration="30s"))
+    target = created["status"]["targets"][0]
+
+    cluster.advance(CRASH_LOOP_INTERVAL * 2)
+    pod = cluster.get_pod(target, "ecommerce")
+    assert pod.status == "CrashLoopBackOff"
+    assert pod.restarts == 3
+
+    cluster.advance(30 + POD_START_DELAY)
+    assert pod.status == "Running" and not pod.effects
+    restarts = pod.restarts
+    cluster.advance(CRASH_LOOP_INTERVAL * 3)
+    assert pod.restarts == restarts
+
+
+def test_recovery_covers_pods_in_other_namespaces():
+    cluster = make_cluster()
+    # The experiment lives in default but targets pods in ecommerce
+    created = cluster.create_experiment("PodChaos", pod_chaos("remote", "default", "pod-failure"))
+    pod = cluster.get_pod(created["status"]["targets"][0], "ecommerce")
+    assert pod.status == "CrashLoopBackOff" and pod.effects
+
+    assert cluster.delete_experiment("default", "PodChaos", "remote")
+    cluster.advance(POD_START_DELAY)
+    assert pod.status == "Running"
+    assert not pod.effects
+
+
+def test_pause_and_resume_pod_failure():
+    cluster = make_cluster()
+    created = cluster.create_experiment("PodChaos", pod_chaos("fail", "ecommerce", "pod-failure", duration="120s"))
+    pod = cluster.get_pod(created["status"]["targets"][0], "ecommerce")
+
+    assert cluster.set_paused("ecommerce", "PodChaos", "fail", True)
+    cluster.advance(POD_START_DELAY)
+    assert pod.status == "Running"
+    restarts = pod.restarts
+    cluster.advance(CRASH_LOOP_INTERVAL * 2)
+    assert pod.restarts == restarts
+
+    assert cluster.set_paused("ecommerce", "PodChaos", "fail", False)
+    assert pod.status == "CrashLoopBackOff"
+
+
+def test_resuming_pod_kill_does_not_kill_again():
+    cluster = make_cluster()
+    cluster.create_experiment("PodChaos", pod_chaos("kill", "ecommerce", "pod-kill", duration="120s"))
+    cluster.advance(POD_RESCHEDULE_DELAY + POD_START_DELAY)
+    pods = pod_names(cluster)
+
+    assert cluster.set_paused("ecommerce", "PodChaos", "kill", True)
+    assert cluster.set_paused("ecommerce", "PodChaos", "kill", False)
+    cluster.advance(POD_RESCHEDULE_DELAY + POD_START_DELAY)
+    assert pod_names(cluster) == pods
+
+
+def test_serial_workflow_runs_steps_in_order():
+    cluster = make_cluster()
+    workflow = {
+        "apiVersion": "chaos-mesh.org/v1alpha1",
+        "kind": "Workflow",
+        "metadata": {"name": "flow", "namespace": "ecommerce", "labels": {"app": "kubechaos-game"}},
+        "spec": {
+            "entry": "entry",
+            "templates": [
+                {"name": "entry", "templateType": "Serial", "deadline": "100s", "children": ["first", "second"]},
+                {"name": "first", "templateType": "PodChaos", "deadline": "20s",
+                 "podChaos": {"action": "pod-failure", "mode": "one",
+                              "selector": {"namespaces": ["ecommerce"], "labelSelectors": {"app": "redis"}}}},
+                {"name": "second", "templateType": "PodChaos", "deadline": "20s",
+                 "podChaos": {"action": "pod-failure", "mode": "one",
+                              "selector": {"namespaces": ["ecommerce"], "labelSelectors": {"app": "postgres"}}}},
+            ]
+        }
+    }
+    cluster.create_experiment("Workflow", workflow)
+    phases = lambda: {n["name"]: n["phase"] for n in cluster.workflow_nodes("ecommerce", "flow")}
+
+    assert phases() == {"first": "Running", "second": "Pending"}
+    cluster.advance(25)
+    assert phases() == {"first": "Finished", "second": "Running"}
+    cluster.advance(20)
+    assert phases() == {"first": "Finished", "second": "Finished"}
+    assert cluster.get_experiment("ecommerce", "Workflow", "flow")["status"]["conditions"][0]["status"] == "True"
+
+
+def test_apply_leaves_unchanged_experiment_running():
+    cluster = make_cluster()
+    body = pod_chaos("fail", "ecommerce", "pod-failure", duration="120s")
+    first = cluster.apply_experiment("PodChaos", body)
+    cluster.advance(5)
+    assert cluster.apply_experiment("PodChaos", pod_chaos("fail", "ecommerce", "pod-failure", duration="120s")) == \
+        cluster.get_experiment("ecommerce", "PodChaos", "fail")
+    assert cluster.get_experiment("ecommerce", "PodChaos", "fail")["metadata"]["creationTimestamp"] == \
+        first["metadata"]["creationTimestamp"]
+
+    changed = cluster.apply_experiment("PodChaos", pod_chaos("fail", "ecommerce", "pod-failure", app="redis"))
+    assert changed["metadata"]["creationTimestamp"] != first["metadata"]["creationTimestamp"]
+
+
+@pytest.fixture
+def clients():
+    cluster = make_cluster()
+    return SimulatedKubernetesClient(cluster), SimulatedChaosMeshClient(cluster)
+
+
+def test_apply_manifests_through_simulated_client(clients):
+    _, chaos = clients
+    manifest = """
+apiVersion: chaos-mesh.org/v1alpha1
+kind: PodChaos
+metadata:
+  name: fail
+spec:
+  action: pod-failure
+  mode: one
+  duration: 60s
+  selector:
+    labelSelectors:
+      app: redis
+"""
+    result = chaos.apply_manifests(manifest, "ecommerce")
+    assert result["success"] and result["succeeded"] == 1
+    assert [e["name"] for e in chaos.list_experiments("ecommerce")] == ["fail"]
+
+    dry = chaos.apply_manifests(manifest.replace("name: fail", "name: other"), "ecommerce", dry_run=True)
+    assert dry["success"]
+    assert [e["name"] for e in chaos.list_experiments("ecommerce")] == ["fail"]
+
+
+def test_step_started_while_workflow_paused_is_injected_on_resume():
+    cluster = make_cluster()
+    step = lambda name, app, deadline: {
+        "name": name, "templateType": "PodChaos", "deadline": deadline,
+        "podChaos": {"action": "pod-failure", "mode": "one",
+                     "selector": {"namespaces": ["ecommerce"], "labelSelectors": {"app": app}}}
+    }
+    cluster.create_experiment("Workflow", {
+        "apiVersion": "chaos-mesh.org/v1alpha1",
+        "kind": "Workflow",
+        "metadata": {"name": "wf", "namespace": "ecommerce", "labels": {"app": "kubechaos-game"}},
+        "spec": {
+            "entry": "entry",
+            "templates": [
+                {"name": "entry", "templateType": "Serial", "deadline": "100s", "children": ["a", "b"]},
+                step("a", "redis", "10s"),
+                step("b", "postgres", "60s"),
+            ]
+        }
+    })
+
+    cluster.advance(1)
+    assert cluster.set_paused("ecommerce", "Workflow", "wf", True)
+    # Step b starts at t=10 while the workflow is paused
+    cluster.advance(15)
+    assert cluster.get_experiment("ecommerce", "PodChaos", "wf-b")["status"]["experiment"]["phase"] == "Paused"
+
+    assert cluster.set_paused("ecommerce", "Workflow", "wf", False)
+    cluster.advance(5)
+    child = cluster.experiments["ecommerce"]["PodChaos/wf-b"]
+    [postgres] = [cluster.get_pod(name, "ecommerce") for name in pod_names(cluster, app="postgres")]
+    assert child.phase == "Running"
+    assert child.target_pods == [postgres]
+    assert child.effect_key in postgres.effects
+    assert postgres.status == "CrashLoopBackOff"
@@ -0,0 +1,67 @@
+from fastapi.testclient import TestClient
+from main import app, game_manager
+import main
+from starlette.websockets import WebSocketDisconnect
+import pytest
+
+
+@pytest.fixture
+def client():
+    # Without a context manager the startup hook, and with it cluster discovery, does not run
+    return TestClient(app)
+
+
+def test_status_revalidates_and_returns_deltas(client):
+    token = client.post("/sessions").json()["token"]
+    headers = {"X-Session-Token": token}
+    first = client.get("/status", headers=headers)
+    etag, revision = first.headers["ETag"], first.headers["X-State-Revision"]
+    assert client.get("/status", headers={**headers, "If-None-Match": etag}).status_code == 304
+
+    client.post("/start", headers=headers)
+    delta = client.get("/status", params={"since": revision}, headers=headers).json()
+    assert not delta["full"]
+    assert set(delta["changes"]) == {"isGameRunning", "gameStartTime"}
+
+
+def test_revision_from_another_session_gets_full_body(client):
+    old = client.post("/sessions").json()["token"]
+    revision = client.get("/status", headers={"X-Session-Token": old}).headers["X-State-Revision"]
+    new = client.post("/sessions").json()["token"]
+    delta = client.get("/status", params={"since": revision}, headers={"X-Session-Token": new}).json()
+    assert delta["full"]
+    assert "pods" in delta["changes"]
+
+
+def test_unknown_session_token_is_rejected(client):
+    response = client.get("/status", headers={"X-Session-Token": "not-issued"})
+    assert response.status_code == 404
+    token = client.post("/sessions").json()["token"]
+    assert client.request("DELETE", "/sessions", headers={"X-Session-Token": token}).json()["success"]
+    assert client.get("/status", headers={"X-Session-Token": token}).status_code == 404
+
+
+def test_event_stream_refuses_namespaces_outside_the_game(client):
+    with pytest.raises(WebSocketDisconnect) as closed:
+        with client.websocket_connect("/ws?namespace=client-named"):
+            pass
+    assert closed.value.code == 1008
+
+
+def test_active_experiment_gauge_only_covers_game_namespaces():
+    game_manager.list_chaos_experiments("client-named")
+    game_manager.list_chaos_experiments("ecommerce")
+    assert "client-named" not in game_manager._active_experiments
+    assert "ecommerce" in game_manager._active_experiments
+
+
+def test_apply_refuses_oversized_bodies(client, monkeypatch):
+    monkeypatch.setattr(main, "MAX_APPLY_BYTES", 64)
+    assert client.post("/chaos/apply", content=b"#" * 65).status_code == 413
+
+    def chunks():
+        yield b"#" * 40
+        yield b"#" * 40
+
+    # No Content-Length: the capped read catches it
+    assert client.post("/chaos/apply", content=chunks()).status_code == 413
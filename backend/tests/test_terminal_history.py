@@ -0,0 +1,60 @@
+from terminal_history import TerminalHistory, TRUNCATED_MARKER
+
+
+def test_entry_limit_drops_oldest():
+    history = TerminalHistory(max_entries=3)
+    for i in range(5):
+        history.append(f"line {i}")
+    assert history.tail(10) == ["line 2", "line 3", "line 4"]
+    assert history.summary()["dropped"] == 2
+    assert history.summary()["firstSeq"] == 3
+
+
+def test_byte_limit_drops_oldest():
+    history = TerminalHistory(max_entries=100, max_bytes=10)
+    history.append("aaaa")
+    history.append("bbbb")
+    history.append("cccc")
+    assert history.tail(3) == ["bbbb", "cccc"]
+    assert history.summary()["bytes"] == 8
+
+
+def test_oversized_entry_is_truncated():
+    history = TerminalHistory(max_entries=10, max_bytes=64)
+    history.append("x" * 1000)
+    [text] = history.tail(1)
+    assert text.endswith(TRUNCATED_MARKER)
+    assert len(text.encode()) <= 64
+
+
+def test_page_after_seq():
+    history = TerminalHistory(max_entries=100)
+    for i in range(1, 6):
+        assert history.append(f"line {i}") == i
+
+    page = history.page(after_seq=1, limit=2)
+    assert [e["seq"] for e in page["entries"]] == [2, 3]
+    assert page["next_after_seq"] == 3 and page["has_more"]
+
+    page = history.page(after_seq=page["next_after_seq"], limit=10)
+    assert [e["text"] for e in page["entries"]] == ["line 4", "line 5"]
+    assert not page["has_more"]
+
+
+def test_page_skips_evicted_entries():
+    history = TerminalHistory(max_entries=2)
+    for i in range(5):
+        history.append(str(i))
+    page = history.page(after_seq=0)
+    assert page["first_seq"] == 4
+    assert [e["seq"] for e in page["entries"]] == [4, 5]
+
+
+def test_sequence_survives_clear():
+    history = TerminalHistory()
+    history.append("a")
+    history.append("b")
+    history.clear()
+    assert history.tail(5) == []
+    assert history.append("c") == 3
+    assert history.page()["first_seq"] == 3
@@ -0,0 +1,22 @@
+from tracing import Tracer
+
+
+def test_requested_traces_need_allow_requested():
+    tracer = Tracer()
+    tracer.configure()
+    assert not tracer.should_trace(True)
+    tracer.configure(allow_requested=True)
+    assert tracer.should_trace(True) and not tracer.should_trace(False)
+
+
+def test_trace_file_is_rotated_at_max_bytes(tmp_path):
+    path = tmp_path / "traces.folded"
+    tracer = Tracer()
+    tracer.configure(path=str(path), max_bytes=60, backups=2)
+    for index in range(20):
+        handle = tracer.start(f"GET /route-{index}")
+        tracer.export(tracer.finish(handle))
+
+    assert tracer.traces_written == 20
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["traces.folded", "traces.folded.1", "traces.folded.2"]
+    assert all(p.stat().st_size <= 60 for p in tmp_path.iterdir())
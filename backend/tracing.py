@@ -0,0 +1,313 @@
+"""
+Tracing for KubeChaos
+Opt-in spans around GameManager and cluster client calls, exported as
+collapsed stacks (flamegraph.pl, speedscope) or OpenTelemetry JSON
+"""
+
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence, Any
+import functools
+import inspect
+import json
+import logging
+import os
+import random
+import secrets
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("collapsed", "otel")
+
+# (trace, current span id) for the code running in this context; None when not tracing
+_current: ContextVar = ContextVar("kubechaos_trace", default=None)
+
+
+class Trace:
+    """Spans recorded for one request"""
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        self.trace_id = secrets.token_hex(16)
+        self.name = name
+        self.attributes = attributes or {}
+        self.spans: List[Dict[str, Any]] = []
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def new_span_id(self) -> int:
+        with self._lock:
+            self._next_id += 1
+            return self._next_id
+
+    def record(self, span: Dict[str, Any]):
+        with self._lock:
+            self.spans.append(span)
+
+
+class _Span:
+    """Context manager timing one span and making it the parent of spans opened inside it"""
+
+    __slots__ = ("trace", "parent_id", "name", "attributes", "span_id", "start_ns", "token")
+
+    def __init__(self, trace: Trace, parent_id: Optional[int], name: str, attributes: Dict[str, Any]):
+        self.trace = trace
+        self.parent_id = parent_id
+        self.name = name
+        self.attributes = attributes
+
+    def __enter__(self):
+        self.span_id = self.trace.new_span_id()
+        self.start_ns = time.time_ns()
+        self.token = _current.set((self.trace, self.span_id))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end_ns = time.time_ns()
+        _current.reset(self.token)
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.trace.record({
+            "id": self.span_id,
+            "parent": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": end_ns,
+            "thread": threading.current_thread().name,
+            "attributes": self.attributes
+        })
+
+
+class _NoopSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Tracer:
+    """
+    Decides which requests are traced and writes finished traces to a local file.
+
+    Tracing is off unless enabled globally (for a sampled share of requests)
+    or, when allow_requested is set, asked for by a single request. While no
+    trace is active, instrumented methods cost one context variable lookup.
+    The output file is rotated once it would grow past max_bytes.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.sample_rate = 1.0
+        self.allow_requested = False
+        self.format = "collapsed"
+        self.path = "kubechaos-traces.folded"
+        self.max_bytes = 50 * 1024 * 1024
+        self.backups = 3
+        self._write_lock = threading.Lock()
+        self.traces_written = 0
+
+    def configure(self, enabled: bool = False, sample_rate: float = 1.0, output_format: str = "collapsed",
+                  path: Optional[str] = None, allow_requested: bool = False,
+                  max_bytes: int = 50 * 1024 * 1024, backups: int = 3):
+        if output_format not in FORMATS:
+            logger.error(f"Unknown trace format {output_format!r}, using collapsed")
+            output_format = "collapsed"
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.allow_requested = allow_requested
+        self.format = output_format
+        self.path = path or ("kubechaos-traces.folded" if output_format == "collapsed" else "kubechaos-traces.jsonl")
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def should_trace(self, requested: bool) -> bool:
+        # A client asking for a trace makes the server write to disk, so that is opt-in
+        return (requested and self.allow_requested) or (self.enabled and random.random() < self.sample_rate)
+
+    def start(self, name: str, **attributes) -> tuple:
+        """Begin a trace with a root span in the current context; returns a handle for finish()"""
+        trace = Trace(name, attributes)
+        root = _Span(trace, None, name, dict(attributes))
+        root.__enter__()
+        return trace, root
+
+    def finish(self, handle: tuple) -> Trace:
+        """Close the root span; must run in the context that called start()"""
+        trace, root = handle
+        root.__exit__(None, None, None)
+        return trace
+
+    def export(self, trace: Trace):
+        """Append a finished trace to the output file"""
+        try:
+            if self.format == "otel":
+                text = json.dumps(to_otel(trace)) + "\n"
+            else:
+                text = "".join(f"{stack} {value}\n" for stack, value in to_collapsed(trace).items())
+            with self._write_lock:
+                self._rotate(len(text.encode()))
+                with open(self.path, "a") as f:
+                    f.write(text)
+                self.traces_written += 1
+        except OSError as e:
+            logger.error(f"Failed to write trace {trace.trace_id}: {e}")
+
+    def _rotate(self, incoming: int):
+        """Move path to path.1 (and path.1 to path.2, ...) before it grows past max_bytes; caller holds the write lock"""
+        if self.max_bytes <= 0:
+            return
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size == 0 or size + incoming <= self.max_bytes:
+            return
+        if self.backups <= 0:
+            os.remove(self.path)
+            return
+        for index in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{index}"):
+                os.replace(f"{self.path}.{index}", f"{self.path}.{index + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+
+tracer = Tracer()
+
+
+def span(name: str, **attributes):
+    """Open a span under the current one; a no-op when the current request is not traced"""
+    active = _current.get()
+    if active is None:
+        return _NOOP
+    return _Span(active[0], active[1], name, attributes)
+
+
+def traced(func: Callable, name: str) -> Callable:
+    """Wrap func so each call is recorded as a span named name while tracing"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        active = _current.get()
+        if active is None:
+            return func(*args, **kwargs)
+        with _Span(active[0], active[1], name, {}):
+            return func(*args, **kwargs)
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def propagate(func: Callable) -> Callable:
+    """
+    Carry the caller's trace into func when it runs on a thread pool.
+
+    Executors do not copy context variables, so spans opened by pool threads
+    would otherwise be lost. The wrapper may run on several threads at once.
+    """
+    active = _current.get()
+    if active is None:
+        return func
+
+    def run(*args, **kwargs):
+        token = _current.set(active)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current.reset(token)
+    return run
+
+
+def instrument_class(cls, exclude: Sequence[str] = ()):
+    """
+    Record a span for every method defined on cls, named Class.method
+
+    Dunder methods, generators (they would only time their creation) and the
+    names in exclude, e.g. per-item converters, are left alone.
+    """
+    for attr_name, attr in list(vars(cls).items()):
+        if attr_name.startswith("__") or attr_name in exclude:
+            continue
+        name = f"{cls.__name__}.{attr_name}"
+
+        if isinstance(attr, (staticmethod, classmethod)):
+            func = attr.__func__
+            if not inspect.isgeneratorfunction(func) and not getattr(func, "__traced__", False):
+                setattr(cls, attr_name, type(attr)(traced(func, name)))
+        elif inspect.isfunction(attr):
+            if not inspect.isgeneratorfunction(attr) and not getattr(attr, "__traced__", False):
+                setattr(cls, attr_name, traced(attr, name))
+    return cls
+
+
+# Exporters
+def _span_paths(trace: Trace) -> Dict[int, str]:
+    by_id = {s["id"]: s for s in trace.spans}
+    paths: Dict[int, str] = {}
+
+    def path(span_id: int) -> str:
+        if span_id not in paths:
+            s = by_id[span_id]
+            frame = s["name"].replace(";", ":").replace(" ", "_")
+            parent = s["parent"]
+            paths[span_id] = f"{path(parent)};{frame}" if parent in by_id else frame
+        return paths[span_id]
+
+    for span_id in by_id:
+        path(span_id)
+    return paths
+
+
+def to_collapsed(trace: Trace) -> Dict[str, int]:
+    """Self time in microseconds per stack, in the folded format flamegraph tools read"""
+    paths = _span_paths(trace)
+    child_time: Dict[int, int] = {}
+    for s in trace.spans:
+        if s["parent"] is not None:
+            child_time[s["parent"]] = child_time.get(s["parent"], 0) + s["end_ns"] - s["start_ns"]
+
+    stacks: Dict[str, int] = {}
+    for s in trace.spans:
+        # Children running in parallel threads can add up to more than the parent
+        self_ns = max(0, s["end_ns"] - s["start_ns"] - child_time.get(s["id"], 0))
+        stack = paths[s["id"]]
+        stacks[stack] = stacks.get(stack, 0) + self_ns // 1000
+    return stacks
+
+
+def _otel_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otel(trace: Trace) -> Dict[str, Any]:
+    """The trace as OTLP/JSON, as written by the OpenTelemetry Collector's file exporter"""
+    span_ids = {s["id"]: secrets.token_hex(8) for s in trace.spans}
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": [
+                {"key": "service.name", "value": {"stringValue": "kubechaos-backend"}},
+                {"key": "process.pid", "value": {"intValue": str(os.getpid())}}
+            ]},
+            "scopeSpans": [{
+                "scope": {"name": "kubechaos.tracing"},
+                "spans": [{
+                    "traceId": trace.trace_id,
+                    "spanId": span_ids[s["id"]],
+                    "parentSpanId": span_ids.get(s["parent"], ""),
+                    "name": s["name"],
+                    "kind": 2 if s["parent"] is None else 1,
+                    "startTimeUnixNano": str(s["start_ns"]),
+                    "endTimeUnixNano": str(s["end_ns"]),
+                    "attributes": [{"key": k, "value": _otel_value(v)}
+                                   for k, v in {**s["attributes"], "thread.name": s["thread"]}.items()]
+                } for s in trace.spans]
+            }]
+        }]
+    }